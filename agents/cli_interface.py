@@ -67,6 +67,14 @@ Type 'help' for more commands or 'exit' to quit.
         """
         self.console.print(Panel(Markdown(help_text), title="Help", border_style="green"))
     
+    def log_latency(self):
+        """Log how the session's answers were routed (fast path or LLM) and how long they took"""
+        if not (self.agent and self.agent.router):
+            return
+        for route, entry in self.agent.router.latency_summary().items():
+            logger.info(f"Route {route}: {entry['count']} answers, avg {entry['avg_ms']} ms, "
+                        f"max {entry['max_ms']} ms")
+    
     def run(self):
         """Run the CLI interface"""
         if not self.initialize():
@@ -83,6 +91,7 @@ Type 'help' for more commands or 'exit' to quit.
                 
                 if user_input.lower() in ['exit', 'quit', 'bye']:
                     self.console.print("[yellow]Thank you for using JobLo Assistant! Goodbye! 👋[/yellow]")
+                    self.log_latency()
                     break
                 
                 if user_input.lower() == 'help':
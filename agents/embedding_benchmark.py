@@ -0,0 +1,90 @@
+import json
+import re
+import time
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+import numpy as np
+from utils.base_database import BaseDatabaseManager
+from config.settings import BASE_DIR
+from .embeddings import create_embeddings
+from .vector_index import VECTOR_FIELDS, job_document
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERIES_PATH = BASE_DIR / "config" / "embedding_queries.json"
+
+
+def _is_relevant(job: Dict[str, Any], terms: List[str]) -> bool:
+    """A job counts as relevant to a query when its title or skills mention one of its terms"""
+    text = " ".join([job.get("title") or ""] + list(job.get("skills") or [])).lower()
+    return any(re.search(rf"\b{re.escape(term.lower())}\b", text) for term in terms)
+
+
+def _normalized(vectors: List[List[float]]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def benchmark_embeddings(db: BaseDatabaseManager, backends: List[str], queries_path: Path = DEFAULT_QUERIES_PATH,
+                         limit: Optional[int] = 1000, k: int = 10,
+                         reference: Optional[str] = None) -> Dict[str, Any]:
+    """Indexing time and retrieval quality of embedding backends on a fixed query set.
+
+    Every backend embeds the same jobs (the first limit in the database) and
+    the queries in queries_path, without its cache, and ranks jobs by cosine
+    similarity in memory so only the embeddings are compared. Quality is
+    precision@k against the query set's relevance terms, and the overlap of
+    each backend's top k with the reference backend's (the remote one by
+    default).
+    """
+    with open(queries_path, encoding="utf-8") as f:
+        queries = json.load(f)
+    jobs = list(islice(db.iter_jobs(projection=VECTOR_FIELDS), limit))
+    if not jobs:
+        raise ValueError("No jobs in the database to benchmark on")
+    texts = [job_document(job).page_content for job in jobs]
+    relevant = [[_is_relevant(job, query["relevant"]) for job in jobs] for query in queries]
+    k = min(k, len(jobs))
+    reference = reference or ("openai" if "openai" in backends else backends[0])
+
+    results, rankings = {}, {}
+    for backend in backends:
+        try:
+            embeddings = create_embeddings(backend, cache=False)
+            started = time.perf_counter()
+            documents = _normalized(embeddings.embed_documents(texts))
+            index_s = time.perf_counter() - started
+            started = time.perf_counter()
+            query_vectors = _normalized([embeddings.embed_query(query["query"]) for query in queries])
+            query_s = time.perf_counter() - started
+        except Exception as e:
+            logger.error(f"Embedding backend {backend} failed: {e}")
+            results[backend] = {"error": str(e)}
+            continue
+
+        top = np.argsort(-(query_vectors @ documents.T), axis=1)[:, :k]
+        rankings[backend] = top
+        precision = [sum(relevant[q][i] for i in top[q]) / k for q in range(len(queries))]
+        results[backend] = {
+            "dimensions": int(documents.shape[1]),
+            "index_s": round(index_s, 3),
+            "docs_per_s": round(len(texts) / index_s, 1) if index_s else 0.0,
+            "query_ms": round(query_s / len(queries) * 1000, 2),
+            "precision_at_k": round(float(np.mean(precision)), 3),
+        }
+
+    if reference in rankings:
+        for backend, top in rankings.items():
+            overlap = [len(set(top[q]) & set(rankings[reference][q])) / k for q in range(len(queries))]
+            results[backend]["overlap_with_reference"] = round(float(np.mean(overlap)), 3)
+
+    return {
+        "jobs": len(jobs),
+        "queries": len(queries),
+        "k": k,
+        "reference": reference if reference in rankings else None,
+        "by_backend": results,
+    }
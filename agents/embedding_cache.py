@@ -0,0 +1,142 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from langchain_core.embeddings import Embeddings
+from config.settings import EMBEDDING_CACHE_PATH, EMBEDDING_BATCH_SIZE
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# Keys per SELECT ... IN (...), under SQLite's bound-parameter limit
+LOOKUP_CHUNK = 500
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings backend wrapper that never embeds the same text twice.
+
+    Vectors are stored in a local SQLite file keyed by the sha256 of the
+    model namespace, the kind ("document" or "query") and the text, so
+    identical descriptions and repeated queries are served from disk, also
+    across restarts. Misses are sent to the backend in batches of batch_size.
+    Vectors are kept as float32.
+    """
+
+    def __init__(self, backend: Embeddings, path: Path = EMBEDDING_CACHE_PATH,
+                 namespace: Optional[str] = None, batch_size: int = EMBEDDING_BATCH_SIZE):
+        self.backend = backend
+        self.path = Path(path)
+        # Vectors of different models must never be mixed up
+        self.namespace = namespace or getattr(backend, "model", None) or type(backend).__name__
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._stats = {"hits": 0, "misses": 0, "backend_calls": 0, "backend_s": 0.0}
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[i:i + LOOKUP_CHUNK]
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+                )
+                found.update((key, _unpack(blob)) for key, blob in rows)
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created_at) VALUES (?, ?, ?)",
+                [(key, _pack(vector), now) for key, vector in vectors.items()]
+            )
+
+    def _record(self, hits: int, misses: int, calls: int = 0, seconds: float = 0.0):
+        with self._lock:
+            self._stats["hits"] += hits
+            self._stats["misses"] += misses
+            self._stats["backend_calls"] += calls
+            self._stats["backend_s"] += seconds
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._key("document", text) for text in texts]
+        cached = self._lookup(list(dict.fromkeys(keys)))
+
+        # Each distinct missing text is embedded once, however often it repeats
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        missing_keys = list(missing)
+        calls = 0
+        started = time.perf_counter()
+        for i in range(0, len(missing_keys), self.batch_size):
+            batch = missing_keys[i:i + self.batch_size]
+            vectors = self.backend.embed_documents([missing[key] for key in batch])
+            calls += 1
+            fresh = dict(zip(batch, vectors))
+            self._store(fresh)
+            cached.update(fresh)
+        self._record(len(texts) - len(missing_keys), len(missing_keys), calls,
+                     time.perf_counter() - started if calls else 0.0)
+        return [cached[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key("query", text)
+        cached = self._lookup([key])
+        if key in cached:
+            self._record(1, 0)
+            return cached[key]
+        started = time.perf_counter()
+        vector = self.backend.embed_query(text)
+        self._record(0, 1, 1, time.perf_counter() - started)
+        self._store({key: vector})
+        return vector
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, backend calls and the backend time the hits saved (at the average cost per text)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stored = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        lookups = stats["hits"] + stats["misses"]
+        per_text = stats["backend_s"] / stats["misses"] if stats["misses"] else 0.0
+        return {
+            **stats,
+            "backend_s": round(stats["backend_s"], 3),
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+            "saved_s": round(stats["hits"] * per_text, 3),
+            "stored": stored,
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
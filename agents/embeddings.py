@@ -0,0 +1,78 @@
+import importlib.util
+from typing import List
+from langchain_core.embeddings import Embeddings
+from config.settings import (
+    OPENAI_API_KEY, EMBEDDING_BACKEND, EMBEDDING_LOCAL_MODEL, EMBEDDING_HASHING_FEATURES,
+    EMBEDDING_CACHE_ENABLED, CHROMA_COLLECTION,
+)
+from .embedding_cache import CachedEmbeddings
+import logging
+
+# Optional imports with graceful fallback
+try:
+    from sklearn.feature_extraction.text import HashingVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Only checked here: importing sentence-transformers loads torch, so it waits for the local model backend
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKENDS = ("openai", "hashing", "local-model")
+
+
+class HashingEmbeddings(Embeddings):
+    """Offline embeddings from hashed word unigrams and bigrams.
+
+    Stateless: nothing is fitted on the corpus, so a job's vector never
+    changes when other jobs are added, which keeps incremental vector store
+    syncs valid. Fast and free, but purely lexical.
+    """
+
+    def __init__(self, n_features: int = EMBEDDING_HASHING_FEATURES):
+        if not SKLEARN_AVAILABLE:
+            raise RuntimeError("scikit-learn is required for hashing embeddings. Install it with: pip install scikit-learn")
+        self.model = f"hashing-{n_features}"
+        self.vectorizer = HashingVectorizer(n_features=n_features, ngram_range=(1, 2), stop_words="english",
+                                            alternate_sign=False, norm="l2")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.vectorizer.transform(texts).toarray().astype("float32").tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def _local_model_embeddings(model: str = EMBEDDING_LOCAL_MODEL) -> Embeddings:
+    """Sentence-transformers model on CPU, from a local directory or the model hub cache"""
+    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+        raise RuntimeError("sentence-transformers is required for the local model backend. "
+                           "Install it with: pip install sentence-transformers")
+    import sentence_transformers  # noqa: F401
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name=model, model_kwargs={"device": "cpu"},
+                                 encode_kwargs={"normalize_embeddings": True})
+
+
+def create_embeddings(backend: str = EMBEDDING_BACKEND, cache: bool = EMBEDDING_CACHE_ENABLED) -> Embeddings:
+    """Embeddings for the configured backend, behind the local cache where it pays off"""
+    if backend == "openai":
+        from langchain_openai import OpenAIEmbeddings
+        embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY)
+        namespace = embeddings.model
+    elif backend == "hashing":
+        # Cheaper to recompute than to look up
+        return HashingEmbeddings()
+    elif backend == "local-model":
+        embeddings = _local_model_embeddings()
+        namespace = f"local:{EMBEDDING_LOCAL_MODEL}"
+    else:
+        raise ValueError(f"Unknown embedding backend: {backend}")
+    return CachedEmbeddings(embeddings, namespace=namespace) if cache else embeddings
+
+
+def collection_for(backend: str = EMBEDDING_BACKEND) -> str:
+    """Vector store collection of a backend; vectors of different backends have different sizes"""
+    return CHROMA_COLLECTION if backend == "openai" else f"{CHROMA_COLLECTION}_{backend.replace('-', '_')}"
@@ -0,0 +1,231 @@
+import re
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+from utils.job_fields import SKILL_KEYWORDS, extract_city_ids, is_remote_location
+import logging
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("naukri", "linkedin")
+
+# Words that carry no filter in a structured request
+FILLER_WORDS = {
+    "a", "all", "any", "are", "available", "can", "database", "do", "for", "from", "get", "have", "i",
+    "is", "jobs", "job", "list", "me", "of", "on", "open", "openings", "please", "positions", "posted",
+    "roles", "show", "some", "the", "there", "total", "vacancies", "we", "what", "you", "find", "search",
+    "latest", "new", "recent", "currently", "now", "listed", "stored", "in", "that",
+}
+# Words that may link a count's filters ("how many jobs require python")
+COUNT_LINK_WORDS = {"with", "requiring", "require", "requires", "need", "needing", "mention", "mentioning",
+                    "asking", "ask"}
+# Words a role may be made of besides known skills ("senior data engineer", "python developer");
+# any other word means the message is not a plain search
+ROLE_WORDS = {
+    "developer", "engineer", "programmer", "scientist", "analyst", "manager", "designer", "architect",
+    "tester", "intern", "internship", "trainee", "consultant", "administrator", "admin", "specialist",
+    "lead", "head", "director", "executive", "associate", "officer", "recruiter", "accountant", "writer",
+    "senior", "junior", "sr", "jr", "principal", "staff", "mid", "level", "entry", "graduate", "fresher",
+    "software", "web", "mobile", "android", "ios", "backend", "back-end", "frontend", "front-end",
+    "fullstack", "full", "stack", "full-stack", "data", "cloud", "network", "security", "systems", "system",
+    "platform", "infrastructure", "devops", "sre", "site", "reliability", "qa", "test", "automation",
+    "quality", "assurance", "ml", "ai", "machine", "learning", "research", "embedded", "game", "ui", "ux",
+    "product", "project", "program", "business", "it", "technical", "support", "application", "solutions",
+    "sales", "marketing", "hr", "finance", "operations", "content", "digital",
+}
+# Anything asking for judgement or explanation goes to the LLM
+OPEN_ENDED_WORDS = {
+    "why", "how", "which", "should", "best", "better", "compare", "recommend", "suggest", "advice",
+    "explain", "difference", "worth", "average", "trend", "prepare", "interview", "resume", "salary",
+}
+
+_COUNT = re.compile(r"^(?:count|how many|number of|total(?: number of)?)\b(?P<rest>.*)$")
+_SEARCH_COMMAND = re.compile(r"^search\s+(?P<rest>.+)$")
+_SEARCH = re.compile(
+    r"^(?:(?:find|show|search|list|get)\s+(?:me\s+)?)?(?:(?:all|some|any)\s+)?"
+    r"(?P<role>.*?)\s*\b(?:jobs?|positions?|roles?|openings?|vacancies)\b(?P<rest>.*)$"
+)
+_SKILLS = re.compile(r"\b(?:requiring|require|requires|with|using|that need|needing|in need of)\s+(?P<skills>.+)$")
+_LOCATION = re.compile(r"\b(?:in|at|near|around|based in)\s+(?P<location>[a-z][a-z .-]*?)\s*$")
+_EXPERIENCE = re.compile(
+    r"\b(?:for\s+)?(?P<experience>freshers?|entry level|junior|mid level|senior|"
+    r"\d+\s*(?:\+|(?:-|to)\s*\d+)?\s*(?:years?|yrs?)(?:\s+(?:of\s+)?experience)?)\b"
+)
+_SKILL_SEPARATORS = re.compile(r"\s*(?:,|&|\band\b|\bor\b)\s*")
+_SKILL_PATTERNS = [(skill, re.compile(rf"(?<![\w+#.]){re.escape(skill)}(?![\w+#])"))
+                   for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)]
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9+#./-]+", text)
+
+
+def _known_skills(text: str) -> Tuple[List[str], str]:
+    """Skills named in text (longest names first) and the text without them"""
+    skills = []
+    for skill, pattern in _SKILL_PATTERNS:
+        if pattern.search(text):
+            skills.append(skill)
+            text = pattern.sub(" ", text)
+    return skills, text
+
+
+def _location(text: str) -> Optional[str]:
+    """A place the job filters understand: remote or a known city"""
+    if is_remote_location(text):
+        return "remote"
+    return text if extract_city_ids(text) else None
+
+
+def _is_role(words: List[str]) -> bool:
+    """Whether words are made only of known skills and role words"""
+    _, rest = _known_skills(" ".join(words))
+    return all(word in ROLE_WORDS or (word.endswith("s") and word[:-1] in ROLE_WORDS)
+               for word in _words(rest))
+
+
+class IntentRouter:
+    """Answers structured requests directly, without the LLM.
+
+    Counts ("how many python jobs in Pune", "count") are read from the
+    precomputed job statistics, and searches ("<role> jobs in <city>",
+    "remote jobs requiring react and node.js", "search python developer
+    bangalore") go straight to the job search tool. Anything the parser does
+    not fully account for returns None and is left to the agent.
+    """
+
+    def __init__(self, search_tool, stats_tool):
+        self.search_tool = search_tool
+        self.stats_tool = stats_tool
+        self._lock = threading.Lock()
+        self.latency: Dict[str, Dict[str, float]] = {}
+
+    def record(self, route: str, seconds: float):
+        """Per-route call count and latency"""
+        with self._lock:
+            entry = self.latency.setdefault(route, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += seconds * 1000
+            entry["max_ms"] = max(entry["max_ms"], seconds * 1000)
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Call count, average and worst latency per route"""
+        with self._lock:
+            return {route: {"count": entry["count"], "avg_ms": round(entry["total_ms"] / entry["count"], 1),
+                            "max_ms": round(entry["max_ms"], 1)}
+                    for route, entry in self.latency.items()}
+
+    def parse(self, message: str) -> Optional[Dict[str, Any]]:
+        """The structured intent of a message, or None when it is open-ended"""
+        text = re.sub(r"\s+", " ", message.lower()).strip(" ?!.")
+        if not text:
+            return None
+
+        match = _COUNT.match(text)
+        if match:
+            rest = match.group("rest")
+            return None if OPEN_ENDED_WORDS & set(_words(rest)) else self._parse_count(rest)
+        if OPEN_ENDED_WORDS & set(_words(text)):
+            return None
+        match = _SEARCH_COMMAND.match(text)
+        if match:
+            return self._parse_search_command(match.group("rest"))
+        match = _SEARCH.match(text)
+        if match:
+            return self._parse_search(match.group("role"), match.group("rest"))
+        return None
+
+    def _parse_count(self, rest: str) -> Optional[Dict[str, Any]]:
+        intent = {"route": "count", "skill": None, "location": None, "source": None}
+        # Before the location, which would otherwise run on into "in pune on naukri"
+        for source in SOURCES:
+            pattern = rf"\b(?:(?:on|from|at|in)\s+)?{source}\b"
+            if re.search(pattern, rest):
+                intent["source"] = source
+                rest = re.sub(pattern, " ", rest).rstrip()
+        match = _LOCATION.search(rest)
+        # "... in the database" is no place
+        if match and not set(_words(match.group("location"))) <= FILLER_WORDS:
+            intent["location"] = _location(match.group("location"))
+            if not intent["location"]:
+                return None
+            rest = rest[:match.start()]
+        elif is_remote_location(rest):
+            intent["location"] = "remote"
+            rest = re.sub(r"\bremote\b", " ", rest)
+        skills, rest = _known_skills(rest)
+        # The counters cover one skill at a time
+        if len(skills) > 1 or set(_words(rest)) - FILLER_WORDS - COUNT_LINK_WORDS:
+            return None
+        intent["skill"] = skills[0] if skills else None
+        return intent
+
+    def _parse_search_command(self, rest: str) -> Optional[Dict[str, Any]]:
+        """CLI "search <words>": known cities and "remote" become the location, the rest the query"""
+        words = _words(rest)
+        location = next((word for word in words if _location(word)), None)
+        query = " ".join(word for word in words if word != location)
+        return {"route": "search", "query": query, "location": _location(location) if location else None,
+                "skills": None, "experience": None} if query or location else None
+
+    def _parse_search(self, role: str, rest: str) -> Optional[Dict[str, Any]]:
+        intent = {"route": "search", "query": None, "location": None, "skills": None, "experience": None}
+        if is_remote_location(role):
+            intent["location"] = "remote"
+            role = re.sub(r"\b(?:remote|work from home|wfh)\b", " ", role)
+
+        match = _SKILLS.search(rest)
+        if match:
+            skills = [skill for skill in _SKILL_SEPARATORS.split(match.group("skills")) if skill]
+            # Only a plain list of known skills, possibly followed by a location
+            tail = skills[-1]
+            location_match = _LOCATION.search(tail)
+            if location_match:
+                skills[-1] = tail[:location_match.start()].strip()
+                rest = rest[:match.start()] + " " + location_match.group(0)
+            else:
+                rest = rest[:match.start()]
+            if not skills or any(not _known_skills(skill)[0] or _known_skills(skill)[1].strip() for skill in skills):
+                return None
+            intent["skills"] = skills
+
+        match = _EXPERIENCE.search(rest)
+        if match:
+            intent["experience"] = match.group("experience")
+            rest = rest[:match.start()] + rest[match.end():]
+        match = _LOCATION.search(rest)
+        if match:
+            location = _location(match.group("location"))
+            if not location:
+                return None
+            intent["location"] = location
+            rest = rest[:match.start()]
+        if is_remote_location(rest):
+            intent["location"] = "remote"
+            rest = re.sub(r"\b(?:remote|work from home|wfh)\b", " ", rest)
+        if set(_words(rest)) - FILLER_WORDS:
+            return None
+
+        role_words = [word for word in _words(role) if word not in FILLER_WORDS]
+        # A role is a short noun phrase of skills and role words, e.g. "senior data engineer";
+        # "i lost my job" or "thanks for the jobs" is chat for the agent
+        if len(role_words) > 5 or not _is_role(role_words):
+            return None
+        intent["query"] = " ".join(role_words) or None
+        if not (intent["query"] or intent["location"] or intent["skills"]):
+            return None
+        return intent
+
+    def route(self, message: str) -> Optional[Tuple[str, str]]:
+        """(route, answer) for a structured request, None to fall through to the LLM"""
+        try:
+            intent = self.parse(message)
+        except Exception as e:
+            logger.warning(f"Could not parse message for the fast path: {e}")
+            return None
+        if not intent:
+            return None
+        if intent["route"] == "count":
+            return "count", self.stats_tool._run(skill=intent["skill"], location=intent["location"],
+                                                  source=intent["source"])
+        return "search", self.search_tool._run(query=intent["query"] or "", location=intent["location"],
+                                               skills=intent["skills"], experience=intent["experience"])
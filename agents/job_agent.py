@@ -1,17 +1,23 @@
 from typing import List, Dict, Any, Optional, Type
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
+from langchain_openai import ChatOpenAI
 from langchain.memory import ConversationBufferMemory
 from langchain.chains import ConversationalRetrievalChain
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.schema import Document
 from langchain.prompts import PromptTemplate
 from langchain.agents import Tool, AgentExecutor, create_react_agent
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 import json
-from utils.database import DatabaseManager
-from config.settings import OPENAI_API_KEY
+import time
+from utils.base_database import BaseDatabaseManager
+from utils.database import create_database_manager
+from utils.pagination import ORDER_BY_DATE, ORDER_BY_RELEVANCE
+from utils.job_query import build_job_filter
+from utils.job_stats import JobStats
+from .vector_index import JobVectorIndex
+from .embedding_cache import CachedEmbeddings
+from .embeddings import create_embeddings, collection_for
+from .intent_router import IntentRouter
+from config.settings import OPENAI_API_KEY, AGENT_FAST_PATH
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,42 +28,37 @@ class JobSearchInput(BaseModel):
     location: Optional[str] = Field(default=None, description="Location filter")
     skills: Optional[List[str]] = Field(default=None, description="Skills filter")
     experience: Optional[str] = Field(default=None, description="Experience level filter")
+    page_cursor: Optional[str] = Field(default=None, description="Cursor returned by a previous search to fetch the next page")
 
 
 class JobSearchTool(BaseTool):
     name: str = "job_search"
     description: str = "Search for jobs based on query, location, skills, and experience"
     args_schema: Type[BaseModel] = JobSearchInput
+    page_size: int = 5
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: BaseDatabaseManager):
         super().__init__()
         self.db = db_manager
     
     def _run(self, query: str, location: Optional[str] = None, 
-             skills: Optional[List[str]] = None, experience: Optional[str] = None) -> str:
+             skills: Optional[List[str]] = None, experience: Optional[str] = None,
+             page_cursor: Optional[str] = None) -> str:
         """Execute job search"""
         try:
-            search_filter = {}
+            search_filter = build_job_filter(query=query, location=location,
+                                             skills=skills, experience=experience)
             
-            if query:
-                search_filter["$text"] = {"$search": query}
-            
-            if location:
-                search_filter["location"] = {"$regex": location, "$options": "i"}
-            
-            if skills:
-                search_filter["skills"] = {"$in": skills}
-            
-            if experience:
-                search_filter["experience"] = {"$regex": experience, "$options": "i"}
-            
-            jobs = self.db.find_jobs(search_filter, limit=10)
+            order = ORDER_BY_RELEVANCE if query else ORDER_BY_DATE
+            page = self.db.find_jobs_page(search_filter, page_size=self.page_size,
+                                          cursor=page_cursor, order=order)
+            jobs = page["jobs"]
             
             if not jobs:
                 return "No jobs found matching your criteria."
             
             results = []
-            for job in jobs[:5]:  # Return top 5 results
+            for job in jobs:
                 result = f"**{job['title']}** at {job['company']}\n"
                 result += f"Location: {job['location']}\n"
                 result += f"Experience: {job['experience']}\n"
@@ -68,86 +69,97 @@ class JobSearchTool(BaseTool):
                 result += f"URL: {job['url']}\n"
                 results.append(result)
             
-            return "\n---\n".join(results)
+            output = "\n---\n".join(results)
+            if page["next_cursor"]:
+                output += f"\n\nMore jobs available. Search again with page_cursor=\"{page['next_cursor']}\" for the next page."
+            return output
             
         except Exception as e:
             logger.error(f"Error in job search: {e}")
             return f"Error searching for jobs: {str(e)}"
 
 
+class JobStatsInput(BaseModel):
+    skill: Optional[str] = Field(default=None, description="Count jobs requiring this skill")
+    location: Optional[str] = Field(default=None, description="Count jobs in this city (or 'remote')")
+    source: Optional[str] = Field(default=None, description="Count jobs from this source (naukri or linkedin)")
+
+
+class JobStatsTool(BaseTool):
+    name: str = "job_market_stats"
+    description: str = "Count jobs by skill, location and source, with a per-source breakdown"
+    args_schema: Type[BaseModel] = JobStatsInput
+    
+    def __init__(self, db_manager: BaseDatabaseManager):
+        super().__init__()
+        self.stats = JobStats(db_manager)
+    
+    def _run(self, skill: Optional[str] = None, location: Optional[str] = None,
+             source: Optional[str] = None) -> str:
+        """Look up the precomputed job counts"""
+        try:
+            total = self.stats.count(skill=skill, city=location, source=source)
+            output = f"Matching jobs: {total}"
+            if not source:
+                by_source = self.stats.count_by_source(skill=skill, city=location)
+                if by_source:
+                    output += "\nBy source: " + ", ".join(f"{name}: {count}" for name, count in sorted(by_source.items()))
+            return output
+        except Exception as e:
+            logger.error(f"Error reading job statistics: {e}")
+            return f"Error reading job statistics: {str(e)}"
+
+
 class JobAgent:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[BaseDatabaseManager] = None):
+        self.db = db or create_database_manager()
         self.llm = ChatOpenAI(
             temperature=0.7,
             model="gpt-3.5-turbo",
             openai_api_key=OPENAI_API_KEY
         )
-        self.embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY)
+        # OpenAI by default; EMBEDDING_BACKEND=hashing or local-model embeds offline
+        self.embeddings = create_embeddings()
         self.memory = ConversationBufferMemory(
             memory_key="chat_history",
             return_messages=True
         )
+        self.job_index = None
         self.vector_store = None
         self.qa_chain = None
         self.agent_executor = None
+        self.router = None
         
         self._setup_vector_store()
         self._setup_agent()
     
     def _setup_vector_store(self):
-        """Setup vector store with job data"""
+        """Open the persisted vector store and embed only jobs added or changed since the last sync"""
         try:
-            jobs = self.db.get_all_jobs()
-            
-            if not jobs:
-                logger.warning("No jobs found in database for vector store")
-                return
-            
-            documents = []
-            for job in jobs:
-                content = f"Job Title: {job['title']}\n"
-                content += f"Company: {job['company']}\n"
-                content += f"Location: {job['location']}\n"
-                content += f"Experience: {job['experience']}\n"
-                content += f"Skills: {', '.join(job.get('skills', []))}\n"
-                content += f"Description: {job['job_description']}\n"
-                
-                doc = Document(
-                    page_content=content,
-                    metadata={
-                        "job_id": str(job['_id']),
-                        "title": job['title'],
-                        "company": job['company'],
-                        "source": job['source']
-                    }
-                )
-                documents.append(doc)
-            
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200
-            )
-            splits = text_splitter.split_documents(documents)
-            
-            self.vector_store = Chroma.from_documents(
-                documents=splits,
-                embedding=self.embeddings,
-                persist_directory="./chroma_db"
-            )
-            
-            logger.info(f"Vector store created with {len(splits)} documents")
-            
+            self.job_index = JobVectorIndex(self.db, self.embeddings, collection_name=collection_for())
+            self.job_index.sync()
+            self.vector_store = self.job_index.store
+            if isinstance(self.embeddings, CachedEmbeddings):
+                cache = self.embeddings.stats()
+                logger.info(f"Embedding cache: {cache['hits']} hits, {cache['misses']} misses "
+                            f"(hit rate {cache['hit_rate']:.0%}), {cache['backend_calls']} API calls, "
+                            f"~{cache['saved_s']}s saved")
         except Exception as e:
             logger.error(f"Error setting up vector store: {e}")
     
     def _setup_agent(self):
         """Setup the agent with tools"""
+        stats = JobStats(self.db)
+        search_tool = JobSearchTool(db_manager=self.db)
+        stats_tool = JobStatsTool(db_manager=self.db)
+        if AGENT_FAST_PATH:
+            self.router = IntentRouter(search_tool, stats_tool)
         tools = [
-            JobSearchTool(db_manager=self.db),
+            search_tool,
+            stats_tool,
             Tool(
                 name="job_count",
-                func=lambda x: f"Total jobs in database: {len(self.db.get_all_jobs())}",
+                func=lambda x: f"Total jobs in database: {stats.total()}",
                 description="Get the total number of jobs in the database"
             ),
         ]
@@ -188,13 +200,24 @@ Question: {input}
         )
     
     def chat(self, message: str) -> str:
-        """Chat with the agent"""
+        """Chat with the agent; structured requests skip the LLM when the fast path is enabled"""
         try:
-            if self.agent_executor:
+            started = time.perf_counter()
+            routed = self.router.route(message) if self.router else None
+            if routed:
+                route, response = routed
+                # Keep the conversation whole for later LLM turns
+                self.memory.save_context({"input": message}, {"output": response})
+            elif self.agent_executor:
+                route = "llm"
                 response = self.agent_executor.run(message)
-                return response
             else:
                 return "Agent not properly initialized. Please check the setup."
+            elapsed = time.perf_counter() - started
+            if self.router:
+                self.router.record(route, elapsed)
+            logger.info(f"Answered via {route} in {elapsed * 1000:.0f} ms")
+            return response
         except Exception as e:
             logger.error(f"Error in chat: {e}")
             return f"I encountered an error: {str(e)}. Please try rephrasing your question."
@@ -207,15 +230,13 @@ Question: {input}
         try:
             similar_docs = self.vector_store.similarity_search(job_description, k=k)
             
-            similar_jobs = []
+            job_ids = []
             for doc in similar_docs:
                 job_id = doc.metadata.get('job_id')
-                if job_id:
-                    job = self.db.find_job_by_id(job_id)
-                    if job:
-                        similar_jobs.append(job)
+                if job_id and job_id not in job_ids:
+                    job_ids.append(job_id)
             
-            return similar_jobs
+            return self.db.find_jobs_by_ids(job_ids)
             
         except Exception as e:
             logger.error(f"Error finding similar jobs: {e}")
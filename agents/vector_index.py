@@ -0,0 +1,121 @@
+import hashlib
+import time
+from typing import List, Dict, Any
+from langchain_community.vectorstores import Chroma
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
+from utils.base_database import BaseDatabaseManager
+from config.settings import CHROMA_PERSIST_DIR, CHROMA_COLLECTION
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Fields that make up a job's embedded text
+VECTOR_FIELDS = {"title": 1, "company": 1, "location": 1, "experience": 1, "skills": 1,
+                 "job_description": 1, "source": 1}
+
+
+def job_document(job: Dict[str, Any]) -> Document:
+    """Text and metadata embedded for a job"""
+    content = f"Job Title: {job['title']}\n"
+    content += f"Company: {job['company']}\n"
+    content += f"Location: {job['location']}\n"
+    content += f"Experience: {job['experience']}\n"
+    content += f"Skills: {', '.join(job.get('skills') or [])}\n"
+    content += f"Description: {job.get('job_description') or ''}\n"
+    return Document(
+        page_content=content,
+        metadata={
+            "job_id": str(job['_id']),
+            "title": job['title'],
+            "company": job['company'],
+            "source": job['source'],
+            "content_hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        }
+    )
+
+
+class JobVectorIndex:
+    """Persistent Chroma index of the job corpus, kept in step with the database.
+
+    Every chunk is stored under the ID "<job_id>:<chunk>" with the hash of
+    its job's text, so sync only embeds jobs that are new or whose text
+    changed and deletes the vectors of jobs no longer in the database.
+    """
+
+    def __init__(self, db: BaseDatabaseManager, embeddings: Embeddings,
+                 persist_directory: str = CHROMA_PERSIST_DIR, collection_name: str = CHROMA_COLLECTION,
+                 batch_size: int = 256):
+        self.db = db
+        self.batch_size = batch_size
+        self.store = Chroma(collection_name=collection_name, embedding_function=embeddings,
+                            persist_directory=persist_directory)
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+
+    def indexed_jobs(self) -> Dict[str, Dict[str, Any]]:
+        """Content hash and chunk IDs of every job in the store, read without vectors"""
+        indexed = {}
+        offset = 0
+        while True:
+            page = self.store.get(include=["metadatas"], limit=self.batch_size * 4, offset=offset)
+            if not page["ids"]:
+                break
+            for chunk_id, metadata in zip(page["ids"], page["metadatas"]):
+                metadata = metadata or {}
+                entry = indexed.setdefault(metadata.get("job_id"), {"hash": metadata.get("content_hash"), "ids": []})
+                entry["ids"].append(chunk_id)
+            offset += len(page["ids"])
+        return indexed
+
+    def _delete(self, chunk_ids: List[str]):
+        for i in range(0, len(chunk_ids), self.batch_size):
+            self.store.delete(ids=chunk_ids[i:i + self.batch_size])
+
+    def _add(self, documents: List[Document]) -> int:
+        chunks, ids = [], []
+        for document in documents:
+            for number, chunk in enumerate(self.splitter.split_documents([document])):
+                chunks.append(chunk)
+                ids.append(f"{document.metadata['job_id']}:{number}")
+        if chunks:
+            self.store.add_documents(chunks, ids=ids)
+        return len(chunks)
+
+    def sync(self) -> Dict[str, Any]:
+        """Embed new and changed jobs and drop removed ones.
+
+        Reading the hashes is O(corpus) but cheap; embedding calls are only
+        made for the difference since the last sync.
+        """
+        started = time.monotonic()
+        indexed = self.indexed_jobs()
+        stats = {"jobs": 0, "added": 0, "updated": 0, "removed": 0, "unchanged": 0, "chunks": 0}
+
+        pending: List[Document] = []
+        for job in self.db.iter_jobs(projection=VECTOR_FIELDS):
+            stats["jobs"] += 1
+            document = job_document(job)
+            entry = indexed.pop(document.metadata["job_id"], None)
+            if entry and entry["hash"] == document.metadata["content_hash"]:
+                stats["unchanged"] += 1
+                continue
+            if entry:
+                # The text changed, and may now split into fewer chunks
+                self._delete(entry["ids"])
+                stats["updated"] += 1
+            else:
+                stats["added"] += 1
+            pending.append(document)
+            if len(pending) >= self.batch_size:
+                stats["chunks"] += self._add(pending)
+                pending = []
+        stats["chunks"] += self._add(pending)
+
+        # Whatever is left in the store no longer exists in the database
+        self._delete([chunk_id for entry in indexed.values() for chunk_id in entry["ids"]])
+        stats["removed"] = len(indexed)
+        stats["elapsed_s"] = round(time.monotonic() - started, 2)
+        logger.info(f"Vector store synced: {stats['added']} added, {stats['updated']} updated, "
+                    f"{stats['removed']} removed, {stats['unchanged']} unchanged ({stats['chunks']} chunks embedded)")
+        return stats
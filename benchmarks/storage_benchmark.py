@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark the storage backends: ingest, text search and full-scan throughput.
+
+Usage:
+    python benchmarks/storage_benchmark.py --jobs 5000 --backends sqlite mongodb
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.job import Job
+
+TITLES = ["Python Developer", "Data Scientist", "Backend Engineer", "Frontend Developer",
+          "DevOps Engineer", "Machine Learning Engineer", "Java Developer", "QA Engineer"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Bangalore/Bengaluru", "Pune", "Hyderabad", "Mumbai", "Remote", "Gurugram, Haryana"]
+SKILLS = ["python", "django", "react", "aws", "docker", "kubernetes", "sql", "java", "spark", "pandas"]
+SEARCH_TERMS = ["python", "data scientist", "kubernetes docker", "frontend react", "java spring"]
+
+
+def generate_jobs(count: int, seed: int = 42):
+    """Build a reproducible synthetic corpus"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    jobs = []
+    for i in range(count):
+        title = rng.choice(TITLES)
+        skills = rng.sample(SKILLS, 4)
+        low = rng.randint(0, 8)
+        jobs.append(Job(
+            title=title,
+            company=rng.choice(COMPANIES),
+            location=rng.choice(LOCATIONS),
+            experience=f"{low}-{low + rng.randint(1, 5)} Yrs",
+            skills=skills,
+            job_description=f"We are hiring a {title} to work with {', '.join(skills)}. " * 5,
+            posted_date=now - timedelta(days=rng.randint(0, 90)),
+            url=f"https://example.com/jobs/{i}",
+            source=rng.choice(["naukri", "linkedin"]),
+        ))
+    return jobs
+
+
+def open_backend(name: str, workdir: str):
+    """Create an isolated database for one backend"""
+    if name == "sqlite":
+        from utils.sqlite_database import SQLiteDatabaseManager
+        return SQLiteDatabaseManager(Path(workdir) / "benchmark.db")
+    if name == "mongodb":
+        from utils.database import DatabaseManager
+        db = DatabaseManager(db_name="joblo_benchmark")
+        db.client.drop_database("joblo_benchmark")
+        return db
+    raise ValueError(f"Unknown backend: {name}")
+
+
+def cleanup_backend(name: str, db):
+    if name == "mongodb":
+        db.client.drop_database("joblo_benchmark")
+
+
+def run_benchmark(name: str, jobs, batch_size: int, search_rounds: int, workdir: str):
+    db = open_backend(name, workdir)
+    db.create_indexes()
+    results = {"backend": name}
+
+    started = time.perf_counter()
+    for i in range(0, len(jobs), batch_size):
+        db.upsert_jobs(jobs[i:i + batch_size])
+    elapsed = time.perf_counter() - started
+    results["ingest_jobs_per_s"] = len(jobs) / elapsed
+
+    started = time.perf_counter()
+    matches = 0
+    for _ in range(search_rounds):
+        for term in SEARCH_TERMS:
+            matches += len(db.search_jobs(term))
+    elapsed = time.perf_counter() - started
+    results["searches_per_s"] = search_rounds * len(SEARCH_TERMS) / elapsed
+    results["avg_matches"] = matches / (search_rounds * len(SEARCH_TERMS))
+
+    started = time.perf_counter()
+    scanned = sum(1 for _ in db.iter_jobs())
+    elapsed = time.perf_counter() - started
+    results["scan_jobs_per_s"] = scanned / elapsed
+
+    cleanup_backend(name, db)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare storage backend throughput")
+    parser.add_argument('--jobs', type=int, default=5000, help='Number of synthetic jobs')
+    parser.add_argument('--batch-size', type=int, default=500, help='Jobs per upsert batch')
+    parser.add_argument('--search-rounds', type=int, default=20, help='Repetitions of the search term set')
+    parser.add_argument('--backends', nargs='+', default=['sqlite', 'mongodb'], help='Backends to benchmark')
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs)
+    workdir = tempfile.mkdtemp(prefix="joblo_bench_")
+    rows = []
+    try:
+        for name in args.backends:
+            try:
+                rows.append(run_benchmark(name, jobs, args.batch_size, args.search_rounds, workdir))
+            except Exception as e:
+                print(f"Skipping {name}: {e}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nStorage benchmark ({args.jobs} jobs)")
+    print("-" * 72)
+    print(f"{'backend':<10} {'ingest jobs/s':>15} {'searches/s':>12} {'avg hits':>10} {'scan jobs/s':>15}")
+    for row in rows:
+        print(f"{row['backend']:<10} {row['ingest_jobs_per_s']:>15.0f} {row['searches_per_s']:>12.1f} "
+              f"{row['avg_matches']:>10.0f} {row['scan_jobs_per_s']:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
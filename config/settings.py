@@ -8,20 +8,124 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# The chat agent's job vectors persist here and are synced incrementally at startup;
+# "langchain" is the collection earlier versions wrote to, so it is migrated in place
+CHROMA_PERSIST_DIR = os.getenv("CHROMA_PERSIST_DIR", "./chroma_db")
+CHROMA_COLLECTION = os.getenv("CHROMA_COLLECTION", "langchain")
+
+# Storage backend: "mongodb" or "sqlite" (embedded, no server required)
+DATABASE_BACKEND = os.getenv("DATABASE_BACKEND", "mongodb")
+
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
 MONGODB_DB_NAME = os.getenv("MONGODB_DB_NAME", "joblo_jobs")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", 50))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", 0))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", 60000))
+MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", 10000))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", 10000))
+MONGODB_SOCKET_TIMEOUT_MS = int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", 0)) or None
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", 0)) or None
+MONGODB_READ_PREFERENCE = os.getenv("MONGODB_READ_PREFERENCE", "primary")
 
 NAUKRI_BASE_URL = os.getenv("NAUKRI_BASE_URL", "https://www.naukri.com")
 LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com")
 
+# "auto" fetches listings over plain HTTP and falls back to the browser when that
+# yields nothing; "http" and "browser" force a single engine
+SCRAPER_MODE = os.getenv("SCRAPER_MODE", "auto")
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 10))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 15))
+
+# Browser waits poll for new content at this interval instead of sleeping a fixed time;
+# a scroll that yields nothing new within SCRAPER_SCROLL_TIMEOUT ends the page
+SCRAPER_WAIT_TIMEOUT = float(os.getenv("SCRAPER_WAIT_TIMEOUT", 10))
+SCRAPER_SCROLL_TIMEOUT = float(os.getenv("SCRAPER_SCROLL_TIMEOUT", 3))
+SCRAPER_POLL_INTERVAL = float(os.getenv("SCRAPER_POLL_INTERVAL", 0.2))
+
+# Incremental scrapes stop paginating after this many consecutive already-stored
+# postings (0 keeps walking every page)
+SCRAPER_STOP_AFTER_KNOWN = int(os.getenv("SCRAPER_STOP_AFTER_KNOWN", 20))
+
+# Scraped jobs are queued to a writer thread and stored every SCRAPE_BATCH_SIZE jobs
+# or SCRAPE_FLUSH_INTERVAL seconds; scrapers block once SCRAPE_QUEUE_SIZE are pending
+SCRAPE_BATCH_SIZE = int(os.getenv("SCRAPE_BATCH_SIZE", 100))
+SCRAPE_QUEUE_SIZE = int(os.getenv("SCRAPE_QUEUE_SIZE", 1000))
+SCRAPE_FLUSH_INTERVAL = float(os.getenv("SCRAPE_FLUSH_INTERVAL", 2))
+# Scraped jobs are written as JSON lines, compressed with "gzip", "zstd" or "none"
+JSONL_COMPRESSION = os.getenv("JSONL_COMPRESSION", "gzip")
+# Scrape progress is checkpointed every SCRAPE_CHECKPOINT_EVERY result pages,
+# once the jobs before it are stored, so `main.py scrape --resume` can continue there
+SCRAPE_CHECKPOINT_EVERY = int(os.getenv("SCRAPE_CHECKPOINT_EVERY", 3))
+
+# Campaigns (many query x location combinations): combinations scraped at once,
+# retries per failed combination and the base backoff between them (seconds)
+CAMPAIGN_MAX_CONCURRENCY = int(os.getenv("CAMPAIGN_MAX_CONCURRENCY", 4))
+CAMPAIGN_MAX_RETRIES = int(os.getenv("CAMPAIGN_MAX_RETRIES", 2))
+CAMPAIGN_RETRY_BACKOFF = float(os.getenv("CAMPAIGN_RETRY_BACKOFF", 5))
+# Default per-domain token bucket for campaign requests (requests/second, burst size)
+DOMAIN_RATE_LIMIT = float(os.getenv("DOMAIN_RATE_LIMIT", 1))
+DOMAIN_BURST = int(os.getenv("DOMAIN_BURST", 3))
+
+# Detail-page enrichment: requests in flight, requests/second per domain, and
+# failed fetches after which a job is no longer retried
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", 8))
+ENRICH_RATE_LIMIT = float(os.getenv("ENRICH_RATE_LIMIT", 2))
+ENRICH_MAX_ATTEMPTS = int(os.getenv("ENRICH_MAX_ATTEMPTS", 3))
+
 APP_HOST = os.getenv("APP_HOST", "0.0.0.0")
 APP_PORT = int(os.getenv("APP_PORT", 8000))
 
+JOB_SEARCH_PAGE_SIZE = int(os.getenv("JOB_SEARCH_PAGE_SIZE", 20))
+
+# Jobs posted more than this many days ago leave the hot set (0 disables automatic archiving)
+JOB_ARCHIVE_AFTER_DAYS = int(os.getenv("JOB_ARCHIVE_AFTER_DAYS", 60))
+# "collection" keeps archived jobs queryable in the database, "file" compacts them into gzip JSONL
+JOB_ARCHIVE_MODE = os.getenv("JOB_ARCHIVE_MODE", "collection")
+
 CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH", None)
 
+# Platforms scraped concurrently; each worker runs its own browser
+SCRAPER_MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", 2))
+
+# Warm browser sessions kept alive across scraping jobs, and the number of
+# pages a session may load before it is replaced with a fresh browser
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", SCRAPER_MAX_WORKERS))
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", 50))
+
 DATA_DIR = BASE_DIR / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 PROCESSED_DATA_DIR = DATA_DIR / "processed"
+ARCHIVE_DATA_DIR = DATA_DIR / "archive"
+
+# Columnar corpus snapshot loaded by the scorer/recommender instead of querying the database
+JOB_SNAPSHOT_PATH = os.getenv("JOB_SNAPSHOT_PATH")
+DEFAULT_SNAPSHOT_PATH = PROCESSED_DATA_DIR / "jobs_snapshot.arrow"
+
+SQLITE_DB_PATH = Path(os.getenv("SQLITE_DB_PATH", str(DATA_DIR / "joblo.db")))
+
+# Embeddings are cached locally by content hash; texts not in the cache are sent
+# to the embedding API EMBEDDING_BATCH_SIZE at a time
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_PATH = Path(os.getenv("EMBEDDING_CACHE_PATH", str(DATA_DIR / "embeddings.db")))
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", 512))
+# Embedding backend of the chat agent: "openai", or offline "hashing" (hashed word n-grams)
+# or "local-model" (a sentence-transformers model name or directory, run on CPU)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")
+EMBEDDING_LOCAL_MODEL = os.getenv("EMBEDDING_LOCAL_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+EMBEDDING_HASHING_FEATURES = int(os.getenv("EMBEDDING_HASHING_FEATURES", 2048))
+# Counts and plain job searches in chat are answered directly, without the LLM
+AGENT_FAST_PATH = os.getenv("AGENT_FAST_PATH", "true").lower() == "true"
+
+# Opt-in: every fetched listing page is kept compressed ("zstd" or "gzip") and content-addressed,
+# so parsers can be re-run over past scrapes with `main.py replay`
+PAGE_ARCHIVE_ENABLED = os.getenv("PAGE_ARCHIVE_ENABLED", "false").lower() == "true"
+PAGE_ARCHIVE_DIR = Path(os.getenv("PAGE_ARCHIVE_DIR", str(DATA_DIR / "pages")))
+PAGE_ARCHIVE_COMPRESSION = os.getenv("PAGE_ARCHIVE_COMPRESSION", "zstd")
+SCRAPE_CHECKPOINT_PATH = Path(os.getenv("SCRAPE_CHECKPOINT_PATH", str(DATA_DIR / "scrape_checkpoints.json")))
+
+# Per-page scrape timings (load, wait, throttle, parse), failures and run summaries as JSON lines
+SCRAPE_TELEMETRY_ENABLED = os.getenv("SCRAPE_TELEMETRY_ENABLED", "true").lower() == "true"
+SCRAPE_TELEMETRY_PATH = Path(os.getenv("SCRAPE_TELEMETRY_PATH", str(DATA_DIR / "scrape_telemetry.jsonl")))
 
-for dir_path in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR]:
+for dir_path in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, ARCHIVE_DATA_DIR]:
     dir_path.mkdir(exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Shared pytest fixtures: a local HTTP server that plays back recorded pages
+from test_fixtures/, so scrapers can be tested without the real sites.
+"""
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Dict, Callable, Union, Tuple
+from urllib.parse import urlsplit, parse_qsl
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "test_fixtures"
+
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".json": "application/json"}
+
+# A route answers with (status, content type, body), or computes that from the query string
+Response = Tuple[int, str, str]
+Route = Union[Response, Callable[[Dict[str, str]], Response]]
+
+
+def fixture_page(name: str) -> str:
+    """Contents of a recorded page"""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def recorded(name: str, status: int = 200) -> Response:
+    """Response that plays back a recorded page"""
+    return status, CONTENT_TYPES[Path(name).suffix], fixture_page(name)
+
+
+class FixtureServer:
+    """HTTP server on a free local port that serves registered routes and logs every request"""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = dict(parse_qsl(parts.query))
+                server.requests.append({"path": parts.path, "query": query, "headers": dict(self.headers)})
+                route = server.routes.get(parts.path)
+                if route is None:
+                    status, content_type, body = 404, "text/plain", "not found"
+                else:
+                    status, content_type, body = route(query) if callable(route) else route
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                        daemon=True)
+
+    def serve(self, path: str, route: Route):
+        self.routes[path] = route
+
+    def requests_to(self, path: str):
+        return [request for request in self.requests if request["path"] == path]
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fixture_server():
+    server = FixtureServer()
+    server.start()
+    yield server
+    server.stop()
@@ -13,7 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from scrapers.scraper_manager import ScraperManager
 from scoring.job_scorer import JobScorer
 from recommendations.job_recommender import JobRecommender
-from utils.database import DatabaseManager
+from utils.database import create_database_manager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -94,8 +94,8 @@ def demo_recommendations():
     
     input("\nPress Enter to see recommendations...")
     
-    db = DatabaseManager()
-    recommender = JobRecommender()
+    db = create_database_manager()
+    recommender = JobRecommender(db=db)
     
     # Get a sample job
     jobs = db.get_all_jobs()
@@ -162,7 +162,7 @@ def main():
     
     try:
         # Check MongoDB connection
-        db = DatabaseManager()
+        db = create_database_manager()
         db.create_indexes()
         
         # Run demos
@@ -13,9 +13,19 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
 from scrapers.scraper_manager import ScraperManager
+from scrapers.campaign import Campaign, CampaignScheduler
+from scrapers.pipeline import ScrapePipeline
+from scrapers.replay import replay_jobs, benchmark_parsers
+from scrapers.enrichment import JobEnricher
 from agents.cli_interface import JobAssistantCLI
+from agents.embeddings import EMBEDDING_BACKENDS
+from agents.embedding_benchmark import benchmark_embeddings, DEFAULT_QUERIES_PATH
 from scoring.job_scorer import JobScorer
-from utils.database import DatabaseManager
+from utils.database import create_database_manager
+from utils.jsonl_files import load_jobs_file
+from config.settings import (
+    JOB_ARCHIVE_AFTER_DAYS, JOB_ARCHIVE_MODE, DEFAULT_SNAPSHOT_PATH, SCRAPER_MAX_WORKERS, ENRICH_CONCURRENCY,
+)
 import subprocess
 
 logging.basicConfig(
@@ -29,22 +39,176 @@ def scrape_jobs(args):
     """Run the job scraping process"""
     logger.info("Starting job scraping process...")
     
-    manager = ScraperManager()
+    manager = ScraperManager(max_workers=args.workers)
     results = manager.run_scraping_job(
         search_query=args.query,
         location=args.location,
         num_jobs_per_platform=args.num_jobs,
         save_to_db=True,
-        save_to_file=True
+        save_to_file=True,
+        incremental=not args.full,
+        resume=args.resume
     )
     
     logger.info(f"Scraping completed: {results}")
     print(f"\nScraping Summary:")
     print(f"Total jobs scraped: {results['total_jobs']}")
-    for platform, count in results['jobs_by_platform'].items():
-        print(f"  {platform}: {count} jobs")
+    new_in_db = results.get('new_in_db', {})
+    for platform, report in results['platform_reports'].items():
+        line = f"  {platform}: {report['jobs']} jobs scraped"
+        if platform in new_in_db:
+            line += f" ({new_in_db[platform]} new in database)"
+        line += f" in {report['duration_s']}s ({report['transport']})"
+        if report['known_skipped']:
+            line += f", {report['known_skipped']} already known"
+        if report['resumed_from'] == 'done':
+            line += ", already completed"
+        elif report['resumed_from'] is not None:
+            line += f", resumed from position {report['resumed_from']}"
+        if report['status'] != 'ok':
+            line += f" (failed: {report['error']})"
+        print(line)
+    pool = results['driver_pool']
+    print(f"Browser pool: {pool['open']}/{pool['size']} sessions open, {pool['created']} launched, "
+          f"{pool['recycled']} recycled, {pool['crashed']} crashed, utilization {pool['utilization']:.0%}")
+    if 'pipeline' in results:
+        pipeline = results['pipeline']
+        print(f"Stored {pipeline['written']} jobs in {pipeline['batches']} batches "
+              f"({sum(new_in_db.values())} new in database)")
+        if pipeline['db_errors']:
+            print(f"  {pipeline['db_errors']} batches failed to save to the database")
+    print_telemetry(results['telemetry'])
     if 'json_file' in results:
         print(f"\nJobs saved to: {results['json_file']}")
+    
+    if args.enrich:
+        print_enrichment(JobEnricher().run())
+
+
+def print_telemetry(telemetry):
+    """Where the scrape time went, per source and phase"""
+    print(f"\nTelemetry:")
+    for source, entry in telemetry['by_source'].items():
+        print(f"  {source}: {entry['pages']} pages, {entry['cards']} cards in {entry['elapsed_s']}s "
+              f"({entry['cards_per_s']} cards/s) - load {entry['load_s']}s, wait {entry['wait_s']}s, "
+              f"throttle {entry['throttle_s']}s, parse {entry['parse_s']}s "
+              f"({entry['parse_ms_per_card']} ms/card), bottleneck: {entry['bottleneck'] or '-'}")
+        if entry['failures']:
+            print("    failures: " + ", ".join(f"{name} x{count}" for name, count in entry['failures'].items()))
+    if telemetry['slowest_source']:
+        print(f"  Slowest source: {telemetry['slowest_source']} ({telemetry['bottleneck'] or 'no'} bound); "
+              f"{telemetry['driver_launches']} browsers launched, {telemetry['driver_restarts']} restarted")
+    if telemetry['file']:
+        print(f"  Per-page metrics: {telemetry['file']} (run {telemetry['run_id']})")
+
+
+def enrich_jobs(args):
+    """Fetch full posting pages for stored jobs that only have listing data"""
+    enricher = JobEnricher(concurrency=args.concurrency)
+    print_enrichment(enricher.run(sources=[args.source] if args.source else None, limit=args.limit))
+
+
+def print_enrichment(stats):
+    print(f"\nEnriched {stats['enriched']}/{stats['jobs']} jobs ({stats['failed']} failed) "
+          f"in {stats['elapsed_s']}s - {stats['pages']} pages, {stats['pages_per_s']} pages/s")
+    for domain, entry in stats['rate_limits'].items():
+        print(f"  {domain}: {entry['requests']} requests, {entry['wait_s']}s throttled")
+
+
+def run_campaign(args):
+    """Scrape every query x location combination of a campaign spec"""
+    try:
+        campaign = Campaign.from_file(args.spec)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Error: invalid campaign spec {args.spec}: {e}")
+        return
+    if args.full:
+        campaign.incremental = False
+    
+    summary = CampaignScheduler(campaign).run(save_to_file=not args.no_file, resume=args.resume)
+    logger.info(f"Campaign completed: {summary}")
+    
+    print(f"\nCampaign '{summary['name']}': {summary['succeeded']}/{summary['combinations']} combinations "
+          f"succeeded in {summary['elapsed_s']}s ({summary['retries']} retries)")
+    print(f"Throughput: {summary['jobs']} jobs ({summary['jobs_per_min']}/min), "
+          f"{summary['pages']} pages ({summary['pages_per_s']}/s), "
+          f"{summary['skipped']} duplicate or known postings skipped")
+    for source, entry in summary['by_source'].items():
+        print(f"  {source}: {entry['jobs']} jobs from {entry['combinations']} combinations, "
+              f"{entry['pages']} pages, {entry['failed']} failed")
+    for domain, entry in summary['rate_limits'].items():
+        print(f"  {domain}: {entry['requests']} requests, {entry['wait_s']}s throttled")
+    print(f"Stored {summary['pipeline']['written']} jobs ({summary.get('new_in_db', 0)} new in database)")
+    for failure in summary['failed']:
+        print(f"  failed: {failure['source']} '{failure['query']}' in {failure['location']}: {failure['error']}")
+    if 'json_file' in summary:
+        print(f"\nJobs saved to: {summary['json_file']}")
+
+
+def replay_pages(args):
+    """Re-parse archived listing pages offline, or benchmark the parsers on them"""
+    sources = [args.source] if args.source else None
+    
+    if args.benchmark:
+        results = benchmark_parsers(sources=sources, repeat=args.repeat)
+        print(f"\nParser benchmark over {results['pages']} archived pages "
+              f"(best of {results['repeat']}, decompression {results['decompress_s']}s):")
+        for source, entry in results['by_source'].items():
+            print(f"  {source}: {entry['pages']} pages, {entry['jobs']} jobs in {entry['best_s']}s - "
+                  f"{entry['pages_per_s']} pages/s, {entry['jobs_per_s']} jobs/s, {entry['mb_per_s']} MB/s")
+        return
+    
+    if not args.save:
+        counts = {}
+        for job in replay_jobs(sources=sources):
+            counts[job.source] = counts.get(job.source, 0) + 1
+        print(f"\nRe-parsed {sum(counts.values())} jobs from the page archive (use --save to store them)")
+        for source, count in counts.items():
+            print(f"  {source}: {count} jobs")
+        return
+    
+    with ScrapePipeline(db=create_database_manager()) as pipeline:
+        for job in replay_jobs(sources=sources):
+            pipeline.put(job)
+    stats = pipeline.stats
+    print(f"\nRe-parsed and stored {stats['written']} jobs "
+          f"({sum(counts['inserted'] for counts in stats['by_source'].values())} new)")
+
+
+def load_files(args):
+    """Bulk-load scraped JSONL files (plain, .gz or .zst) into the database"""
+    db = create_database_manager()
+    for path in args.files:
+        if not Path(path).exists():
+            print(f"Error: File not found: {path}")
+            continue
+        stats = load_jobs_file(path, db, batch_size=args.batch_size)
+        line = f"{path}: loaded {stats['loaded']}/{stats['read']} jobs ({stats['inserted']} new)"
+        if stats['invalid']:
+            line += f", {stats['invalid']} invalid"
+        print(line)
+
+
+def benchmark_embedding_backends(args):
+    """Compare embedding backends on indexing speed and retrieval quality"""
+    try:
+        results = benchmark_embeddings(create_database_manager(), args.backends, queries_path=args.queries,
+                                       limit=args.limit, k=args.k)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return
+    print(f"\nEmbedding benchmark: {results['jobs']} jobs, {results['queries']} queries, top {results['k']}"
+          + (f", overlap measured against {results['reference']}" if results['reference'] else ""))
+    for backend, entry in results['by_backend'].items():
+        if 'error' in entry:
+            print(f"  {backend}: failed ({entry['error']})")
+            continue
+        line = (f"  {backend}: {entry['dimensions']} dims, indexed in {entry['index_s']}s "
+                f"({entry['docs_per_s']} docs/s), {entry['query_ms']} ms/query, "
+                f"precision@{results['k']} {entry['precision_at_k']}")
+        if 'overlap_with_reference' in entry:
+            line += f", overlap {entry['overlap_with_reference']}"
+        print(line)
 
 
 def run_cli_chat(args):
@@ -90,11 +254,83 @@ def run_web_app(args):
 def setup_database(args):
     """Setup database indexes"""
     logger.info("Setting up database...")
-    db = DatabaseManager()
+    db = create_database_manager()
     db.create_indexes()
+    db.backfill_derived_fields()
+    db.rebuild_stats()
     logger.info("Database setup completed")
 
 
+def show_stats(args):
+    """Show job market statistics"""
+    from utils.job_stats import JobStats
+    
+    stats = JobStats(create_database_manager())
+    if args.rebuild:
+        print(f"Rebuilt {stats.rebuild()} statistics counters")
+    
+    if args.skill or args.city or args.source:
+        total = stats.count(skill=args.skill, city=args.city, source=args.source)
+        print(f"\nMatching jobs: {total}")
+        if not args.source:
+            for source, count in sorted(stats.count_by_source(skill=args.skill, city=args.city).items()):
+                print(f"   {source}: {count}")
+        return
+    
+    summary = stats.summary(limit=args.top)
+    print(f"\nTotal jobs: {summary['total']}")
+    for title, key in [("By source", "by_source"), ("Top cities", "top_cities"), ("Top skills", "top_skills"),
+                       ("By experience", "by_experience"), ("By posting week", "by_week")]:
+        print(f"\n{title}:")
+        for name, count in summary[key].items():
+            print(f"   {name}: {count}")
+
+
+def archive_jobs(args):
+    """Move stale jobs out of the hot set"""
+    from utils.archive import JobArchiver
+    
+    db = create_database_manager()
+    archiver = JobArchiver(db, max_age_days=args.days, mode=args.mode)
+    result = archiver.run()
+    
+    print(f"\nArchived {result['archived']} jobs posted before {result['cutoff']:%Y-%m-%d} ({result['mode']} mode)")
+    if result.get('file'):
+        print(f"Archive file: {result['file']}")
+
+
+def export_snapshot(args):
+    """Export the job corpus to a columnar snapshot"""
+    from utils.snapshot import export_snapshot as write_snapshot
+    
+    db = create_database_manager()
+    result = write_snapshot(db, Path(args.output))
+    
+    print(f"\nExported {result['jobs']} jobs ({result['skills']} distinct skills) to {result['path']}")
+    print(f"Set JOB_SNAPSHOT_PATH={result['path']} to load it in the scorer and recommender")
+
+
+def explain_queries(args):
+    """Report which indexes the common job queries use"""
+    from utils.query_report import run_query_report
+    
+    db = create_database_manager()
+    report = run_query_report(db, slow_ms=args.slow_ms)
+    
+    print(f"\nQuery Plan Report (slow threshold: {args.slow_ms} ms):")
+    print("-" * 80)
+    for entry in report:
+        flag = "SLOW" if entry["slow"] else "ok"
+        print(f"\n[{flag}] {entry['name']}: {entry['query']}")
+        if "error" in entry:
+            print(f"   Error: {entry['error']}")
+            continue
+        print(f"   Stages: {' <- '.join(entry['stages'])}")
+        print(f"   Indexes: {', '.join(entry['indexes']) or 'none (collection scan)'}")
+        print(f"   Docs examined: {entry['docs_examined']}, keys examined: {entry['keys_examined']}, "
+              f"returned: {entry['returned']}, time: {entry['time_ms']} ms")
+
+
 def main():
     parser = argparse.ArgumentParser(description="JobLo - Intelligent Job Assistant")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -104,6 +340,47 @@ def main():
     scrape_parser.add_argument('--query', default='software engineer', help='Job search query')
     scrape_parser.add_argument('--location', default='Bangalore', help='Job location')
     scrape_parser.add_argument('--num-jobs', type=int, default=100, help='Number of jobs per platform')
+    scrape_parser.add_argument('--workers', type=int, default=SCRAPER_MAX_WORKERS, help='Platforms to scrape in parallel')
+    scrape_parser.add_argument('--full', action='store_true',
+                               help='Re-scrape every result page instead of stopping at already-known postings')
+    scrape_parser.add_argument('--enrich', action='store_true', help='Fetch full posting pages for new jobs afterwards')
+    scrape_parser.add_argument('--resume', action='store_true',
+                               help='Continue each platform from its last checkpoint instead of the first page')
+    
+    # Enrich command
+    enrich_parser = subparsers.add_parser('enrich', help='Add full descriptions and skills from posting pages')
+    enrich_parser.add_argument('--source', choices=['naukri', 'linkedin'], help='Only enrich jobs from this source')
+    enrich_parser.add_argument('--limit', type=int, help='Enrich at most this many jobs')
+    enrich_parser.add_argument('--concurrency', type=int, default=ENRICH_CONCURRENCY, help='Requests in flight')
+    
+    # Campaign command
+    campaign_parser = subparsers.add_parser('campaign', help='Scrape every query x location combination of a campaign spec')
+    campaign_parser.add_argument('spec', help='Campaign spec (JSON), e.g. config/campaign.example.json')
+    campaign_parser.add_argument('--full', action='store_true',
+                                 help='Re-scrape every result page instead of stopping at already-known postings')
+    campaign_parser.add_argument('--no-file', action='store_true', help='Only store jobs in the database')
+    campaign_parser.add_argument('--resume', action='store_true',
+                                 help='Continue interrupted combinations and skip the completed ones')
+    
+    # Replay command
+    replay_parser = subparsers.add_parser('replay', help='Re-parse archived listing pages without scraping')
+    replay_parser.add_argument('--source', choices=['naukri', 'linkedin'], help='Only replay pages of this source')
+    replay_parser.add_argument('--save', action='store_true', help='Update the stored jobs with the re-parsed ones')
+    replay_parser.add_argument('--benchmark', action='store_true', help='Measure parser throughput instead')
+    replay_parser.add_argument('--repeat', type=int, default=3, help='Benchmark runs (the best one is reported)')
+    
+    # Load command
+    load_parser = subparsers.add_parser('load', help='Load scraped JSONL files into the database')
+    load_parser.add_argument('files', nargs='+', help='Files written by scrape/campaign, e.g. data/raw/jobs_*.jsonl.gz')
+    load_parser.add_argument('--batch-size', type=int, default=500, help='Jobs per bulk write')
+    
+    # Embedding benchmark command
+    embed_parser = subparsers.add_parser('embed-bench', help='Compare embedding backends on a fixed query set')
+    embed_parser.add_argument('--backends', nargs='+', choices=EMBEDDING_BACKENDS, default=['hashing', 'openai'],
+                              help='Backends to compare; overlap is measured against openai when listed, else the first')
+    embed_parser.add_argument('--queries', default=str(DEFAULT_QUERIES_PATH), help='Query set (JSON)')
+    embed_parser.add_argument('--limit', type=int, default=1000, help='Jobs to index')
+    embed_parser.add_argument('--k', type=int, default=10, help='Results per query')
     
     # Chat command
     chat_parser = subparsers.add_parser('chat', help='Run the CLI chat interface')
@@ -119,6 +396,29 @@ def main():
     # Setup command
     setup_parser = subparsers.add_parser('setup', help='Setup database')
     
+    # Stats command
+    stats_parser = subparsers.add_parser('stats', help='Show job market statistics')
+    stats_parser.add_argument('--skill', help='Count jobs requiring this skill')
+    stats_parser.add_argument('--city', help='Count jobs in this city')
+    stats_parser.add_argument('--source', help='Count jobs from this source')
+    stats_parser.add_argument('--top', type=int, default=10, help='Number of cities/skills to list')
+    stats_parser.add_argument('--rebuild', action='store_true', help='Recompute the counters from the stored jobs first')
+    
+    # Archive command
+    archive_parser = subparsers.add_parser('archive', help='Move stale jobs to the archive')
+    archive_parser.add_argument('--days', type=int, default=JOB_ARCHIVE_AFTER_DAYS, help='Archive jobs older than this many days')
+    archive_parser.add_argument('--mode', choices=['collection', 'file'], default=JOB_ARCHIVE_MODE,
+                                help='Archive collection (queryable) or compressed JSONL files')
+    
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser('snapshot', help='Export jobs to a columnar Arrow/Parquet snapshot')
+    snapshot_parser.add_argument('--output', default=str(DEFAULT_SNAPSHOT_PATH),
+                                 help='Snapshot path (.arrow for memory-mapped loading, .parquet for compressed)')
+    
+    # Explain command
+    explain_parser = subparsers.add_parser('explain', help='Show query plans for common job searches')
+    explain_parser.add_argument('--slow-ms', type=int, default=100, help='Flag queries slower than this (ms)')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -128,6 +428,16 @@ def main():
     # Execute command
     if args.command == 'scrape':
         scrape_jobs(args)
+    elif args.command == 'campaign':
+        run_campaign(args)
+    elif args.command == 'enrich':
+        enrich_jobs(args)
+    elif args.command == 'replay':
+        replay_pages(args)
+    elif args.command == 'load':
+        load_files(args)
+    elif args.command == 'embed-bench':
+        benchmark_embedding_backends(args)
     elif args.command == 'chat':
         run_cli_chat(args)
     elif args.command == 'score':
@@ -136,6 +446,14 @@ def main():
         run_web_app(args)
     elif args.command == 'setup':
         setup_database(args)
+    elif args.command == 'stats':
+        show_stats(args)
+    elif args.command == 'archive':
+        archive_jobs(args)
+    elif args.command == 'snapshot':
+        export_snapshot(args)
+    elif args.command == 'explain':
+        explain_queries(args)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,26 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from utils.database import DatabaseManager
+from utils.base_database import BaseDatabaseManager
+from utils.database import create_database_manager
 from models.resume import Resume
 from scoring.job_scorer import JobScorer
+from utils.snapshot import load_snapshot, build_job_text, JOB_COLUMNS
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fields build_job_text reads, for corpora without a precomputed job_text
+JOB_TEXT_FIELDS = {"title": 1, "company": 1, "location": 1, "job_description": 1, "skills": 1, "experience": 1}
+
 
 class JobRecommender:
-    def __init__(self):
-        self.db = DatabaseManager()
-        self.scorer = JobScorer()
+    def __init__(self, db: Optional[BaseDatabaseManager] = None, scorer: Optional[JobScorer] = None,
+                 snapshot_path: Optional[str] = None):
+        self.db = db or create_database_manager()
+        self.scorer = scorer or JobScorer(db=self.db, snapshot_path=snapshot_path)
+        self.snapshot = load_snapshot(snapshot_path)
         self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
         
     def get_similar_jobs(self, job_id: str, num_recommendations: int = 5) -> List[Dict[str, Any]]:
@@ -25,18 +32,13 @@ class JobRecommender:
                 logger.error(f"Job not found: {job_id}")
                 return []
             
-            # Get all jobs
-            all_jobs = self.db.get_all_jobs()
-            
-            # Filter out the reference job
-            other_jobs = [job for job in all_jobs if str(job['_id']) != job_id]
+            # Texts of all other jobs; full jobs are only fetched for the top matches
+            job_ids, job_texts = self._load_job_texts(exclude_id=job_id)
             
-            if not other_jobs:
+            if not job_ids:
                 return []
             
-            # Create text representations for all jobs
             reference_text = self._create_job_text(reference_job)
-            job_texts = [self._create_job_text(job) for job in other_jobs]
             
             # Fit and transform
             all_texts = [reference_text] + job_texts
@@ -47,10 +49,13 @@ class JobRecommender:
             
             # Get top similar jobs
             top_indices = np.argsort(similarities)[::-1][:num_recommendations]
+            top_jobs = self._fetch_jobs([job_ids[idx] for idx in top_indices])
             
             recommendations = []
             for idx in top_indices:
-                job = other_jobs[idx]
+                job = top_jobs.get(job_ids[idx])
+                if job is None:
+                    continue
                 similarity_score = similarities[idx]
                 
                 recommendation = {
@@ -78,7 +83,7 @@ class JobRecommender:
             reference_score = self.scorer._calculate_job_score(resume, reference_job)
             
             # Get all jobs and score them
-            all_jobs = self.db.get_all_jobs()
+            all_jobs = self._load_jobs()
             scored_jobs = []
             
             for job in all_jobs:
@@ -123,17 +128,41 @@ class JobRecommender:
         
         return recommendations
     
+    def _load_jobs(self) -> Iterable[Dict[str, Any]]:
+        """Get the candidate corpus: the snapshot's job columns when configured, otherwise the database"""
+        if self.snapshot is not None:
+            return self.snapshot.iter_jobs(["_id"] + JOB_COLUMNS)
+        return self.db.get_all_jobs()
+
+    def _load_job_texts(self, exclude_id: str) -> Tuple[List[Any], List[str]]:
+        """Keys and similarity texts of every job but one.
+
+        Keys are snapshot row numbers when a snapshot is configured (read from
+        its _id and job_text columns only), otherwise job IDs.
+        """
+        keys, texts = [], []
+        if self.snapshot is not None:
+            for row, (stored_id, text) in enumerate(zip(self.snapshot.column("_id"), self.snapshot.column("job_text"))):
+                if stored_id != exclude_id:
+                    keys.append(row)
+                    texts.append(text)
+            return keys, texts
+        for job in self.db.iter_jobs(projection=JOB_TEXT_FIELDS):
+            if str(job['_id']) != exclude_id:
+                keys.append(str(job['_id']))
+                texts.append(self._create_job_text(job))
+        return keys, texts
+
+    def _fetch_jobs(self, keys: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """Full jobs for keys returned by _load_job_texts"""
+        if self.snapshot is not None:
+            return dict(zip(keys, self.snapshot.take(keys)))
+        return {str(job['_id']): job for job in self.db.find_jobs_by_ids(keys)}
+    
     def _create_job_text(self, job: Dict[str, Any]) -> str:
         """Create text representation of a job for similarity calculation"""
-        parts = [
-            job.get('title', ''),
-            job.get('company', ''),
-            job.get('location', ''),
-            job.get('job_description', ''),
-            ' '.join(job.get('skills', [])),
-            job.get('experience', '')
-        ]
-        return ' '.join(filter(None, parts))
+        # Snapshots carry the text precomputed at export time
+        return job.get('job_text') or build_job_text(job)
     
     def _generate_similarity_reasoning(self, reference_job: Dict[str, Any], 
                                      similar_job: Dict[str, Any], 
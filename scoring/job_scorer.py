@@ -1,7 +1,9 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Iterable
 from models.job import Job, JobScore
 from models.resume import Resume
-from utils.database import DatabaseManager
+from utils.base_database import BaseDatabaseManager
+from utils.database import create_database_manager
+from utils.snapshot import load_snapshot
 import logging
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -9,13 +11,24 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Snapshot columns read by _calculate_job_score
+SCORING_COLUMNS = ["_id", "title", "location", "experience", "skills", "job_description"]
+
 
 class JobScorer:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[BaseDatabaseManager] = None, snapshot_path: Optional[str] = None):
+        self.db = db or create_database_manager()
+        # Memory-mapped columnar corpus; None when no snapshot is configured
+        self.snapshot = load_snapshot(snapshot_path)
         self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+    
+    def load_jobs(self) -> Iterable[Dict[str, Any]]:
+        """Get the corpus to score: the snapshot's scoring columns when configured, otherwise the database"""
+        if self.snapshot is not None:
+            return self.snapshot.iter_jobs(SCORING_COLUMNS)
+        return self.db.get_all_jobs()
         
-    def score_jobs(self, resume: Resume, jobs: List[Dict[str, Any]], top_k: int = 5) -> List[JobScore]:
+    def score_jobs(self, resume: Resume, jobs: Iterable[Dict[str, Any]], top_k: int = 5) -> List[JobScore]:
         """Score all jobs against a resume and return top matches"""
         scores = []
         
@@ -189,20 +202,19 @@ class JobScorer:
         parser = ResumeParser()
         resume = parser.parse_resume(resume_path)
         
-        # Get all jobs from database
-        jobs = self.db.get_all_jobs()
+        # Score all jobs from the snapshot or database
+        scored_jobs = self.score_jobs(resume, self.load_jobs(), top_k=limit)
         
-        if not jobs:
+        if not scored_jobs:
             logger.warning("No jobs found in database")
             return []
         
-        # Score all jobs
-        scored_jobs = self.score_jobs(resume, jobs, top_k=limit)
-        
-        # Enrich with job details
+        # Enrich with job details in a single round-trip
+        hydrated = self.db.find_jobs_by_ids([job_score.job_id for job_score in scored_jobs])
+        jobs_by_id = {str(job['_id']): job for job in hydrated}
         results = []
         for job_score in scored_jobs:
-            job = self.db.find_job_by_id(job_score.job_id)
+            job = jobs_by_id.get(job_score.job_id)
             if job:
                 results.append({
                     "job": job,
@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
 from models.resume import Resume
+from utils.job_fields import SKILL_KEYWORDS
 
 # Optional imports with graceful fallback
 try:
@@ -26,32 +27,7 @@ class ResumeParser:
         
     def _load_skill_keywords(self) -> List[str]:
         """Load common skill keywords"""
-        return [
-            # Programming Languages
-            "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust", "kotlin", "swift",
-            "php", "scala", "r", "matlab", "perl", "objective-c", "dart", "lua", "julia", "fortran",
-            
-            # Web Technologies
-            "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring",
-            "asp.net", "rails", "laravel", "symfony", "jquery", "bootstrap", "tailwind", "sass", "webpack",
-            
-            # Databases
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "dynamodb",
-            "oracle", "sql server", "firebase", "neo4j", "influxdb", "couchdb",
-            
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "git", "ci/cd", "terraform",
-            "ansible", "puppet", "chef", "circleci", "travis ci", "gitlab", "bitbucket",
-            
-            # Data Science & ML
-            "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", "keras",
-            "pandas", "numpy", "matplotlib", "seaborn", "nlp", "computer vision", "opencv",
-            
-            # Other Technologies
-            "rest api", "graphql", "microservices", "agile", "scrum", "jira", "linux", "unix",
-            "security", "blockchain", "iot", "mobile development", "android", "ios", "react native",
-            "flutter", "xamarin", "unity", "unreal engine"
-        ]
+        return list(SKILL_KEYWORDS)
     
     def parse_resume(self, file_path: str) -> Resume:
         """Parse resume from file path"""
@@ -1,42 +1,262 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable, Iterator
 import logging
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from config.settings import CHROME_DRIVER_PATH
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from models.job import Job
+from config.settings import (
+    SCRAPER_MODE, HTTP_TIMEOUT, SCRAPER_WAIT_TIMEOUT, SCRAPER_SCROLL_TIMEOUT, SCRAPER_POLL_INTERVAL,
+    SCRAPER_STOP_AFTER_KNOWN, SCRAPE_CHECKPOINT_EVERY,
+)
+from .driver_pool import DriverPool, create_chrome_driver
+from .http_client import get_http_session
+from .seen_jobs import SeenJobs, job_key
+from .rate_limit import DomainRateLimiter
+from .page_archive import PageArchive
+from .telemetry import TelemetryRun, new_metrics, add_metrics, summarize_metrics
 import time
 
 logger = logging.getLogger(__name__)
 
+SCRAPER_MODES = ("auto", "http", "browser")
+
 
 class BaseScraper(ABC):
-    def __init__(self, headless: bool = True):
-        self.driver = self._setup_driver(headless)
+    source: str = ""
+
+    def __init__(self, headless: bool = True, driver: Optional[webdriver.Chrome] = None,
+                 driver_pool: Optional[DriverPool] = None, mode: str = SCRAPER_MODE,
+                 seen: Optional[SeenJobs] = None, stop_after_known: int = SCRAPER_STOP_AFTER_KNOWN,
+                 rate_limiter: Optional[DomainRateLimiter] = None, archive: Optional[PageArchive] = None,
+                 resume_from: Optional[Dict[str, Any]] = None,
+                 on_checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 checkpoint_every: int = SCRAPE_CHECKPOINT_EVERY,
+                 telemetry: Optional[TelemetryRun] = None):
+        if mode not in SCRAPER_MODES:
+            raise ValueError(f"Unknown scraper mode: {mode}")
+        self.headless = headless
+        self.mode = mode
+        self.driver_pool = driver_pool
+        # A driver borrowed from a DriverPool is returned to the pool, not quit
+        self._owns_driver = driver is None and driver_pool is None
+        self._driver = driver
+        self._pooled = None
+        self.driver_broken = False
+        self.http = get_http_session()
+        # Shared per-domain throttle when several scrapers hit the same site
+        self.rate_limiter = rate_limiter
+        # Raw copies of every listing page fetched, for offline re-parsing
+        self.archive = archive
+        self._search: Dict[str, str] = {}
+        self.pages_loaded = 0
+        self.http_pages = 0
+        # Engine that produced the last scrape ("http" or "browser")
+        self.transport: Optional[str] = None
+        # How long each browser wait actually took
+        self.waits: List[Dict[str, Any]] = []
+        # Incremental mode: postings already stored are skipped, and a long
+        # enough run of them means the rest of the results are old too
+        self.seen = seen
+        self.stop_after_known = stop_after_known
+        self.known_skipped = 0
+        self._known_streak = 0
+        # Resumable progress: next page/offset to fetch and the last posting seen,
+        # reported to on_checkpoint every checkpoint_every pages
+        self.resume_from = resume_from or {}
+        self.on_checkpoint = on_checkpoint
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.position: Optional[int] = None
+        self.last_url: Optional[str] = self.resume_from.get("last_url")
+        self.jobs_yielded = 0
+        self._pages_since_checkpoint = 0
+        # Where scrape time goes: per-page timings are added up in metrics and,
+        # with the telemetry run of the scrape, emitted as one event per page
+        self.telemetry = telemetry
+        self.metrics = new_metrics()
+        self.failures: Dict[str, int] = {}
+        self._page = new_metrics()
+        self._started: Optional[float] = None
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """The browser, launched or borrowed from the pool only when first needed"""
+        if self._driver is None:
+            if self.driver_pool:
+                self._pooled = self.driver_pool.acquire()
+                self._driver = self._pooled.driver
+            else:
+                self._driver = self._setup_driver(self.headless)
+        return self._driver
         
     def _setup_driver(self, headless: bool) -> webdriver.Chrome:
         """Setup Chrome driver with options"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        if CHROME_DRIVER_PATH:
-            service = Service(CHROME_DRIVER_PATH)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            driver = webdriver.Chrome(options=chrome_options)
-            
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        return driver
+        return create_chrome_driver(headless)
+    
+    def throttle(self, url: str):
+        """Wait for the rate limiter before requesting a page from url's domain"""
+        if self.rate_limiter:
+            self._page["throttle_s"] += self.rate_limiter.acquire(url)
+    
+    def open_page(self, url: str):
+        """Navigate to a page, counting it towards the session's page budget"""
+        self.throttle(url)
+        started = time.perf_counter()
+        self.driver.get(url)
+        self._page["load_s"] += time.perf_counter() - started
+        self.pages_loaded += 1
+    
+    def fetch(self, url: str, params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None, as_json: bool = False):
+        """GET a page over the pooled HTTP session"""
+        self.throttle(url)
+        started = time.perf_counter()
+        response = self.http.get(url, params=params, headers=headers, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        self._page["load_s"] += time.perf_counter() - started
+        self.http_pages += 1
+        self.archive_page(response.text, "json" if as_json else "html", response.url)
+        return response.json() if as_json else response.text
+    
+    def page_source(self, archive_url: Optional[str] = None) -> str:
+        """HTML of the page currently loaded in the browser, archived under archive_url if given"""
+        started = time.perf_counter()
+        source = self.driver.page_source
+        self._page["load_s"] += time.perf_counter() - started
+        if archive_url:
+            self.archive_page(source, "html", archive_url)
+        return source
+    
+    def archive_page(self, content: str, kind: str, url: Optional[str] = None):
+        """Keep a raw copy of a fetched page; archiving problems never fail a scrape"""
+        if not self.archive:
+            return
+        try:
+            self.archive.store(content, self.source, kind, url, **self._search)
+        except Exception as e:
+            logger.warning(f"Could not archive {self.source} page {url}: {e}")
+    
+    def iter_jobs(self, search_query: str, location: str, num_jobs: int = 100) -> Iterator[Job]:
+        """Yield jobs as they are parsed, over plain HTTP where possible, falling back to the browser.
+
+        The browser is only tried when HTTP produced nothing at all, so jobs
+        already handed to the caller are never scraped twice.
+        """
+        self._search = {"query": search_query, "location": location}
+        self._started = time.monotonic()
+        if self.mode in ("auto", "http"):
+            self.transport = "http"
+            yielded = 0
+            try:
+                for job in self.scrape_jobs_http(search_query, location, num_jobs):
+                    yielded += 1
+                    self.jobs_yielded += 1
+                    yield job
+                # Only known postings is a successful (if empty) incremental scrape
+                if yielded or self.known_skipped or self.mode == "http":
+                    return
+                logger.info(f"No {self.source} jobs over HTTP, falling back to the browser")
+            except Exception as e:
+                if self.mode == "http" or yielded:
+                    raise
+                self.record_failure(e, "http")
+                logger.warning(f"HTTP scraping of {self.source} failed ({e}), falling back to the browser")
+        self.transport = "browser"
+        for job in self.scrape_jobs_browser(search_query, location, num_jobs):
+            self.jobs_yielded += 1
+            yield job
+    
+    def scrape_jobs(self, search_query: str, location: str, num_jobs: int = 100) -> List[Job]:
+        """Scrape jobs over plain HTTP where possible, falling back to the browser"""
+        return list(self.iter_jobs(search_query, location, num_jobs))
+    
+    def parse_card(self, card, parse: Optional[Callable[[Any], Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Parse a result card (with parse_job_details by default), timed towards the page's parse phase"""
+        started = time.perf_counter()
+        try:
+            return (parse or self.parse_job_details)(card)
+        finally:
+            self._page["parse_s"] += time.perf_counter() - started
+            self._page["parsed"] += 1
+    
+    def record_page(self, cards: int):
+        """Close the current listing page's metrics once its cards are handled"""
+        page = self._page
+        page.update(pages=1, cards=cards, jobs=self.jobs_yielded - self.metrics["jobs"],
+                    known=self.known_skipped - self.metrics["known"])
+        add_metrics(self.metrics, page)
+        self._page = new_metrics()
+        if self.telemetry:
+            self.telemetry.emit("page", source=self.source, transport=self.transport, position=self.position,
+                                **{key: round(value, 4) if isinstance(value, float) else value
+                                   for key, value in page.items() if key != "pages"})
+    
+    def record_failure(self, error: Exception, phase: str):
+        """Count a failure by exception type"""
+        name = type(error).__name__
+        self.failures[name] = self.failures.get(name, 0) + 1
+        if self.telemetry:
+            self.telemetry.emit("failure", source=self.source, transport=self.transport, phase=phase,
+                                error=name, message=str(error)[:200])
+    
+    def telemetry_summary(self) -> Dict[str, Any]:
+        """Totals for this scrape: time per phase, cards/s, failures by type"""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        # Jobs and time after the last completed page (e.g. a page cut short by an error)
+        metrics = dict(self.metrics)
+        add_metrics(metrics, {key: value for key, value in self._page.items() if key.endswith("_s")})
+        metrics["jobs"] = self.jobs_yielded
+        metrics["known"] = self.known_skipped
+        return {**summarize_metrics(metrics, elapsed), "failures": dict(self.failures)}
+    
+    def resume_position(self, default: int) -> int:
+        """Page or offset to start at: the checkpointed one when resuming"""
+        return self.resume_from.get("position") or default
+    
+    def checkpoint(self, position: int):
+        """Record that everything before position (next page or offset) was handed out"""
+        self.position = position
+        self._pages_since_checkpoint += 1
+        if self.on_checkpoint and self._pages_since_checkpoint >= self.checkpoint_every:
+            self._pages_since_checkpoint = 0
+            self.on_checkpoint(self.checkpoint_state())
+    
+    def checkpoint_state(self) -> Dict[str, Any]:
+        return {
+            "position": self.position,
+            "last_url": self.last_url,
+            "jobs": self.resume_from.get("jobs", 0) + self.jobs_yielded,
+            "transport": self.transport,
+        }
+    
+    def is_known(self, job: Dict[str, Any]) -> bool:
+        """Check a card's identity against the seen-set before it is parsed"""
+        self.last_url = job.get("url") or self.last_url
+        if self.seen is None:
+            return False
+        key = job_key({"source": self.source, **job})
+        if key is None:
+            return False
+        if self.seen.add(key):
+            self._known_streak = 0
+            return False
+        self._known_streak += 1
+        self.known_skipped += 1
+        return True
+    
+    @property
+    def reached_known(self) -> bool:
+        """Whether enough consecutive known postings were seen to stop paginating"""
+        return bool(self.seen is not None and self.stop_after_known
+                    and self._known_streak >= self.stop_after_known)
+    
+    @abstractmethod
+    def scrape_jobs_http(self, search_query: str, location: str, num_jobs: int = 100) -> Iterator[Job]:
+        """Yield jobs from the platform's listing pages or JSON endpoints without a browser"""
+        pass
     
     @abstractmethod
-    def scrape_jobs(self, search_query: str, location: str, num_jobs: int = 100) -> List[Dict[str, Any]]:
-        """Scrape jobs from the platform"""
+    def scrape_jobs_browser(self, search_query: str, location: str, num_jobs: int = 100) -> Iterator[Job]:
+        """Yield jobs by driving the platform's pages in a browser"""
         pass
     
     @abstractmethod
@@ -44,18 +264,99 @@ class BaseScraper(ABC):
         """Parse individual job details"""
         pass
     
-    def scroll_page(self, pause_time: float = 2):
-        """Scroll down the page to load more content"""
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+    def detail_url(self, job: Dict[str, Any]) -> Optional[str]:
+        """URL of a stored job's full posting, for sources that have enrichment"""
+        return None
+    
+    def parse_detail_page(self, content: str) -> Dict[str, Any]:
+        """Fields to add to a job from its posting page"""
+        return {}
+    
+    @abstractmethod
+    def parse_page(self, content: str, kind: str = "html") -> List[Dict[str, Any]]:
+        """Parse every job on an archived listing page ("html" or "json")"""
+        pass
+    
+    def wait_until(self, condition: Callable[[], Any], timeout: float = SCRAPER_WAIT_TIMEOUT,
+                   label: str = "wait", poll_interval: float = SCRAPER_POLL_INTERVAL):
+        """Poll condition until it returns something truthy, recording how long it took.
+
+        Raises TimeoutException when nothing arrives within timeout. WebDriver
+        errors raised by the condition (element missing or stale) count as
+        "not yet".
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            try:
+                result = condition()
+            except WebDriverException:
+                result = None
+            if result or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+        
+        seconds = time.monotonic() - started
+        self._page["wait_s"] += seconds
+        self.waits.append({
+            "label": label,
+            "seconds": round(seconds, 3),
+            "satisfied": bool(result),
+        })
+        if not result:
+            raise TimeoutException(f"{label}: nothing after {timeout}s")
+        return result
+    
+    def wait_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Count, total/max seconds and timeouts per wait label"""
+        summary = {}
+        for wait in self.waits:
+            entry = summary.setdefault(wait["label"], {"count": 0, "total_s": 0.0, "max_s": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["total_s"] = round(entry["total_s"] + wait["seconds"], 3)
+            entry["max_s"] = max(entry["max_s"], wait["seconds"])
+            entry["timeouts"] += not wait["satisfied"]
+        return summary
+    
+    def _content_size(self, card_selector: Optional[str] = None) -> List[int]:
+        """Page height and number of result cards, in a single round-trip"""
+        return self.driver.execute_script(
+            "return [document.body.scrollHeight, arguments[0] ? document.querySelectorAll(arguments[0]).length : 0];",
+            card_selector
+        )
+    
+    def wait_for_more_content(self, previous: List[int], card_selector: Optional[str] = None,
+                              timeout: float = SCRAPER_SCROLL_TIMEOUT, label: str = "scroll") -> Optional[List[int]]:
+        """Wait until the page grows past previous; None when nothing new arrived within timeout"""
+        def grown():
+            size = self._content_size(card_selector)
+            return size if size != previous else None
+        try:
+            return self.wait_until(grown, timeout=timeout, label=label)
+        except TimeoutException:
+            return None
+    
+    def scroll_page(self, card_selector: Optional[str] = None, timeout: float = SCRAPER_SCROLL_TIMEOUT):
+        """Scroll down until new content stops arriving.
+
+        Each scroll returns as soon as the page height or the number of cards
+        changes, rather than after a fixed pause.
+        """
+        size = self._content_size(card_selector)
         while True:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause_time)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            size = self.wait_for_more_content(size, card_selector, timeout)
+            if size is None:
                 break
-            last_height = new_height
     
     def close(self):
-        """Close the driver"""
-        if self.driver:
-            self.driver.quit()
\ No newline at end of file
+        """Close the driver, or hand a pooled one back to the pool"""
+        if self._pooled:
+            self._pooled.pages += self.pages_loaded
+            self._pooled.broken = self._pooled.broken or self.driver_broken
+            self.driver_pool.release(self._pooled)
+            self._pooled = None
+            self._driver = None
+        elif self._driver and self._owns_driver:
+            self._driver.quit()
+            self._driver = None
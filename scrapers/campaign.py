@@ -0,0 +1,245 @@
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from .scraper_manager import ScraperManager, SCRAPERS
+from .pipeline import ScrapePipeline
+from .rate_limit import DomainRateLimiter
+from .seen_jobs import SeenJobs
+from .telemetry import TelemetryRun
+from utils.jsonl_files import jsonl_path
+from config.settings import (
+    RAW_DATA_DIR, SCRAPER_STOP_AFTER_KNOWN, CAMPAIGN_MAX_CONCURRENCY, CAMPAIGN_MAX_RETRIES,
+    CAMPAIGN_RETRY_BACKOFF,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Campaign:
+    """A set of query x location combinations scraped in one run.
+
+    Loaded from a JSON spec:
+
+        {
+          "name": "nightly",
+          "queries": ["python developer", "data engineer"],
+          "locations": ["Bangalore", "Pune"],
+          "limits": {"naukri": 100, "linkedin": 50},
+          "max_concurrency": 4,
+          "retries": 2,
+          "rate_limits": {"naukri.com": {"rate": 1, "burst": 3}},
+          "incremental": true
+        }
+
+    limits is the number of jobs per combination for each source; only the
+    sources listed are scraped.
+    """
+
+    def __init__(self, queries: List[str], locations: List[str], limits: Dict[str, int],
+                 name: str = "campaign", max_concurrency: int = CAMPAIGN_MAX_CONCURRENCY,
+                 retries: int = CAMPAIGN_MAX_RETRIES, rate_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+                 incremental: bool = True):
+        if not queries or not locations:
+            raise ValueError("A campaign needs at least one query and one location")
+        unknown = [source for source in limits if source not in SCRAPERS]
+        if unknown:
+            raise ValueError(f"Unknown sources in campaign limits: {', '.join(unknown)}")
+        if not any(limit > 0 for limit in limits.values()):
+            raise ValueError("A campaign needs a positive job limit for at least one source")
+        self.name = name
+        self.queries = queries
+        self.locations = locations
+        self.limits = limits
+        self.max_concurrency = max(1, max_concurrency)
+        self.retries = max(0, retries)
+        self.rate_limits = rate_limits or {}
+        self.incremental = incremental
+
+    @classmethod
+    def from_file(cls, path: Path) -> "Campaign":
+        """Load a campaign spec from a JSON file"""
+        path = Path(path)
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+        spec.setdefault("name", path.stem)
+        return cls(**spec)
+
+    def tasks(self) -> List[Tuple[str, str, str, int]]:
+        """Every (query, location, source, limit) to scrape"""
+        return [(query, location, source, limit)
+                for query, location in product(self.queries, self.locations)
+                for source, limit in self.limits.items() if limit > 0]
+
+
+class CampaignScheduler:
+    """Runs a campaign's combinations concurrently through a ScraperManager.
+
+    At most max_concurrency combinations run at once, requests to each
+    domain go through a shared token bucket, failed combinations are
+    retried with exponential backoff, and postings already returned by
+    another combination are skipped, so overlapping result pages are only
+    stored once.
+    """
+
+    def __init__(self, campaign: Campaign, manager: Optional[ScraperManager] = None,
+                 retry_backoff: float = CAMPAIGN_RETRY_BACKOFF):
+        self.campaign = campaign
+        self.manager = manager or ScraperManager(platforms=list(campaign.limits))
+        self.retry_backoff = retry_backoff
+        self.rate_limiter = DomainRateLimiter(campaign.rate_limits)
+        self._progress_lock = threading.Lock()
+        self._done = 0
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter so retries do not hit the site in lockstep"""
+        return self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def _checkpointed_jobs(self, source: str, query: str, location: str) -> int:
+        checkpoint = self.manager.checkpoints.get(source, query, location) or {}
+        return checkpoint.get("jobs", 0)
+
+    @staticmethod
+    def _retry_budget(limit: int, scraped: int, checkpointed: int) -> int:
+        """num_jobs for a retry that resumes from a checkpoint recording checkpointed jobs.
+
+        scrape_platform takes the checkpoint's jobs off num_jobs, but jobs
+        scraped after that checkpoint are stored too and come back as known,
+        so the budget is what the combination still needs plus the checkpoint.
+        """
+        return max(0, limit - scraped) + checkpointed
+
+    def _run_task(self, task: Tuple[str, str, str, int], seen: SeenJobs, pipeline: ScrapePipeline,
+                  total: int, resume: bool = False, run: Optional[TelemetryRun] = None) -> Dict[str, Any]:
+        query, location, source, limit = task
+        started = time.monotonic()
+        result = {"query": query, "location": location, "source": source, "status": "failed",
+                  "jobs": 0, "skipped": 0, "pages": 0, "attempts": 0, "transport": None, "error": None}
+        # Not incremental: skip cross-combination duplicates but never stop early on them
+        stop_after_known = SCRAPER_STOP_AFTER_KNOWN if self.campaign.incremental else 0
+
+        # Jobs a resumed combination already had from an earlier run
+        resumed_jobs = 0
+
+        for attempt in range(self.campaign.retries + 1):
+            num_jobs = limit
+            if attempt:
+                delay = self._backoff(attempt - 1)
+                logger.info(f"Retrying {source} '{query}' in {location} in {delay:.1f}s "
+                            f"(attempt {attempt + 1})")
+                # Settle the failed attempt's queued checkpoint, which is the one the retry resumes from
+                pipeline.flush()
+                time.sleep(delay)
+                num_jobs = self._retry_budget(limit, resumed_jobs + result["jobs"],
+                                              self._checkpointed_jobs(source, query, location))
+            # Jobs stored by a failed attempt come back as known; let a retry skip past them
+            stop = stop_after_known + result["jobs"] if stop_after_known else 0
+            report = self.manager.scrape_platform(source, query, location, num_jobs, seen,
+                                                  pipeline=pipeline, rate_limiter=self.rate_limiter,
+                                                  stop_after_known=stop, resume=resume or attempt > 0, run=run)
+            if attempt == 0 and report["checkpoint"]:
+                resumed_jobs = report["checkpoint"].get("jobs", 0)
+            result["attempts"] += 1
+            result["jobs"] += report["count"]
+            result["skipped"] += report["known_skipped"]
+            result["pages"] += report["pages"]
+            result["transport"] = report["transport"]
+            result["error"] = report["error"]
+            if report["status"] == "ok" or resumed_jobs + result["jobs"] >= limit:
+                result["status"] = "ok"
+                break
+
+        result["duration_s"] = round(time.monotonic() - started, 1)
+        with self._progress_lock:
+            self._done += 1
+            logger.info(f"[{self._done}/{total}] {source} '{query}' in {location}: {result['status']}, "
+                        f"{result['jobs']} jobs, {result['skipped']} skipped, {result['attempts']} attempt(s)")
+        return result
+
+    def run(self, save_to_db: bool = True, save_to_file: bool = True, resume: bool = False) -> Dict[str, Any]:
+        """Scrape every combination and return a throughput summary.
+
+        With resume, combinations continue from their checkpoints and the ones
+        a previous run completed are skipped.
+        """
+        campaign = self.campaign
+        tasks = campaign.tasks()
+        logger.info(f"Starting campaign '{campaign.name}': {len(tasks)} combinations, "
+                    f"concurrency {campaign.max_concurrency}")
+        self._done = 0
+        run = self.manager.telemetry.start_run(campaign=campaign.name,
+                                               combinations=len(tasks)) if self.manager.telemetry else None
+        try:
+            return self._run(tasks, save_to_db, save_to_file, resume, run)
+        finally:
+            if run:
+                run.close()
+
+    def _run(self, tasks: List[Tuple[str, str, str, int]], save_to_db: bool, save_to_file: bool,
+             resume: bool, run: Optional[TelemetryRun]) -> Dict[str, Any]:
+        campaign = self.campaign
+        started = time.monotonic()
+
+        # One seen-set for the whole campaign: stored postings (when incremental)
+        # plus everything any combination has returned so far
+        seen = SeenJobs.from_database(self.manager.db) if campaign.incremental else SeenJobs()
+
+        output_path = None
+        if save_to_file:
+            output_path = jsonl_path(RAW_DATA_DIR, f"campaign_{campaign.name}_{datetime.now():%Y%m%d_%H%M%S}")
+        pipeline = ScrapePipeline(db=self.manager.db if save_to_db else None, jsonl_path=output_path)
+
+        results = []
+        with pipeline:
+            with ThreadPoolExecutor(max_workers=campaign.max_concurrency, thread_name_prefix="campaign") as executor:
+                futures = [executor.submit(self._run_task, task, seen, pipeline, len(tasks), resume, run)
+                           for task in tasks]
+                for future in as_completed(futures):
+                    results.append(future.result())
+        elapsed = time.monotonic() - started
+
+        summary = self._summarize(results, elapsed)
+        summary["pipeline"] = {key: pipeline.stats[key] for key in ("written", "batches", "db_errors")}
+        if save_to_db:
+            summary["new_in_db"] = sum(counts["inserted"] for counts in pipeline.stats["by_source"].values())
+            archived = self.manager.archive_stale_jobs()
+            if archived is not None:
+                summary["archived"] = archived
+        if save_to_file:
+            summary["json_file"] = str(output_path)
+        return summary
+
+    def _summarize(self, results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        by_source = {}
+        for result in results:
+            entry = by_source.setdefault(result["source"], {"combinations": 0, "failed": 0, "jobs": 0,
+                                                            "skipped": 0, "pages": 0})
+            entry["combinations"] += 1
+            entry["failed"] += result["status"] != "ok"
+            for key in ("jobs", "skipped", "pages"):
+                entry[key] += result[key]
+
+        jobs = sum(result["jobs"] for result in results)
+        pages = sum(result["pages"] for result in results)
+        return {
+            "name": self.campaign.name,
+            "combinations": len(results),
+            "succeeded": sum(result["status"] == "ok" for result in results),
+            "failed": [{key: result[key] for key in ("query", "location", "source", "error")}
+                       for result in results if result["status"] != "ok"],
+            "retries": sum(result["attempts"] - 1 for result in results),
+            "jobs": jobs,
+            "skipped": sum(result["skipped"] for result in results),
+            "pages": pages,
+            "elapsed_s": round(elapsed, 1),
+            "jobs_per_min": round(jobs / elapsed * 60, 1) if elapsed else 0.0,
+            "pages_per_s": round(pages / elapsed, 2) if elapsed else 0.0,
+            "by_source": by_source,
+            "rate_limits": self.rate_limiter.stats(),
+        }
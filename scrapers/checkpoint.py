@@ -0,0 +1,66 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+from config.settings import SCRAPE_CHECKPOINT_PATH
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """Progress of each (platform, query, location) scrape, kept in a small JSON file.
+
+    A checkpoint records the next page or result offset to fetch, the last
+    posting URL seen and how many jobs were stored so far, so an interrupted
+    scrape can continue where it stopped instead of starting from page 1.
+    """
+
+    def __init__(self, path: Path = SCRAPE_CHECKPOINT_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(platform: str, query: str, location: str) -> str:
+        return "|".join([platform, query.strip().lower(), location.strip().lower()])
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint file {self.path}: {e}")
+            return {}
+
+    def _write(self, checkpoints: Dict[str, Dict[str, Any]]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a half-written file
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoints, f, indent=2, default=str)
+        tmp_path.replace(self.path)
+
+    def get(self, platform: str, query: str, location: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read().get(self.key(platform, query, location))
+
+    def save(self, platform: str, query: str, location: str, state: Dict[str, Any]):
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[self.key(platform, query, location)] = {
+                "platform": platform,
+                "query": query,
+                "location": location,
+                **state,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._write(checkpoints)
+
+    def clear(self, platform: str, query: str, location: str):
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(self.key(platform, query, location), None) is not None:
+                self._write(checkpoints)
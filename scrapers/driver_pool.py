@@ -0,0 +1,226 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from config.settings import CHROME_DRIVER_PATH, DRIVER_POOL_SIZE, DRIVER_MAX_PAGES
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_chrome_driver(headless: bool = True) -> webdriver.Chrome:
+    """Launch a Chrome driver with the scraping options"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if CHROME_DRIVER_PATH:
+        service = Service(CHROME_DRIVER_PATH)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    else:
+        driver = webdriver.Chrome(options=chrome_options)
+
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class PooledDriver:
+    """A browser session checked out of a DriverPool"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.checked_out_at = self.created_at
+        self.broken = False
+
+
+class DriverPool:
+    """Keeps warm headless browser sessions alive across scraping jobs.
+
+    Sessions are cleaned (cookies, storage, blank page) when they are returned
+    and replaced once they have loaded max_pages pages or crashed, so a
+    long-running process neither pays browser startup per scrape nor
+    accumulates leaky browsers.
+    """
+
+    def __init__(self, size: int = DRIVER_POOL_SIZE, max_pages: int = DRIVER_MAX_PAGES,
+                 headless: bool = True):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.headless = headless
+        self._idle: List[PooledDriver] = []
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._started = time.monotonic()
+        self._metrics = {
+            "created": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "acquired": 0,
+            "wait_s": 0.0,
+            "busy_s": 0.0,
+        }
+
+    def warm_up(self, count: Optional[int] = None):
+        """Launch sessions ahead of time so the first scrape does not wait for Chrome"""
+        sessions = [self.acquire() for _ in range(min(count or self.size, self.size))]
+        for session in sessions:
+            self.release(session)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Check out a session, launching one if the pool is not full yet"""
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    session = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    # Reserve the slot, then launch the browser outside the lock
+                    self._open += 1
+                    session = None
+                    break
+                if not self._condition.wait(timeout):
+                    raise TimeoutError(f"No browser session available after {timeout}s")
+            self._metrics["wait_s"] += time.monotonic() - started
+            self._metrics["acquired"] += 1
+
+        if session is None:
+            try:
+                session = PooledDriver(create_chrome_driver(self.headless))
+            except Exception:
+                with self._condition:
+                    self._open -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._metrics["created"] += 1
+
+        session.uses += 1
+        session.checked_out_at = time.monotonic()
+        return session
+
+    def release(self, session: PooledDriver):
+        """Return a session, resetting it or replacing it when it is worn out or broken"""
+        worn_out = bool(self.max_pages) and session.pages >= self.max_pages
+        recycle = session.broken or worn_out or self._closed
+        if not recycle:
+            try:
+                self._reset(session.driver)
+            except WebDriverException as e:
+                logger.warning(f"Browser session failed to reset, replacing it: {e}")
+                session.broken = True
+                recycle = True
+
+        with self._condition:
+            self._metrics["busy_s"] += time.monotonic() - session.checked_out_at
+            # The pool may have been closed while the reset was running
+            recycle = recycle or self._closed
+            if recycle:
+                self._open -= 1
+                if session.broken:
+                    self._metrics["crashed"] += 1
+                elif worn_out:
+                    self._metrics["recycled"] += 1
+            else:
+                self._idle.append(session)
+            self._condition.notify()
+
+        if recycle:
+            self._quit(session.driver)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[PooledDriver]:
+        """Borrow a session for the duration of a with block.
+
+        An exception escaping the block marks the session as broken so the
+        browser is replaced rather than handed to the next scraper.
+        """
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except WebDriverException:
+            session.broken = True
+            raise
+        finally:
+            self.release(session)
+
+    @staticmethod
+    def _reset(driver: webdriver.Chrome):
+        """Clear cookies and page state left behind by the previous scrape"""
+        driver.delete_all_cookies()
+        # Storage is not accessible on some pages (e.g. about:blank after a failed load)
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.get("about:blank")
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser session: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, current usage and lifetime utilization"""
+        with self._condition:
+            in_use = self._open - len(self._idle)
+            elapsed = time.monotonic() - self._started
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": in_use,
+                "utilization": round(self._metrics["busy_s"] / (elapsed * self.size), 3) if elapsed else 0.0,
+                **{key: round(value, 2) if isinstance(value, float) else value
+                   for key, value in self._metrics.items()},
+            }
+
+    def close(self):
+        """Quit every idle session; sessions still checked out are quit on release"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for session in idle:
+            self._quit(session.driver)
+
+
+_pool: Optional[DriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """Return the process-wide driver pool shared by every ScraperManager"""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = DriverPool()
+        return _pool
+
+
+def close_driver_pool():
+    """Quit the shared pool's browsers"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+atexit.register(close_driver_pool)
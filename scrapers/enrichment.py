@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from .scraper_manager import SCRAPERS
+from .http_client import get_http_session
+from .rate_limit import DomainRateLimiter
+from utils.base_database import BaseDatabaseManager
+from utils.database import create_database_manager
+from config.settings import HTTP_TIMEOUT, DOMAIN_BURST, ENRICH_CONCURRENCY, ENRICH_RATE_LIMIT, ENRICH_MAX_ATTEMPTS
+import logging
+
+logger = logging.getLogger(__name__)
+
+ENRICH_FIELDS = {"url": 1, "source": 1, "skills": 1, "enrich_attempts": 1}
+
+
+class JobEnricher:
+    """Completes stored jobs from their full posting pages.
+
+    Posting pages are fetched by a pool of concurrency threads, over the
+    shared keep-alive HTTP session and behind a per-domain rate limit. Each job is marked with enriched_at as soon as it is updated, so
+    an interrupted run resumes with the jobs that are still missing; jobs
+    whose page keeps failing are given up after max_attempts.
+    """
+
+    def __init__(self, db: Optional[BaseDatabaseManager] = None, concurrency: int = ENRICH_CONCURRENCY,
+                 rate_limit: float = ENRICH_RATE_LIMIT, max_attempts: int = ENRICH_MAX_ATTEMPTS):
+        self.db = db or create_database_manager()
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max_attempts
+        self.rate_limiter = DomainRateLimiter(default_rate=rate_limit, default_burst=DOMAIN_BURST)
+        self.http = get_http_session()
+        self.parsers = {source: scraper_class() for source, scraper_class in SCRAPERS.items()}
+
+    def pending_jobs(self, sources: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Jobs not enriched yet that have a posting page and attempts left"""
+        pending = []
+        for source in sources or list(self.parsers):
+            parser = self.parsers[source]
+            for job in self.db.iter_jobs({"source": source, "enriched_at": None}, projection=ENRICH_FIELDS):
+                if (job.get("enrich_attempts") or 0) >= self.max_attempts or not parser.detail_url(job):
+                    continue
+                pending.append(job)
+                if limit and len(pending) >= limit:
+                    return pending
+        return pending
+
+    def _fetch(self, url: str) -> str:
+        self.rate_limiter.acquire(url)
+        response = self.http.get(url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    def _enrich(self, job: Dict[str, Any]) -> Dict[str, bool]:
+        """Fetch, parse and store one job's posting page, on a worker thread"""
+        parser = self.parsers[job["source"]]
+        url = parser.detail_url(job)
+        fetched = False
+        try:
+            content = self._fetch(url)
+            fetched = True
+            details = parser.parse_detail_page(content)
+        except Exception as e:
+            logger.warning(f"Could not fetch posting page {url}: {e}")
+            details = None
+
+        if not details:
+            update = {"enrich_attempts": (job.get("enrich_attempts") or 0) + 1}
+        else:
+            # Keep skills the listing already had; the page adds the ones in the description
+            skills = list(job.get("skills") or [])
+            known = {skill.lower() for skill in skills}
+            skills += [skill for skill in details.get("skills", []) if skill.lower() not in known]
+            update = {**details, "skills": skills, "enriched_at": datetime.now()}
+        self.db.update_job(str(job["_id"]), update)
+        return {"fetched": fetched, "enriched": bool(details)}
+
+    def run(self, sources: Optional[List[str]] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Enrich every pending job and report throughput"""
+        jobs = self.pending_jobs(sources, limit)
+        logger.info(f"Enriching {len(jobs)} jobs with up to {self.concurrency} requests in flight")
+        stats = {"jobs": len(jobs), "enriched": 0, "failed": 0, "pages": 0}
+        started = time.monotonic()
+
+        # Fetches and database writes both block, so each job runs start to finish on a worker thread
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="enrich") as executor:
+            futures = [executor.submit(self._enrich, job) for job in jobs]
+            for future in as_completed(futures):
+                outcome = future.result()
+                stats["pages"] += outcome["fetched"]
+                stats["enriched" if outcome["enriched"] else "failed"] += 1
+
+        elapsed = time.monotonic() - started
+        stats["elapsed_s"] = round(elapsed, 1)
+        stats["pages_per_s"] = round(stats["pages"] / elapsed, 2) if elapsed else 0.0
+        stats["rate_limits"] = self.rate_limiter.stats()
+        return stats
@@ -0,0 +1,77 @@
+from typing import List, Optional
+from lxml import html
+
+
+def parse_html(markup: str):
+    """Parse an HTML page or fragment into an lxml tree"""
+    return html.fromstring(markup)
+
+
+def class_xpath(class_name: str, tag: str = "*") -> str:
+    """Relative XPath matching elements that carry a CSS class"""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def first(element, xpath: str):
+    matches = element.xpath(xpath)
+    return matches[0] if matches else None
+
+
+def text_of(element) -> str:
+    """Visible text of an element with whitespace collapsed"""
+    if element is None:
+        return ""
+    return " ".join(element.text_content().split())
+
+
+BLOCK_TAGS = {"p", "div", "li", "ul", "ol", "br", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "section"}
+
+
+def _block_parts(element, parts: List[str]):
+    block = element.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        _block_parts(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block:
+        parts.append("\n")
+
+
+def block_text(element) -> str:
+    """Text of an element with one line per block (paragraph, list item, ...)"""
+    if element is None:
+        return ""
+    parts = []
+    _block_parts(element, parts)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def first_text(element, xpath: str, default: Optional[str] = "") -> Optional[str]:
+    match = first(element, xpath)
+    return text_of(match) if match is not None else default
+
+
+def first_attr(element, xpath: str, attribute: str, default: Optional[str] = None) -> Optional[str]:
+    match = first(element, xpath)
+    return match.get(attribute, default) if match is not None else default
+
+
+def all_texts(element, xpath: str) -> List[str]:
+    return [text for text in (text_of(match) for match in element.xpath(xpath)) if text]
+
+
+def canonical_url(url: Optional[str]) -> str:
+    """Posting URL without the per-request tracking query string"""
+    return (url or "").split("?", 1)[0].split("#", 1)[0]
+
+
+def strip_tags(markup: str) -> str:
+    """Plain text of an HTML snippet"""
+    if not markup:
+        return ""
+    return text_of(html.fragment_fromstring(markup, create_parent="div"))
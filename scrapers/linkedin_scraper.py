@@ -1,127 +1,250 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from .base_scraper import BaseScraper
+from .html_parsing import parse_html, class_xpath, first, block_text, first_text, first_attr, all_texts, canonical_url
 from models.job import Job
+from config.settings import LINKEDIN_BASE_URL
+from utils.job_fields import extract_skills
 import logging
-import time
 import re
 
 logger = logging.getLogger(__name__)
 
+CARD_SELECTOR = "div.base-card"
+
+# Guest endpoint that serves the public search page's result cards as HTML fragments
+GUEST_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+# Guest endpoint that serves a posting's full description
+GUEST_POSTING_PATH = "/jobs-guest/jobs/api/jobPosting"
+
+
+def _classify_job_info(job_info: List[str]):
+    """Pick the experience level and job type out of a card's metadata items"""
+    experience = "Not specified"
+    job_type = None
+    for info in job_info:
+        if "years" in info.lower() or "entry" in info.lower() or "senior" in info.lower():
+            experience = info
+        elif any(t in info.lower() for t in ["full-time", "part-time", "contract", "internship"]):
+            job_type = info
+    return experience, job_type
+
+
+def _parse_card_date(posted_text: str):
+    try:
+        return datetime.fromisoformat(posted_text.replace('Z', '+00:00')) if posted_text else None
+    except ValueError:
+        return None
+
+
+def card_url(card) -> str:
+    """Canonical posting URL of a result card, cheap enough to check before parsing"""
+    return canonical_url(first_attr(card, class_xpath("base-card__full-link", "a"), "href"))
+
+
+def parse_job_card(card) -> Dict[str, Any]:
+    """Parse a LinkedIn result card from an lxml element"""
+    title = first_text(card, class_xpath("base-search-card__title", "h3"))
+    company = first_text(card, class_xpath("base-search-card__subtitle", "h4"))
+    location = first_text(card, class_xpath("job-search-card__location", "span"))
+    url = card_url(card)
+    if not title or not url:
+        return None
+    
+    experience, job_type = _classify_job_info(all_texts(card, class_xpath("job-search-card__list-item", "li")))
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "experience": experience,
+        # Cards carry neither; the enrichment stage fills them from the posting page
+        "skills": [],
+        "job_description": "",
+        "posted_date": _parse_card_date(first_attr(card, ".//time", "datetime")),
+        "url": url,
+        "job_type": job_type
+    }
+
+
+def parse_job_cards(markup: str) -> List[Dict[str, Any]]:
+    """Parse every result card in a search page or guest API fragment"""
+    if not markup or not markup.strip():
+        return []
+    return [job for job in (parse_job_card(card) for card in _result_cards(parse_html(markup))) if job]
+
+
+def _result_cards(tree) -> List[Any]:
+    cards = tree.xpath(class_xpath("base-card", "div"))
+    if tree.tag == "div" and "base-card" in (tree.get("class") or "").split():
+        cards = [tree] + cards
+    return cards
+
 
 class LinkedInScraper(BaseScraper):
-    def __init__(self, headless: bool = True):
-        super().__init__(headless)
-        self.base_url = "https://www.linkedin.com/jobs/search"
+    source = "linkedin"
+
+    def __init__(self, headless: bool = True, driver=None, base_url: Optional[str] = None, **kwargs):
+        super().__init__(headless, driver, **kwargs)
+        site = (base_url or LINKEDIN_BASE_URL).rstrip("/")
+        self.base_url = f"{site}/jobs/search"
+        self.guest_search_url = f"{site}{GUEST_SEARCH_PATH}"
+        self.guest_posting_url = f"{site}{GUEST_POSTING_PATH}"
+    
+    def scrape_jobs_http(self, search_query: str = "software engineer", location: str = "Bangalore", num_jobs: int = 100) -> Iterator[Job]:
+        """Scrape jobs from LinkedIn's public guest search endpoint"""
+        scraped = 0
+        start = self.resume_position(0)
+        while scraped < num_jobs:
+            markup = self.fetch(self.guest_search_url, params={
+                "keywords": search_query,
+                "location": location,
+                "start": start,
+            })
+            tree = parse_html(markup) if markup and markup.strip() else None
+            cards = _result_cards(tree) if tree is not None else []
+            if not cards:
+                break
+            for card in cards:
+                if scraped >= num_jobs or self.reached_known:
+                    break
+                if self.is_known({"url": card_url(card)}):
+                    continue
+                try:
+                    job_data = self.parse_card(card)
+                    if not job_data:
+                        continue
+                    job = Job(**job_data, source="linkedin")
+                    scraped += 1
+                    logger.info(f"Scraped job: {job.title} at {job.company}")
+                    yield job
+                except Exception as e:
+                    self.record_failure(e, "parse")
+                    logger.error(f"Error parsing job: {e}")
+            start += len(cards)
+            self.checkpoint(start)
+            self.record_page(len(cards))
+            if self.reached_known:
+                logger.info(f"Stopping LinkedIn after {self.known_skipped} already-known postings")
+                break
         
-    def scrape_jobs(self, search_query: str = "software engineer", location: str = "Bangalore", num_jobs: int = 100) -> List[Job]:
+    def scrape_jobs_browser(self, search_query: str = "software engineer", location: str = "Bangalore", num_jobs: int = 100) -> Iterator[Job]:
         """Scrape jobs from LinkedIn (public jobs page - no login required)"""
-        jobs = []
+        scraped = 0
         try:
             search_url = f"{self.base_url}?keywords={search_query.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+            # The scroll position is the number of cards already consumed
+            offset = self.resume_position(0)
+            if offset:
+                search_url += f"&start={offset}"
             logger.info(f"Scraping LinkedIn: {search_url}")
-            self.driver.get(search_url)
+            self.open_page(search_url)
             
-            wait = WebDriverWait(self.driver, 10)
+            results_present = EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list"))
             
             scroll_attempts = 0
             max_scrolls = 10
             
-            while len(jobs) < num_jobs and scroll_attempts < max_scrolls:
+            # Cards stay in the DOM as the list grows, so skip ones parsed on an earlier scroll
+            seen_urls = set()
+            # The list only grows while scrolling, so just its final state is archived
+            source = None
+            
+            while scraped < num_jobs and scroll_attempts < max_scrolls:
                 try:
-                    wait.until(EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list")))
+                    self.wait_until(lambda: results_present(self.driver), label="results")
                     
-                    job_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card")
+                    # One page_source transfer, then every card is parsed in-process
+                    source = self.page_source()
+                    job_cards = parse_html(source).xpath(class_xpath("base-card", "div"))
+                    consumed = len(seen_urls)
                     
-                    for element in job_elements:
-                        if len(jobs) >= num_jobs:
+                    for card in job_cards:
+                        if scraped >= num_jobs or self.reached_known:
                             break
+                        url = card_url(card)
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                        if self.is_known({"url": url}):
+                            continue
                         try:
-                            job_data = self.parse_job_details(element)
+                            job_data = self.parse_card(card)
                             if job_data:
                                 job = Job(**job_data, source="linkedin")
-                                jobs.append(job)
+                                scraped += 1
                                 logger.info(f"Scraped job: {job.title} at {job.company}")
+                                yield job
                         except Exception as e:
+                            self.record_failure(e, "parse")
                             logger.error(f"Error parsing job: {e}")
                             continue
+                    self.checkpoint(offset + len(seen_urls))
+                    self.record_page(len(seen_urls) - consumed)
+                    
+                    if self.reached_known:
+                        logger.info(f"Stopping LinkedIn after {self.known_skipped} already-known postings")
+                        break
                     
-                    self.scroll_page(pause_time=3)
+                    self.scroll_page(card_selector=CARD_SELECTOR)
                     scroll_attempts += 1
                     
                     try:
                         see_more_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'See more jobs')]")
+                        size = self._content_size(CARD_SELECTOR)
                         see_more_button.click()
-                        time.sleep(2)
+                        if self.wait_for_more_content(size, CARD_SELECTOR, label="see_more") is None:
+                            logger.info("No more jobs after 'See more jobs'")
                     except NoSuchElementException:
                         pass
                         
-                except TimeoutException:
+                except TimeoutException as e:
+                    self.record_failure(e, "wait")
                     logger.error("Timeout waiting for jobs to load")
                     break
+            
+            if source:
+                self.archive_page(source, "html", search_url)
                     
         except Exception as e:
+            self.record_failure(e, "browser")
             logger.error(f"Error scraping LinkedIn: {e}")
-            
-        return jobs
+    
+    def parse_page(self, content: str, kind: str = "html") -> List[Dict[str, Any]]:
+        """Parse a search results page or guest API fragment"""
+        return parse_job_cards(content)
+    
+    def detail_url(self, job: Dict[str, Any]) -> Optional[str]:
+        """Guest posting endpoint for a job, from the numeric ID that ends its URL"""
+        match = re.search(r'(\d+)/?$', canonical_url(job.get("url")))
+        return f"{self.guest_posting_url}/{match.group(1)}" if match else None
+    
+    def parse_detail_page(self, content: str) -> Dict[str, Any]:
+        """Full description, skills and employment type from a posting page"""
+        tree = parse_html(content)
+        description = first(tree, class_xpath("show-more-less-html__markup"))
+        if description is None:
+            description = first(tree, class_xpath("description__text"))
+        text = block_text(description)
+        if not text:
+            return {}
+        
+        criteria = {}
+        for item in tree.xpath(class_xpath("description__job-criteria-item", "li")):
+            name = first_text(item, class_xpath("description__job-criteria-subheader")).lower()
+            criteria[name] = first_text(item, class_xpath("description__job-criteria-text"))
+        
+        details = {"job_description": text, "skills": extract_skills(text)}
+        if criteria.get("employment type"):
+            details["job_type"] = criteria["employment type"]
+        return details
     
     def parse_job_details(self, job_element) -> Dict[str, Any]:
-        """Parse individual job details from LinkedIn"""
+        """Parse individual job details from a LinkedIn result card (lxml element)"""
         try:
-            title_element = job_element.find_element(By.CSS_SELECTOR, "h3.base-search-card__title")
-            title = title_element.text.strip()
-            
-            company_element = job_element.find_element(By.CSS_SELECTOR, "h4.base-search-card__subtitle")
-            company = company_element.text.strip()
-            
-            location_element = job_element.find_element(By.CSS_SELECTOR, "span.job-search-card__location")
-            location = location_element.text.strip()
-            
-            try:
-                time_element = job_element.find_element(By.CSS_SELECTOR, "time")
-                posted_text = time_element.get_attribute("datetime")
-                posted_date = datetime.fromisoformat(posted_text.replace('Z', '+00:00'))
-            except:
-                posted_date = None
-            
-            url_element = job_element.find_element(By.CSS_SELECTOR, "a.base-card__full-link")
-            url = url_element.get_attribute("href")
-            
-            try:
-                list_elements = job_element.find_elements(By.CSS_SELECTOR, "li.job-search-card__list-item")
-                job_info = [elem.text.strip() for elem in list_elements]
-                
-                experience = "Not specified"
-                job_type = None
-                for info in job_info:
-                    if "years" in info.lower() or "entry" in info.lower() or "senior" in info.lower():
-                        experience = info
-                    elif any(t in info.lower() for t in ["full-time", "part-time", "contract", "internship"]):
-                        job_type = info
-            except:
-                experience = "Not specified"
-                job_type = None
-            
-            job_description = f"{title} position at {company} in {location}"
-            
-            skills = []
-            
-            return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "experience": experience,
-                "skills": skills,
-                "job_description": job_description,
-                "posted_date": posted_date,
-                "url": url,
-                "job_type": job_type
-            }
-            
+            return parse_job_card(job_element)
         except Exception as e:
             logger.error(f"Error parsing LinkedIn job details: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -1,127 +1,246 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from .base_scraper import BaseScraper
+from .html_parsing import parse_html, class_xpath, first_text, first_attr, all_texts, strip_tags, canonical_url
 from models.job import Job
+from config.settings import NAUKRI_BASE_URL
+from utils.job_fields import extract_skills
+import json
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# JSON endpoint the Naukri search page itself calls
+SEARCH_API_PATH = "/jobapi/v3/search"
+SEARCH_API_HEADERS = {"appid": "109", "systemid": "109", "Accept": "application/json"}
+SEARCH_API_PAGE_SIZE = 20
+
+
+def job_posting_data(tree) -> Optional[Dict[str, Any]]:
+    """The schema.org JobPosting a posting page embeds as JSON-LD, if any"""
+    for script in tree.xpath('//script[@type="application/ld+json"]/text()'):
+        try:
+            data = json.loads(script)
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get("@graph") or [data]
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                return item
+    return None
+
 
 class NaukriScraper(BaseScraper):
-    def __init__(self, headless: bool = True):
-        super().__init__(headless)
-        self.base_url = "https://www.naukri.com"
+    source = "naukri"
+
+    def __init__(self, headless: bool = True, driver=None, base_url: Optional[str] = None, **kwargs):
+        super().__init__(headless, driver, **kwargs)
+        self.base_url = (base_url or NAUKRI_BASE_URL).rstrip("/")
+    
+    def _absolute_url(self, url: str) -> str:
+        url = canonical_url(url)
+        return f"{self.base_url}{url}" if url.startswith("/") else url
+    
+    def _seo_key(self, search_query: str, location: str) -> str:
+        return f"{search_query.replace(' ', '-')}-jobs-in-{location.replace(' ', '-')}"
+    
+    def scrape_jobs_http(self, search_query: str = "software engineer", location: str = "bangalore", num_jobs: int = 100) -> Iterator[Job]:
+        """Scrape jobs from Naukri's search API"""
+        scraped = 0
+        page = self.resume_position(1)
+        while scraped < num_jobs:
+            payload = self.fetch(f"{self.base_url}{SEARCH_API_PATH}", params={
+                "noOfResults": SEARCH_API_PAGE_SIZE,
+                "urlType": "search_by_key_loc",
+                "searchType": "adv",
+                "keyword": search_query,
+                "location": location,
+                "pageNo": page,
+                "seoKey": self._seo_key(search_query, location),
+                "src": "jobsearchDesk",
+            }, headers=SEARCH_API_HEADERS, as_json=True)
+            
+            items = payload.get("jobDetails") or []
+            if not items:
+                break
+            for item in items:
+                if scraped >= num_jobs or self.reached_known:
+                    break
+                if self.is_known({"url": self._absolute_url(item.get("jdURL"))}):
+                    continue
+                try:
+                    job_data = self.parse_card(item, self.parse_api_job)
+                    if job_data:
+                        job = Job(**job_data, source="naukri")
+                        scraped += 1
+                        logger.info(f"Scraped job: {job.title} at {job.company}")
+                        yield job
+                except Exception as e:
+                    self.record_failure(e, "parse")
+                    logger.error(f"Error parsing job: {e}")
+            self.checkpoint(page + 1)
+            self.record_page(len(items))
+            
+            if self.reached_known:
+                logger.info(f"Stopping Naukri after {self.known_skipped} already-known postings")
+                break
+            if page * SEARCH_API_PAGE_SIZE >= payload.get("noOfJobs", 0):
+                break
+            page += 1
+    
+    def parse_api_job(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a search API result to job fields"""
+        if not item.get("title"):
+            return None
+        placeholders = {placeholder.get("type"): placeholder.get("label")
+                        for placeholder in item.get("placeholders") or []}
+        
+        if item.get("createdDate"):
+            posted_date = datetime.fromtimestamp(int(item["createdDate"]) / 1000)
+        elif item.get("footerPlaceholderLabel"):
+            posted_date = self._parse_posted_date(item["footerPlaceholderLabel"])
+        else:
+            posted_date = None
+        
+        return {
+            "title": item["title"].strip(),
+            "company": (item.get("companyName") or "").strip(),
+            "location": placeholders.get("location") or "Not specified",
+            "experience": placeholders.get("experience") or "Not specified",
+            "skills": [skill.strip() for skill in (item.get("tagsAndSkills") or "").split(",") if skill.strip()],
+            "job_description": strip_tags(item.get("jobDescription") or ""),
+            "posted_date": posted_date,
+            "url": self._absolute_url(item.get("jdURL")),
+            "salary": placeholders.get("salary")
+        }
         
-    def scrape_jobs(self, search_query: str = "software engineer", location: str = "bangalore", num_jobs: int = 100) -> List[Job]:
+    def scrape_jobs_browser(self, search_query: str = "software engineer", location: str = "bangalore", num_jobs: int = 100) -> Iterator[Job]:
         """Scrape jobs from Naukri"""
-        jobs = []
+        scraped = 0
         try:
-            search_url = f"{self.base_url}/{search_query.replace(' ', '-')}-jobs-in-{location.replace(' ', '-')}"
-            logger.info(f"Scraping Naukri: {search_url}")
-            self.driver.get(search_url)
+            page = self.resume_position(1)
+            # Result pages past the first are addressable as "<seo key>-<page>"
+            search_url = f"{self.base_url}/{self._seo_key(search_query, location)}"
+            page_url = f"{search_url}-{page}" if page > 1 else search_url
+            logger.info(f"Scraping Naukri: {page_url}")
+            self.open_page(page_url)
             
-            wait = WebDriverWait(self.driver, 10)
+            results_present = EC.presence_of_element_located((By.CLASS_NAME, "srp-jobtuple-wrapper"))
             
-            page = 1
-            while len(jobs) < num_jobs:
+            while scraped < num_jobs:
                 try:
-                    wait.until(EC.presence_of_element_located((By.CLASS_NAME, "srp-jobtuple-wrapper")))
+                    first_card = self.wait_until(lambda: results_present(self.driver), label="results")
                     
-                    job_elements = self.driver.find_elements(By.CLASS_NAME, "srp-jobtuple-wrapper")
+                    # One page_source transfer (archived once per results page), then every card is parsed in-process
+                    page_url = f"{search_url}-{page}" if page > 1 else search_url
+                    job_cards = parse_html(self.page_source(page_url)).xpath(class_xpath("srp-jobtuple-wrapper"))
                     
-                    for element in job_elements:
-                        if len(jobs) >= num_jobs:
+                    for card in job_cards:
+                        if scraped >= num_jobs or self.reached_known:
                             break
+                        if self.is_known({"url": self._absolute_url(first_attr(card, class_xpath("title"), "href"))}):
+                            continue
                         try:
-                            job_data = self.parse_job_details(element)
+                            job_data = self.parse_card(card)
                             if job_data:
                                 job = Job(**job_data, source="naukri")
-                                jobs.append(job)
+                                scraped += 1
                                 logger.info(f"Scraped job: {job.title} at {job.company}")
+                                yield job
                         except Exception as e:
+                            self.record_failure(e, "parse")
                             logger.error(f"Error parsing job: {e}")
                             continue
+                    self.checkpoint(page + 1)
+                    self.record_page(len(job_cards))
+                    
+                    if self.reached_known:
+                        logger.info(f"Stopping Naukri after {self.known_skipped} already-known postings")
+                        break
                     
                     try:
                         next_button = self.driver.find_element(By.XPATH, "//a[@class='fright fs14 btn-secondary br2']")
                         if "disabled" in next_button.get_attribute("class"):
                             break
+                        self.throttle(self.base_url)
                         next_button.click()
+                        self.pages_loaded += 1
                         page += 1
-                        wait.until(EC.staleness_of(job_elements[0]))
+                        self.wait_until(lambda: EC.staleness_of(first_card)(self.driver), label="next_page")
                     except NoSuchElementException:
                         logger.info("No more pages available")
                         break
                         
-                except TimeoutException:
+                except TimeoutException as e:
+                    self.record_failure(e, "wait")
                     logger.error("Timeout waiting for jobs to load")
                     break
                     
         except Exception as e:
+            self.record_failure(e, "browser")
             logger.error(f"Error scraping Naukri: {e}")
-            
-        return jobs
+    
+    def parse_page(self, content: str, kind: str = "html") -> List[Dict[str, Any]]:
+        """Parse a search API response or a search results page"""
+        if kind == "json":
+            jobs = [self.parse_api_job(item) for item in json.loads(content).get("jobDetails") or []]
+        else:
+            jobs = [self.parse_job_details(card)
+                    for card in parse_html(content).xpath(class_xpath("srp-jobtuple-wrapper"))]
+        return [job for job in jobs if job]
+    
+    def detail_url(self, job: Dict[str, Any]) -> Optional[str]:
+        """The job's own posting page; search result links point straight at it"""
+        url = canonical_url(job.get("url"))
+        return url if "/job-listings-" in url else None
+    
+    def parse_detail_page(self, content: str) -> Dict[str, Any]:
+        """Full description, skills and employment type from a posting page's JobPosting data"""
+        posting = job_posting_data(parse_html(content))
+        text = strip_tags((posting or {}).get("description") or "")
+        if not text:
+            return {}
+        
+        skills = posting.get("skills") or []
+        if isinstance(skills, str):
+            skills = skills.split(",")
+        skills = [skill.strip() for skill in skills if skill.strip()]
+        known = {skill.lower() for skill in skills}
+        skills += [skill for skill in extract_skills(text) if skill.lower() not in known]
+        
+        details = {"job_description": text, "skills": skills}
+        employment_type = posting.get("employmentType")
+        if isinstance(employment_type, list):
+            employment_type = ", ".join(employment_type)
+        if employment_type:
+            details["job_type"] = employment_type
+        return details
     
     def parse_job_details(self, job_element) -> Dict[str, Any]:
-        """Parse individual job details from Naukri"""
+        """Parse individual job details from a Naukri result card (lxml element)"""
         try:
-            title = job_element.find_element(By.CLASS_NAME, "title").text.strip()
+            title_xpath = class_xpath("title")
+            title = first_text(job_element, title_xpath)
+            company = first_text(job_element, class_xpath("comp-name"))
+            if not title:
+                return None
             
-            company = job_element.find_element(By.CLASS_NAME, "comp-name").text.strip()
-            
-            try:
-                experience = job_element.find_element(By.CLASS_NAME, "exp-wrap").text.strip()
-            except:
-                experience = "Not specified"
-            
-            try:
-                salary = job_element.find_element(By.CLASS_NAME, "sal-wrap").text.strip()
-            except:
-                salary = None
-            
-            try:
-                location = job_element.find_element(By.CLASS_NAME, "locWdth").text.strip()
-            except:
-                location = "Not specified"
-            
-            try:
-                description = job_element.find_element(By.CLASS_NAME, "job-desc").text.strip()
-            except:
-                description = ""
-            
-            try:
-                skills_elements = job_element.find_elements(By.CLASS_NAME, "tag-li")
-                skills = [skill.text.strip() for skill in skills_elements]
-            except:
-                skills = []
-            
-            try:
-                posted_text = job_element.find_element(By.CLASS_NAME, "job-post-day").text.strip()
-                posted_date = self._parse_posted_date(posted_text)
-            except:
-                posted_date = None
-            
-            try:
-                url_element = job_element.find_element(By.CLASS_NAME, "title")
-                url = url_element.get_attribute("href")
-            except:
-                url = ""
+            posted_text = first_text(job_element, class_xpath("job-post-day"), None)
             
             return {
                 "title": title,
                 "company": company,
-                "location": location,
-                "experience": experience,
-                "skills": skills,
-                "job_description": description,
-                "posted_date": posted_date,
-                "url": url,
-                "salary": salary
+                "location": first_text(job_element, class_xpath("locWdth")) or "Not specified",
+                "experience": first_text(job_element, class_xpath("exp-wrap")) or "Not specified",
+                "skills": all_texts(job_element, class_xpath("tag-li")),
+                "job_description": first_text(job_element, class_xpath("job-desc")),
+                "posted_date": self._parse_posted_date(posted_text) if posted_text else None,
+                "url": self._absolute_url(first_attr(job_element, title_xpath, "href", "")),
+                "salary": first_text(job_element, class_xpath("sal-wrap"), None) or None
             }
             
         except Exception as e:
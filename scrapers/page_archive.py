@@ -0,0 +1,144 @@
+import gzip
+import hashlib
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+from config.settings import PAGE_ARCHIVE_DIR, PAGE_ARCHIVE_COMPRESSION
+import logging
+
+# Optional imports with graceful fallback
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class PageArchive:
+    """Content-addressed, compressed store of every listing page the scrapers fetch.
+
+    Pages are stored once per distinct content under objects/<sha256[:2]>/<sha256>
+    and described by one line each in index.jsonl (source, kind, URL, search).
+    The archive lets parsers be re-run over past scrapes without any network
+    access (see scrapers.replay).
+    """
+
+    def __init__(self, root: Path = PAGE_ARCHIVE_DIR, compression: str = PAGE_ARCHIVE_COMPRESSION):
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unknown page archive compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not available, archiving pages with gzip. "
+                           "Install it with: pip install zstandard")
+            compression = "gzip"
+        self.root = Path(root)
+        self.compression = compression
+        self.index_path = self.root / "index.jsonl"
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str, compression: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{EXTENSIONS[compression]}"
+
+    def _find(self, digest: str):
+        for compression in EXTENSIONS:
+            path = self._object_path(digest, compression)
+            if path.exists():
+                return path, compression
+        return None, None
+
+    def store(self, content: str, source: str, kind: str = "html", url: Optional[str] = None,
+              **metadata) -> str:
+        """Archive a page and return its content address; known content is not stored again"""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if self._find(digest)[0] is not None:
+                return digest
+            path = self._object_path(digest, self.compression)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = _compress(data, self.compression)
+            # Write then rename so a crash never leaves a truncated object behind
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(compressed)
+            tmp_path.replace(path)
+
+            entry = {
+                "sha256": digest,
+                "source": source,
+                "kind": kind,
+                "url": url,
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+                "bytes": len(data),
+                "stored_bytes": len(compressed),
+                **metadata,
+            }
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+        return digest
+
+    def load(self, digest: str) -> str:
+        """Decompressed content of an archived page"""
+        path, compression = self._find(digest)
+        if path is None:
+            raise KeyError(f"Page not in archive: {digest}")
+        return _decompress(path.read_bytes(), compression).decode("utf-8")
+
+    def entries(self, source: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Index entries in archive order, optionally of one source"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if source is None or entry["source"] == source:
+                    yield entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Pages, raw and stored size, per source"""
+        by_source = {}
+        for entry in self.entries():
+            counts = by_source.setdefault(entry["source"], {"pages": 0, "bytes": 0, "stored_bytes": 0})
+            counts["pages"] += 1
+            counts["bytes"] += entry["bytes"]
+            counts["stored_bytes"] += entry["stored_bytes"]
+        raw = sum(counts["bytes"] for counts in by_source.values())
+        stored = sum(counts["stored_bytes"] for counts in by_source.values())
+        return {
+            "pages": sum(counts["pages"] for counts in by_source.values()),
+            "bytes": raw,
+            "stored_bytes": stored,
+            "ratio": round(raw / stored, 1) if stored else 0.0,
+            "by_source": by_source,
+        }
+
+
+_archive: Optional[PageArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_page_archive() -> PageArchive:
+    """Return the process-wide page archive shared by every scraper"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = PageArchive()
+        return _archive
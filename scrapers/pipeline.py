@@ -0,0 +1,220 @@
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable
+from models.job import Job
+from utils.base_database import BaseDatabaseManager
+from utils.jsonl_files import JsonlWriter
+from config.settings import SCRAPE_BATCH_SIZE, SCRAPE_QUEUE_SIZE, SCRAPE_FLUSH_INTERVAL
+import logging
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _AfterFlush:
+    """Queue marker: an action to run once every job queued before it is stored"""
+
+    def __init__(self, action: Callable[[], None]):
+        self.action = action
+
+
+class _FlushNow:
+    """Queue marker: store what is queued before it right away, then signal done"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class ScrapePipeline:
+    """Streams scraped jobs from producer threads to storage.
+
+    Scrapers put jobs on a bounded queue (blocking when the writer falls
+    behind); a single writer thread drains it and flushes batches to the
+    database and to a JSONL file. Jobs become durable a batch at a time and
+    memory stays flat regardless of the size of the run.
+
+    A failed database write only costs its batch (counted in db_errors). Any
+    other writer error (e.g. a full disk under the JSONL file) stops storage:
+    the writer keeps draining and dropping jobs so producers never block,
+    put raises, and close re-raises the error.
+    """
+
+    def __init__(self, db: Optional[BaseDatabaseManager] = None, jsonl_path: Optional[Path] = None,
+                 batch_size: int = SCRAPE_BATCH_SIZE, queue_size: int = SCRAPE_QUEUE_SIZE,
+                 flush_interval: float = SCRAPE_FLUSH_INTERVAL):
+        self.db = db
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._file = None
+        self.stats = {"written": 0, "batches": 0, "db_errors": 0, "dropped": 0, "by_source": {}}
+        # Once a batch is lost, later markers would claim progress past it
+        self._lost_batch = False
+        self._error: Optional[Exception] = None
+
+    def __enter__(self) -> "ScrapePipeline":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            self.close()
+        except Exception:
+            # Don't mask the exception already on its way out
+            if exc_type is None:
+                raise
+
+    def start(self):
+        if self.jsonl_path:
+            # Compressed (gzip/zstd) when the path says so, e.g. jobs_<ts>.jsonl.gz
+            self._file = JsonlWriter(self.jsonl_path)
+        self._writer = threading.Thread(target=self._run, name="scrape-writer", daemon=True)
+        self._writer.start()
+
+    def put(self, job: Job):
+        """Hand a job to the writer, blocking while the queue is full; raises once the writer has failed"""
+        if self._error is not None:
+            raise RuntimeError(f"Scrape writer failed: {self._error}") from self._error
+        self._queue.put(job)
+
+    def after_flush(self, action: Callable[[], None]):
+        """Run action once every job put so far has been stored (e.g. to save a checkpoint).
+
+        Once a batch has failed to save, this and later actions are dropped.
+        """
+        self._queue.put(_AfterFlush(action))
+
+    def flush(self):
+        """Block until every job and post-flush action queued so far has been handled"""
+        if self._writer is None:
+            return
+        marker = _FlushNow()
+        self._queue.put(marker)
+        marker.done.wait()
+
+    def close(self) -> Dict[str, Any]:
+        """Flush everything still queued and stop the writer; raises the writer's error, if any"""
+        if self._writer:
+            # The writer drains the queue even after an error, so this cannot block for long
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+        if self._file:
+            try:
+                self._file.close()
+            except Exception as e:
+                self._fail(e)
+            self._file = None
+        if self._error is not None:
+            raise self._error
+        return self.stats
+
+    def _fail(self, error: Exception):
+        logger.error(f"Scrape writer failed, dropping further jobs: {error}")
+        if self._error is None:
+            self._error = error
+        self._lost_batch = True
+
+    def _run(self):
+        batch: List[Job] = []
+        pending: List[_AfterFlush] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if self._error is not None:
+                # Keep draining so producers blocked on a full queue are released
+                self.stats["dropped"] += isinstance(item, Job)
+                if isinstance(item, _FlushNow):
+                    item.done.set()
+                continue
+
+            flush_now = isinstance(item, _FlushNow)
+            try:
+                if isinstance(item, _AfterFlush):
+                    pending.append(item)
+                elif item is not None and not flush_now:
+                    batch.append(item)
+                # Flush on size, on request, or on time so slow sources still reach storage promptly
+                if (flush_now or len(batch) >= self.batch_size
+                        or ((batch or pending) and time.monotonic() >= deadline)):
+                    jobs, batch, markers, pending = batch, [], pending, []
+                    self._flush(jobs, markers)
+                if time.monotonic() >= deadline:
+                    deadline = time.monotonic() + self.flush_interval
+            except Exception as e:
+                self._fail(e)
+            if flush_now:
+                item.done.set()
+
+        if self._error is None:
+            try:
+                self._flush(batch, pending)
+            except Exception as e:
+                self._fail(e)
+        else:
+            self.stats["dropped"] += len(batch)
+
+    def _flush(self, batch: List[Job], pending: Optional[List[_AfterFlush]] = None):
+        if batch and not self._store(batch):
+            self._lost_batch = True
+        for marker in pending or []:
+            if self._lost_batch:
+                logger.warning("Skipping a checkpoint queued behind a batch that failed to save")
+                continue
+            try:
+                marker.action()
+            except Exception as e:
+                logger.error(f"Error running post-flush action: {e}")
+
+    def _store(self, batch: List[Job]) -> bool:
+        """Write a batch to the JSONL file and the database.
+
+        Returns False if the database write failed; raises if the file write
+        failed, after counting the batch if it still reached the database.
+        """
+        file_error = None
+        if self._file:
+            try:
+                for job in batch:
+                    self._file.write(job.dict())
+                self._file.flush()
+            except Exception as e:
+                file_error = e
+
+        saved = False
+        inserted = {}
+        if self.db is not None:
+            try:
+                result = self.db.upsert_jobs(batch)
+                saved = True
+                for index in result["upserted_ids"]:
+                    source = batch[index].source
+                    inserted[source] = inserted.get(source, 0) + 1
+            except Exception as e:
+                logger.error(f"Error saving a batch of {len(batch)} jobs to database: {e}")
+                self.stats["db_errors"] += 1
+        if file_error is not None and not saved:
+            raise file_error
+
+        for job in batch:
+            counts = self.stats["by_source"].setdefault(job.source, {"jobs": 0, "saved": 0, "inserted": 0})
+            counts["jobs"] += 1
+            counts["saved"] += saved
+        for source, count in inserted.items():
+            self.stats["by_source"][source]["inserted"] += count
+        self.stats["written"] += len(batch)
+        self.stats["batches"] += 1
+        logger.info(f"Flushed {len(batch)} jobs ({sum(inserted.values())} new)")
+        if file_error is not None:
+            raise file_error
+        return saved or self.db is None
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from config.settings import DOMAIN_RATE_LIMIT, DOMAIN_BURST
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to burst requests"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available; returns the seconds waited"""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class DomainRateLimiter:
+    """One token bucket per domain, shared by every scraper thread.
+
+    limits maps a domain (or any parent domain, e.g. "naukri.com") to
+    {"rate": requests_per_second, "burst": n}; other domains get the defaults.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None,
+                 default_rate: float = DOMAIN_RATE_LIMIT, default_burst: int = DOMAIN_BURST):
+        self.limits = limits or {}
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _limit_for(self, domain: str) -> Dict[str, Any]:
+        for pattern, limit in self.limits.items():
+            if domain == pattern or domain.endswith(f".{pattern}"):
+                return limit
+        return {}
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                limit = self._limit_for(domain)
+                bucket = TokenBucket(limit.get("rate", self.default_rate), limit.get("burst", self.default_burst))
+                self._buckets[domain] = bucket
+                self._stats[domain] = {"requests": 0, "wait_s": 0.0}
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Wait for the turn of url's domain; returns the seconds waited"""
+        domain = urlparse(url).netloc.lower()
+        if not domain:
+            return 0.0
+        waited = self._bucket(domain).acquire()
+        with self._lock:
+            self._stats[domain]["requests"] += 1
+            self._stats[domain]["wait_s"] += waited
+        return waited
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Requests and total throttling delay per domain"""
+        with self._lock:
+            return {domain: {"requests": entry["requests"], "wait_s": round(entry["wait_s"], 2)}
+                    for domain, entry in self._stats.items()}
@@ -1,50 +1,183 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from selenium.common.exceptions import WebDriverException
 from .naukri_scraper import NaukriScraper
 from .linkedin_scraper import LinkedInScraper
+from .driver_pool import DriverPool, get_driver_pool
+from .seen_jobs import SeenJobs
+from .pipeline import ScrapePipeline
+from .rate_limit import DomainRateLimiter
+from .page_archive import PageArchive, get_page_archive
+from .checkpoint import CheckpointStore
+from .telemetry import ScrapeTelemetry, TelemetryRun, get_scrape_telemetry
 from models.job import Job
-from utils.database import DatabaseManager
+from utils.base_database import BaseDatabaseManager
+from utils.database import create_database_manager
 import logging
-import json
+import time
 from datetime import datetime
-from config.settings import RAW_DATA_DIR
+from config.settings import RAW_DATA_DIR, JOB_ARCHIVE_AFTER_DAYS, SCRAPER_MAX_WORKERS, PAGE_ARCHIVE_ENABLED
+from utils.archive import JobArchiver
+from utils.jsonl_files import JsonlWriter, jsonl_path
 
 logger = logging.getLogger(__name__)
 
+# Registered platform scrapers; adding a source here is enough for it to be
+# scraped alongside the others
+SCRAPERS = {
+    "naukri": NaukriScraper,
+    "linkedin": LinkedInScraper,
+}
+
 
 class ScraperManager:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[BaseDatabaseManager] = None, max_workers: int = SCRAPER_MAX_WORKERS,
+                 platforms: Optional[List[str]] = None, driver_pool: Optional[DriverPool] = None,
+                 page_archive: Optional[PageArchive] = None, checkpoints: Optional[CheckpointStore] = None,
+                 telemetry: Optional[ScrapeTelemetry] = None):
+        self.db = db or create_database_manager()
+        # Browsers stay warm in the (process-wide by default) pool between scraping jobs
+        self.driver_pool = driver_pool or get_driver_pool()
+        # Raw listing pages are kept so parsers can be re-run offline
+        self.page_archive = page_archive or (get_page_archive() if PAGE_ARCHIVE_ENABLED else None)
+        self.checkpoints = checkpoints or CheckpointStore()
+        # Per-page and per-run metrics as JSON lines (None when disabled)
+        self.telemetry = telemetry or get_scrape_telemetry()
+        self.max_workers = max(1, max_workers)
+        self.platforms = platforms or list(SCRAPERS)
+        unknown = [platform for platform in self.platforms if platform not in SCRAPERS]
+        if unknown:
+            raise ValueError(f"Unknown platforms: {', '.join(unknown)}")
+        # Per-platform outcome of the most recent scrape_all_platforms call
+        self.last_report: Dict[str, Dict[str, Any]] = {}
+    
+    def scrape_platform(self, platform: str, search_query: str, location: str,
+                        num_jobs: int, seen: Optional[SeenJobs] = None,
+                        pipeline: Optional[ScrapePipeline] = None,
+                        rate_limiter: Optional[DomainRateLimiter] = None,
+                        stop_after_known: Optional[int] = None,
+                        resume: bool = False, run: Optional[TelemetryRun] = None) -> Dict[str, Any]:
+        """Scrape one platform, never letting its errors escape.
+
+        Listings are fetched over HTTP first; a browser is only borrowed from
+        the driver pool if the scraper has to fall back to Selenium. With a
+        pipeline, each job is handed over as soon as it is parsed instead of
+        being collected, so jobs scraped before a failure are kept, and
+        progress is checkpointed once the jobs before it are stored; resume
+        continues from the last checkpoint.
+
+        The report's count is the number of jobs this call scraped and its
+        checkpoint the one it resumed from (None for a fresh start), whose
+        jobs were taken off num_jobs. Page and platform metrics go to the
+        telemetry run, if any.
+        """
+        started = time.monotonic()
+        report = {"platform": platform, "status": "ok", "jobs": [], "count": 0, "error": None,
+                  "transport": None, "waits": {}, "known_skipped": 0, "pages": 0, "resumed_from": None,
+                  "checkpoint": None, "telemetry": None}
+        options = {"stop_after_known": stop_after_known} if stop_after_known is not None else {}
         
-    def scrape_all_platforms(self, search_query: str = "software engineer", 
-                           location: str = "Bangalore", 
-                           num_jobs_per_platform: int = 100) -> Dict[str, List[Job]]:
-        """Scrape jobs from all platforms"""
-        all_jobs = {
-            "naukri": [],
-            "linkedin": []
-        }
+        checkpoint = None
+        if pipeline:
+            if resume:
+                checkpoint = self.checkpoints.get(platform, search_query, location)
+            else:
+                self.checkpoints.clear(platform, search_query, location)
+        report["checkpoint"] = checkpoint
+        if checkpoint:
+            if checkpoint.get("status") == "done":
+                logger.info(f"{platform} '{search_query}' in {location} already completed, nothing to resume")
+                report["resumed_from"] = "done"
+                report["duration_s"] = 0.0
+                return report
+            report["resumed_from"] = checkpoint.get("position")
+            num_jobs = max(0, num_jobs - checkpoint.get("jobs", 0))
+            logger.info(f"Resuming {platform} at position {checkpoint.get('position')} "
+                        f"after {checkpoint.get('jobs', 0)} jobs")
         
-        logger.info("Starting Naukri scraping...")
-        naukri_scraper = NaukriScraper(headless=True)
-        try:
-            naukri_jobs = naukri_scraper.scrape_jobs(search_query, location, num_jobs_per_platform)
-            all_jobs["naukri"] = naukri_jobs
-            logger.info(f"Scraped {len(naukri_jobs)} jobs from Naukri")
-        except Exception as e:
-            logger.error(f"Error scraping Naukri: {e}")
-        finally:
-            naukri_scraper.close()
+        def save_checkpoint(state: Dict[str, Any], status: str = "running"):
+            # Saved by the writer once every job handed out before it is stored
+            pipeline.after_flush(lambda: self.checkpoints.save(platform, search_query, location,
+                                                               {**state, "status": status}))
         
-        logger.info("Starting LinkedIn scraping...")
-        linkedin_scraper = LinkedInScraper(headless=True)
+        scraper = None
         try:
-            linkedin_jobs = linkedin_scraper.scrape_jobs(search_query, location, num_jobs_per_platform)
-            all_jobs["linkedin"] = linkedin_jobs
-            logger.info(f"Scraped {len(linkedin_jobs)} jobs from LinkedIn")
+            logger.info(f"Starting {platform} scraping...")
+            scraper = SCRAPERS[platform](headless=True, driver_pool=self.driver_pool, seen=seen,
+                                         rate_limiter=rate_limiter, archive=self.page_archive,
+                                         resume_from=checkpoint, on_checkpoint=save_checkpoint if pipeline else None,
+                                         telemetry=run, **options)
+            for job in scraper.iter_jobs(search_query, location, num_jobs):
+                report["count"] += 1
+                if pipeline:
+                    pipeline.put(job)
+                else:
+                    report["jobs"].append(job)
+            if pipeline:
+                save_checkpoint(scraper.checkpoint_state(), status="done")
         except Exception as e:
-            logger.error(f"Error scraping LinkedIn: {e}")
+            logger.error(f"Error scraping {platform}: {e}")
+            report["status"] = "failed"
+            report["error"] = str(e)
+            if scraper:
+                scraper.record_failure(e, scraper.transport or "scrape")
+                if isinstance(e, WebDriverException):
+                    scraper.driver_broken = True
         finally:
-            linkedin_scraper.close()
+            if scraper:
+                report["transport"] = scraper.transport
+                report["waits"] = scraper.wait_summary()
+                report["known_skipped"] = scraper.known_skipped
+                report["pages"] = scraper.http_pages + scraper.pages_loaded
+                report["telemetry"] = scraper.telemetry_summary()
+                scraper.close()
+                if run:
+                    run.emit("platform", source=platform, query=search_query, location=location,
+                             status=report["status"], transport=report["transport"], **report["telemetry"])
+        report["duration_s"] = round(time.monotonic() - started, 1)
+        return report
+        
+    def scrape_all_platforms(self, search_query: str = "software engineer", 
+                           location: str = "Bangalore", 
+                           num_jobs_per_platform: int = 100,
+                           incremental: bool = True,
+                           pipeline: Optional[ScrapePipeline] = None,
+                           resume: bool = False,
+                           run: Optional[TelemetryRun] = None) -> Dict[str, List[Job]]:
+        """Scrape jobs from all platforms concurrently.
+
+        In incremental mode postings already in the database are skipped and
+        each platform stops paginating after a run of known results. Jobs are
+        streamed to pipeline when one is given, and the returned lists are empty.
+        """
+        all_jobs = {platform: [] for platform in self.platforms}
+        self.last_report = {}
+        seen = SeenJobs.from_database(self.db) if incremental else None
+        
+        workers = min(self.max_workers, len(self.platforms))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+            futures = [
+                executor.submit(self.scrape_platform, platform, search_query, location, num_jobs_per_platform,
+                                seen, pipeline, resume=resume, run=run)
+                for platform in self.platforms
+            ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                report = future.result()
+                platform = report["platform"]
+                all_jobs[platform] = report["jobs"]
+                self.last_report[platform] = {
+                    "status": report["status"],
+                    "transport": report["transport"],
+                    "waits": report["waits"],
+                    "known_skipped": report["known_skipped"],
+                    "jobs": report["count"],
+                    "resumed_from": report["resumed_from"],
+                    "telemetry": report["telemetry"],
+                    "duration_s": report["duration_s"],
+                    "error": report["error"],
+                }
+                logger.info(f"[{done}/{len(futures)}] {platform}: {report['status']}, "
+                            f"{report['count']} jobs in {report['duration_s']}s via {report['transport']}")
         
         return all_jobs
     
@@ -55,9 +188,10 @@ class ScraperManager:
         for platform, job_list in jobs.items():
             if job_list:
                 try:
-                    self.db.insert_jobs(job_list)
+                    result = self.db.upsert_jobs(job_list)
                     saved_counts[platform] = len(job_list)
-                    logger.info(f"Saved {len(job_list)} jobs from {platform} to database")
+                    logger.info(f"Saved {len(job_list)} jobs from {platform} to database "
+                                f"({result['inserted']} new, {result['matched']} already known)")
                 except Exception as e:
                     logger.error(f"Error saving {platform} jobs to database: {e}")
                     saved_counts[platform] = 0
@@ -67,47 +201,116 @@ class ScraperManager:
         return saved_counts
     
     def save_to_json(self, jobs: Dict[str, List[Job]], filename: str = None) -> str:
-        """Save scraped jobs to JSON file"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"jobs_{timestamp}.json"
-            
-        filepath = RAW_DATA_DIR / filename
+        """Save scraped jobs to a JSONL file, one job per line (compressed per JSONL_COMPRESSION)"""
+        if filename:
+            filepath = RAW_DATA_DIR / filename
+        else:
+            filepath = jsonl_path(RAW_DATA_DIR, f"jobs_{datetime.now():%Y%m%d_%H%M%S}")
         
-        jobs_dict = {}
-        for platform, job_list in jobs.items():
-            jobs_dict[platform] = [job.dict() for job in job_list]
+        with JsonlWriter(filepath) as writer:
+            for job_list in jobs.values():
+                for job in job_list:
+                    writer.write(job.dict())
             
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(jobs_dict, f, indent=2, default=str)
-            
-        logger.info(f"Saved jobs to {filepath}")
+        logger.info(f"Saved {writer.records} jobs to {filepath}")
         return str(filepath)
     
     def run_scraping_job(self, search_query: str = "software engineer", 
                         location: str = "Bangalore", 
                         num_jobs_per_platform: int = 100,
                         save_to_db: bool = True,
-                        save_to_file: bool = True) -> Dict[str, Any]:
-        """Run complete scraping job"""
+                        save_to_file: bool = True,
+                        incremental: bool = True,
+                        resume: bool = False) -> Dict[str, Any]:
+        """Run complete scraping job; with resume, continue each platform from its last checkpoint"""
         logger.info(f"Starting scraping job: query='{search_query}', location='{location}'")
+        run = self.telemetry.start_run(query=search_query, location=location,
+                                       platforms=self.platforms) if self.telemetry else None
+        try:
+            return self._run_scraping_job(search_query, location, num_jobs_per_platform, save_to_db,
+                                          save_to_file, incremental, resume, run)
+        finally:
+            if run:
+                run.close()
+    
+    def _run_scraping_job(self, search_query: str, location: str, num_jobs_per_platform: int,
+                          save_to_db: bool, save_to_file: bool, incremental: bool, resume: bool,
+                          run: Optional[TelemetryRun]) -> Dict[str, Any]:
+        pool_before = self.driver_pool.stats()
         
-        jobs = self.scrape_all_platforms(search_query, location, num_jobs_per_platform)
+        if not (save_to_db or save_to_file):
+            self.scrape_all_platforms(search_query, location, num_jobs_per_platform, incremental=incremental,
+                                      run=run)
+            results = self._scraping_results()
+            results["telemetry"] = self._telemetry_summary(pool_before, run)
+            return results
         
-        total_jobs = sum(len(job_list) for job_list in jobs.values())
-        logger.info(f"Total jobs scraped: {total_jobs}")
+        # Jobs stream from the scraper threads to a single writer that stores
+        # them in batches, rather than being held until every platform is done
+        output_path = None
+        if save_to_file:
+            output_path = jsonl_path(RAW_DATA_DIR, f"jobs_{datetime.now():%Y%m%d_%H%M%S}")
+        pipeline = ScrapePipeline(db=self.db if save_to_db else None, jsonl_path=output_path)
+        with pipeline:
+            self.scrape_all_platforms(search_query, location, num_jobs_per_platform,
+                                      incremental=incremental, pipeline=pipeline, resume=resume, run=run)
         
-        results = {
-            "total_jobs": total_jobs,
-            "jobs_by_platform": {platform: len(job_list) for platform, job_list in jobs.items()}
-        }
+        results = self._scraping_results()
+        results["telemetry"] = self._telemetry_summary(pool_before, run)
+        results["pipeline"] = {key: pipeline.stats[key] for key in ("written", "batches", "db_errors")}
+        by_source = pipeline.stats["by_source"]
         
         if save_to_db:
-            saved_counts = self.save_to_database(jobs)
-            results["saved_to_db"] = saved_counts
+            results["saved_to_db"] = {platform: by_source.get(platform, {}).get("saved", 0)
+                                      for platform in self.platforms}
+            results["new_in_db"] = {platform: by_source.get(platform, {}).get("inserted", 0)
+                                    for platform in self.platforms}
+            
+            archived = self.archive_stale_jobs()
+            if archived is not None:
+                results["archived"] = archived
             
         if save_to_file:
-            json_path = self.save_to_json(jobs)
-            results["json_file"] = json_path
+            results["json_file"] = str(output_path)
             
-        return results
\ No newline at end of file
+        return results
+    
+    def archive_stale_jobs(self) -> Optional[int]:
+        """Keep the hot set small: move postings past their shelf life to the archive"""
+        if JOB_ARCHIVE_AFTER_DAYS <= 0:
+            return None
+        try:
+            return JobArchiver(self.db).run()["archived"]
+        except Exception as e:
+            logger.error(f"Error archiving stale jobs: {e}")
+            return None
+    
+    def _telemetry_summary(self, pool_before: Dict[str, Any], run: Optional[TelemetryRun]) -> Dict[str, Any]:
+        """Per-source metrics of the last run, where the time went, and browser restarts during it"""
+        pool = self.driver_pool.stats()
+        by_source = {platform: report["telemetry"] for platform, report in self.last_report.items()
+                     if report["telemetry"]}
+        slowest = max(by_source, key=lambda platform: by_source[platform]["elapsed_s"], default=None)
+        summary = {
+            "run_id": run.run_id if run else None,
+            "file": str(run.path) if run else None,
+            "by_source": by_source,
+            "driver_launches": pool["created"] - pool_before["created"],
+            "driver_restarts": (pool["recycled"] + pool["crashed"]) - (pool_before["recycled"] + pool_before["crashed"]),
+            "slowest_source": slowest,
+            "bottleneck": by_source[slowest]["bottleneck"] if slowest else None,
+        }
+        if run:
+            run.emit("run", **{key: value for key, value in summary.items() if key not in ("run_id", "file")})
+        return summary
+    
+    def _scraping_results(self) -> Dict[str, Any]:
+        jobs_by_platform = {platform: report["jobs"] for platform, report in self.last_report.items()}
+        total_jobs = sum(jobs_by_platform.values())
+        logger.info(f"Total jobs scraped: {total_jobs}")
+        return {
+            "total_jobs": total_jobs,
+            "jobs_by_platform": jobs_by_platform,
+            "platform_reports": self.last_report,
+            "driver_pool": self.driver_pool.stats(),
+        }
@@ -0,0 +1,59 @@
+import threading
+from itertools import chain
+from typing import Dict, Any, Optional, Iterable
+from utils.base_database import BaseDatabaseManager
+import logging
+
+logger = logging.getLogger(__name__)
+
+KEY_FIELDS = {"url": 1, "title": 1, "company": 1, "location": 1, "source": 1}
+
+
+def job_key(job: Dict[str, Any]) -> Optional[str]:
+    """Identity of a posting: its URL, else its title/company/location/source"""
+    if job.get("url"):
+        return job["url"]
+    parts = [job.get(field) for field in ("title", "company", "location", "source")]
+    if not parts[0]:
+        return None
+    return "|".join((part or "").strip().lower() for part in parts)
+
+
+class SeenJobs:
+    """Thread-safe in-memory set of postings that are already stored.
+
+    Scrapers consult it before parsing a card so a refresh can skip known
+    postings and stop paginating once it only finds old results.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._keys = set(keys)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_database(cls, db: BaseDatabaseManager, source: Optional[str] = None) -> "SeenJobs":
+        """Load the keys of every stored job (optionally of one source).
+
+        Archived postings count as known too, so one that is still listed is
+        not scraped and stored again.
+        """
+        query = {"source": source} if source else None
+        jobs = chain(db.iter_jobs(query, projection=KEY_FIELDS, batch_size=5000),
+                     db.iter_archived_jobs(query, projection=KEY_FIELDS, batch_size=5000))
+        seen = cls(key for key in (job_key(job) for job in jobs) if key)
+        logger.info(f"Loaded {len(seen)} known postings")
+        return seen
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str) -> bool:
+        """Record a key; False if it was already known"""
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
@@ -0,0 +1,107 @@
+import json
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+from config.settings import SCRAPE_TELEMETRY_ENABLED, SCRAPE_TELEMETRY_PATH
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Where a page's time goes, in the order they happen
+PHASES = ("throttle_s", "load_s", "wait_s", "parse_s")
+
+
+def new_metrics() -> Dict[str, Any]:
+    """Zeroed counters for a page or a whole scrape"""
+    return {"pages": 0, "cards": 0, "parsed": 0, "jobs": 0, "known": 0, **{phase: 0.0 for phase in PHASES}}
+
+
+def add_metrics(total: Dict[str, Any], page: Dict[str, Any]):
+    for key in total:
+        if key in page:
+            total[key] += page[key]
+
+
+def summarize_metrics(metrics: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+    """Round the counters and derive throughput and the slowest phase"""
+    summary = {key: round(value, 3) if isinstance(value, float) else value for key, value in metrics.items()}
+    summary["elapsed_s"] = round(elapsed, 3)
+    summary["cards_per_s"] = round(metrics["cards"] / elapsed, 1) if elapsed else 0.0
+    summary["parse_ms_per_card"] = round(metrics["parse_s"] / metrics["parsed"] * 1000, 3) if metrics["parsed"] else 0.0
+    busiest = max(PHASES, key=lambda phase: metrics[phase])
+    summary["bottleneck"] = busiest[:-2] if metrics[busiest] > 0 else None
+    return summary
+
+
+class TelemetryRun:
+    """Handle on one run's events, appended over a single open file.
+
+    The scrapers of a run share it from several threads, so writes are
+    serialized; close() flushes and releases the file at the end of the run.
+    """
+
+    def __init__(self, path: Path, run_id: str):
+        self.path = path
+        self.run_id = run_id
+        self._lock = threading.Lock()
+        self._file = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not open scrape telemetry file {self.path}: {e}")
+
+    def emit(self, event: str, **fields):
+        record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "run_id": self.run_id,
+                  "event": event, **fields}
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(line)
+            except OSError as e:
+                logger.warning(f"Could not write scrape telemetry to {self.path}: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.warning(f"Could not write scrape telemetry to {self.path}: {e}")
+            self._file = None
+
+    def __enter__(self) -> "TelemetryRun":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ScrapeTelemetry:
+    """Appends scrape metrics as JSON lines, one event per line.
+
+    Events are "run_start", "page" (per listing page: timings per phase,
+    cards, jobs), "failure" (exception type and phase), "platform" (a
+    scraper's totals) and "run" (the end-of-run summary). Each run gets its
+    own TelemetryRun handle and every event carries its run_id, so one file
+    can hold many runs, including concurrent ones.
+    """
+
+    def __init__(self, path: Path = SCRAPE_TELEMETRY_PATH):
+        self.path = Path(path)
+
+    def start_run(self, **context) -> TelemetryRun:
+        """Open a new run and record its start; close the returned handle when the run ends"""
+        run = TelemetryRun(self.path, f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}")
+        run.emit("run_start", **context)
+        return run
+
+
+def get_scrape_telemetry() -> Optional[ScrapeTelemetry]:
+    """Telemetry sink for a new scraper manager, or None when disabled"""
+    return ScrapeTelemetry() if SCRAPE_TELEMETRY_ENABLED else None
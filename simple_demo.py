@@ -58,8 +58,8 @@ def demo_basic_functionality():
     # Test database connection
     print("\n2. Testing Database Connection...")
     try:
-        from utils.database import DatabaseManager
-        db = DatabaseManager()
+        from utils.database import create_database_manager
+        db = create_database_manager()
         
         # Try to connect (this will fail if MongoDB is not running, but import should work)
         print("✓ Database manager created successfully")
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for the motor-based AsyncDatabaseManager.
+
+They run against an in-memory stand-in (mongomock-motor) by default, and
+against a real server when MONGODB_TEST_URI points at a local mongod.
+"""
+import asyncio
+import inspect
+import os
+import secrets
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.job import Job
+from utils.async_database import AsyncDatabaseManager
+from utils.database import DatabaseManager
+
+MONGODB_TEST_URI = os.getenv("MONGODB_TEST_URI")
+
+
+def make_job(number: int, skills=("Python",), days_old: int = 1, city: str = "Pune", **fields) -> Job:
+    job = {
+        "title": f"Python Developer {number}",
+        "company": "Acme",
+        "location": city,
+        "experience": "2-5 Yrs",
+        "skills": list(skills),
+        "job_description": "Build APIs",
+        "posted_date": datetime.now() - timedelta(days=days_old, minutes=number),
+        "url": f"https://jobs.example.com/{number}",
+        "source": "naukri",
+    }
+    job.update(fields)
+    return Job(**job)
+
+
+def run(test):
+    """Run a test coroutine with a manager on a fresh database"""
+    async def main():
+        if MONGODB_TEST_URI:
+            from motor.motor_asyncio import AsyncIOMotorClient
+            client = AsyncIOMotorClient(MONGODB_TEST_URI)
+        else:
+            mongomock_motor = pytest.importorskip("mongomock_motor")
+            client = mongomock_motor.AsyncMongoMockClient()
+        db_name = f"joblo_test_{secrets.token_hex(4)}"
+        try:
+            await test(AsyncDatabaseManager(client=client, db_name=db_name))
+        finally:
+            await client.drop_database(db_name)
+            client.close()
+    asyncio.run(main())
+
+
+def test_api_matches_database_manager():
+    sync_methods = {name for name, _ in inspect.getmembers(DatabaseManager, inspect.isfunction)
+                    if not name.startswith("_")}
+    async_methods = {name for name, _ in inspect.getmembers(AsyncDatabaseManager, inspect.isfunction)
+                     if not name.startswith("_")}
+    assert sync_methods <= async_methods
+
+
+def test_upsert_inserts_new_and_refreshes_known_jobs():
+    async def test(db):
+        first = await db.upsert_jobs([make_job(1), make_job(2)])
+        assert first["inserted"] == 2 and set(first["upserted_ids"]) == {0, 1}
+
+        second = await db.upsert_jobs([make_job(2, job_description="Build and run APIs"), make_job(3)])
+        assert second["inserted"] == 1 and second["matched"] == 1
+        # mongomock numbers upserts by their own count rather than the operation index
+        [new_id] = second["upserted_ids"].values()
+        assert (await db.find_job_by_id(new_id))["url"] == "https://jobs.example.com/3"
+
+        jobs = await db.find_jobs({"url": "https://jobs.example.com/2"})
+        assert len(jobs) == 1 and jobs[0]["job_description"] == "Build and run APIs"
+        assert await db.get_stats("total") == {"all": 3}
+        assert await db.get_stats("skill") == {"python": 3}
+    run(test)
+
+
+def test_refresh_moves_stats_with_the_posting():
+    async def test(db):
+        await db.upsert_jobs([make_job(1, skills=("Python",))])
+        await db.upsert_jobs([make_job(1, skills=("Java",), city="Mumbai")])
+        assert await db.get_stats("total") == {"all": 1}
+        assert await db.get_stats("skill") == {"java": 1}
+        assert await db.get_stats("city") == {"mumbai": 1}
+    run(test)
+
+
+def test_keyset_pages_cover_every_job_once():
+    async def test(db):
+        await db.upsert_jobs([make_job(number) for number in range(7)])
+        seen, cursor = [], None
+        while True:
+            page = await db.find_jobs_page({}, page_size=3, cursor=cursor)
+            seen += [job["url"] for job in page["jobs"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert seen == [f"https://jobs.example.com/{number}" for number in range(7)]
+    run(test)
+
+
+def test_batch_hydration_and_streaming():
+    async def test(db):
+        result = await db.upsert_jobs([make_job(number) for number in range(5)])
+        job_ids = [result["upserted_ids"][index] for index in (3, 0, 4)]
+        jobs = await db.find_jobs_by_ids(job_ids + ["0" * 24])
+        assert [str(job["_id"]) for job in jobs] == job_ids
+
+        streamed = [job async for job in db.iter_jobs(projection={"url": 1}, batch_size=2)]
+        assert len(streamed) == 5 and all(set(job) == {"_id", "url"} for job in streamed)
+    run(test)
+
+
+def test_concurrent_queries_on_one_loop():
+    async def test(db):
+        await db.upsert_jobs([make_job(number, city=city)
+                              for number, city in enumerate(["Pune", "Mumbai", "Pune", "Delhi"])])
+        pune, mumbai, delhi = await asyncio.gather(*(db.find_jobs({"location": city})
+                                                     for city in ("Pune", "Mumbai", "Delhi")))
+        assert (len(pune), len(mumbai), len(delhi)) == (2, 1, 1)
+    run(test)
+
+
+def test_update_and_delete_keep_stats_in_step():
+    async def test(db):
+        result = await db.upsert_jobs([make_job(1), make_job(2)])
+        first, second = result["upserted_ids"][0], result["upserted_ids"][1]
+
+        assert await db.update_job(first, {"skills": ["Java"]})
+        assert await db.get_stats("skill") == {"python": 1, "java": 1}
+
+        assert await db.delete_jobs([second]) == 1
+        assert await db.get_stats("total") == {"all": 1}
+        assert await db.find_job_by_id(second) is None
+    run(test)
+
+
+def test_archive_moves_stale_jobs_once_per_posting():
+    async def test(db):
+        await db.upsert_jobs([make_job(1, days_old=90), make_job(2, days_old=90), make_job(3)])
+        cutoff = datetime.now() - timedelta(days=60)
+        assert await db.archive_jobs(cutoff) == 2
+        assert await db.get_stats("total") == {"all": 1}
+
+        # Still listed: refreshed in the archive, not stored in the hot set again
+        result = await db.upsert_jobs([make_job(1, days_old=90, job_description="Still open")])
+        assert result["archived"] == 1 and result["inserted"] == 0
+        assert await db.archive_jobs(cutoff) == 0
+
+        archived = [job async for job in db.iter_archived_jobs()]
+        assert len(archived) == 2
+        refreshed = await db.find_archived_jobs({"url": "https://jobs.example.com/1"})
+        assert refreshed[0]["job_description"] == "Still open" and refreshed[0]["last_seen_at"]
+    run(test)
+
+
+@pytest.mark.skipif(not MONGODB_TEST_URI, reason="$merge needs a real mongod (set MONGODB_TEST_URI)")
+def test_rebuild_stats_matches_incremental_counters():
+    async def test(db):
+        await db.upsert_jobs([make_job(number, skills=("Python", "SQL")) for number in range(4)])
+        incremental = await db.get_stats("skill")
+        assert await db.rebuild_stats() > 0
+        assert await db.get_stats("skill") == incremental
+    run(test)
+
+
+@pytest.mark.parametrize("holds_loop", [False, True])
+def test_motor_clients_are_per_loop_and_closed_with_it(monkeypatch, holds_loop):
+    from utils import mongo_client
+
+    class FakeMotorClient:
+        def __init__(self, uri, **options):
+            self.closed = False
+            # Real motor clients keep their loop alive, so only the closed-loop sweep can release them
+            self.loop = asyncio.get_running_loop() if holds_loop else None
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(mongo_client, "MOTOR_AVAILABLE", True)
+    monkeypatch.setattr(mongo_client, "AsyncIOMotorClient", FakeMotorClient, raising=False)
+    monkeypatch.setattr(mongo_client, "_motor_clients", mongo_client.weakref.WeakKeyDictionary())
+
+    async def shared_client():
+        client = mongo_client.get_motor_client("mongodb://test")
+        assert mongo_client.get_motor_client("mongodb://test") is client
+        assert not client.closed
+        return client
+
+    first = asyncio.run(shared_client())
+    second = asyncio.run(shared_client())
+    # A new loop never inherits the client of a finished one, which is closed with it
+    assert second is not first
+    assert first.closed
+    assert second.closed != holds_loop
+    assert mongo_client.get_pool_metrics()["async_clients"] == int(holds_loop)
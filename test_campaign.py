@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for campaign retries resuming from the failed attempt's checkpoint, and
+the campaign's telemetry run.
+"""
+import json
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from models.job import Job
+from scrapers import campaign as campaign_module
+from scrapers.base_scraper import BaseScraper
+from scrapers.campaign import Campaign, CampaignScheduler
+from scrapers.checkpoint import CheckpointStore
+from scrapers.pipeline import ScrapePipeline
+from scrapers.scraper_manager import SCRAPERS, ScraperManager
+from scrapers.telemetry import ScrapeTelemetry
+from utils.sqlite_database import SQLiteDatabaseManager
+
+PAGE_SIZE = 3
+
+
+class FlakyScraper(BaseScraper):
+    """Pages of three numbered postings; the first instance fails on posting FAIL_AT"""
+
+    source = "naukri"
+    FAIL_AT = 7
+    instances = []
+
+    def __init__(self, **options):
+        super().__init__(mode="http", checkpoint_every=1, **options)
+        self.instances.append(self)
+
+    def scrape_jobs_http(self, search_query, location, num_jobs=100):
+        yielded = 0
+        page = self.resume_position(0)
+        while yielded < num_jobs:
+            for number in range(page * PAGE_SIZE, (page + 1) * PAGE_SIZE):
+                if len(self.instances) == 1 and number == self.FAIL_AT:
+                    raise ConnectionError("connection reset")
+                url = f"https://jobs.example.com/{number}"
+                if self.is_known({"url": url}):
+                    continue
+                yield Job(title=f"Developer {number}", company="Acme", location=location, experience="2-5 Yrs",
+                          skills=["Python"], job_description="Build APIs", posted_date=datetime.now(),
+                          url=url, source=self.source)
+                yielded += 1
+                if yielded >= num_jobs:
+                    return
+            page += 1
+            self.checkpoint(page)
+
+    def scrape_jobs_browser(self, search_query, location, num_jobs=100):
+        raise AssertionError("not used")
+
+    def parse_job_details(self, job_element):
+        raise AssertionError("not used")
+
+    def parse_page(self, content, kind="html"):
+        raise AssertionError("not used")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setitem(SCRAPERS, "naukri", FlakyScraper)
+    monkeypatch.setattr(FlakyScraper, "instances", [])
+    # Checkpoints stay queued in the writer unless something flushes them
+    monkeypatch.setattr(campaign_module, "ScrapePipeline", partial(ScrapePipeline, flush_interval=60,
+                                                                   batch_size=1000))
+    return ScraperManager(db=SQLiteDatabaseManager(tmp_path / "jobs.db"), platforms=["naukri"],
+                          checkpoints=CheckpointStore(tmp_path / "checkpoints.json"),
+                          telemetry=ScrapeTelemetry(tmp_path / "telemetry.jsonl"))
+
+
+def test_retry_resumes_from_the_flushed_checkpoint(manager):
+    campaign = Campaign(["python"], ["Pune"], {"naukri": 10}, retries=1, incremental=False)
+    summary = CampaignScheduler(campaign, manager, retry_backoff=0).run(save_to_file=False)
+
+    first, retry = FlakyScraper.instances
+    # The failed attempt handed out postings 0-6 and checkpointed after page 2 (postings 0-5)
+    assert first.jobs_yielded == 7
+    assert retry.resume_from["position"] == 2 and retry.resume_from["jobs"] == 6
+    # Posting 6 was stored after that checkpoint and comes back as known, so the
+    # retry is asked for the three jobs the combination still needs
+    assert retry.jobs_yielded == 3 and retry.known_skipped == 1
+    assert summary["jobs"] == 10 and summary["retries"] == 1 and summary["failed"] == []
+    assert len(manager.db.get_all_jobs()) == 10
+
+
+def test_retry_budget_adds_back_the_checkpointed_jobs():
+    # 7 of 10 scraped, resuming from a checkpoint that recorded 6: scrape_platform takes
+    # the 6 off again, leaving the 3 still needed
+    assert CampaignScheduler._retry_budget(10, 7, 6) == 9
+    assert CampaignScheduler._retry_budget(10, 12, 0) == 0
+
+
+def test_pipeline_flush_runs_queued_checkpoints(tmp_path):
+    saved = []
+    with ScrapePipeline(flush_interval=60, batch_size=1000) as pipeline:
+        pipeline.after_flush(lambda: saved.append("checkpoint"))
+        pipeline.flush()
+        assert saved == ["checkpoint"]
+
+
+def test_campaign_events_share_one_telemetry_run(manager, tmp_path):
+    other = manager.telemetry.start_run(note="concurrent run")
+    campaign = Campaign(["python"], ["Pune"], {"naukri": 10}, retries=1, incremental=False)
+    CampaignScheduler(campaign, manager, retry_backoff=0).run(save_to_file=False)
+    other.emit("run")
+    other.close()
+
+    events = [json.loads(line) for line in (tmp_path / "telemetry.jsonl").read_text().splitlines()]
+    campaign_events = [event for event in events if event["run_id"] != other.run_id]
+    assert campaign_events[0]["event"] == "run_start" and campaign_events[0]["campaign"] == campaign.name
+    assert len({event["run_id"] for event in campaign_events}) == 1
+    assert [event["event"] for event in campaign_events].count("platform") == 2
+    assert "failure" in {event["event"] for event in campaign_events}
+    assert [event["event"] for event in events if event["run_id"] == other.run_id] == ["run_start", "run"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the scrape checkpoint store and how scrape_platform uses it.
+"""
+import threading
+
+from scrapers.checkpoint import CheckpointStore
+from scrapers.pipeline import ScrapePipeline
+from scrapers.scraper_manager import ScraperManager
+from scrapers.telemetry import ScrapeTelemetry
+from utils.sqlite_database import SQLiteDatabaseManager
+
+
+def test_save_get_and_clear(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.json")
+    assert store.get("naukri", "python", "Pune") is None
+
+    store.save("naukri", "Python Developer", "Pune", {"position": 3, "jobs": 40, "status": "running"})
+    # Queries and locations are matched case- and whitespace-insensitively
+    checkpoint = CheckpointStore(tmp_path / "checkpoints.json").get("naukri", " python developer", "PUNE ")
+    assert checkpoint["position"] == 3 and checkpoint["jobs"] == 40 and checkpoint["status"] == "running"
+    assert checkpoint["query"] == "Python Developer" and "updated_at" in checkpoint
+    assert store.get("linkedin", "Python Developer", "Pune") is None
+
+    store.clear("naukri", "python developer", "pune")
+    assert store.get("naukri", "Python Developer", "Pune") is None
+    assert not (tmp_path / "checkpoints.json.tmp").exists()
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    path.write_text("{not json", encoding="utf-8")
+    store = CheckpointStore(path)
+    assert store.get("naukri", "python", "Pune") is None
+    store.save("naukri", "python", "Pune", {"position": 2})
+    assert store.get("naukri", "python", "Pune")["position"] == 2
+
+
+def test_concurrent_saves_keep_every_combination(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.json")
+    threads = [threading.Thread(target=store.save, args=("naukri", f"query {number}", "Pune", {"jobs": number}))
+               for number in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [store.get("naukri", f"query {number}", "Pune")["jobs"] for number in range(20)] == list(range(20))
+
+
+def manager(tmp_path) -> ScraperManager:
+    return ScraperManager(db=SQLiteDatabaseManager(tmp_path / "jobs.db"), platforms=["naukri"],
+                          checkpoints=CheckpointStore(tmp_path / "checkpoints.json"),
+                          telemetry=ScrapeTelemetry(tmp_path / "telemetry.jsonl"))
+
+
+def test_completed_combinations_are_not_scraped_again(tmp_path):
+    scrapers = manager(tmp_path)
+    scrapers.checkpoints.save("naukri", "python", "Pune", {"position": 5, "jobs": 100, "status": "done"})
+    with ScrapePipeline() as pipeline:
+        report = scrapers.scrape_platform("naukri", "python", "Pune", 100, pipeline=pipeline, resume=True)
+    assert report["resumed_from"] == "done" and report["count"] == 0
+    assert report["checkpoint"]["jobs"] == 100
+
+
+def test_fresh_runs_clear_the_checkpoint(tmp_path, monkeypatch):
+    scrapers = manager(tmp_path)
+    scrapers.checkpoints.save("naukri", "python", "Pune", {"position": 5, "jobs": 100, "status": "done"})
+
+    def scrape_nothing(self, search_query, location, num_jobs=100):
+        return iter(())
+    monkeypatch.setattr("scrapers.naukri_scraper.NaukriScraper.scrape_jobs_http", scrape_nothing)
+    monkeypatch.setattr("scrapers.naukri_scraper.NaukriScraper.scrape_jobs_browser", scrape_nothing)
+    with ScrapePipeline() as pipeline:
+        report = scrapers.scrape_platform("naukri", "python", "Pune", 100, pipeline=pipeline, resume=False)
+    assert report["status"] == "ok" and report["checkpoint"] is None
+    # The new run's own completion replaced the old checkpoint
+    assert scrapers.checkpoints.get("naukri", "python", "Pune")["jobs"] == 0
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for CachedEmbeddings with a fake backend that counts its calls.
+"""
+from typing import List
+
+import pytest
+
+pytest.importorskip("langchain_core")
+from langchain_core.embeddings import Embeddings
+
+from agents.embedding_cache import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic fake backend that records every batch it is asked to embed"""
+
+    def __init__(self, model: str = "fake-model"):
+        self.model = model
+        self.document_batches: List[List[str]] = []
+        self.queries: List[str] = []
+
+    def vector(self, text: str) -> List[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 0.5]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.document_batches.append(list(texts))
+        return [self.vector(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.queries.append(text)
+        return self.vector(f"query: {text}")
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "embeddings.db"
+
+
+def test_misses_are_embedded_once_and_then_served_from_cache(cache_path):
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, path=cache_path)
+
+    first = cache.embed_documents(["python developer", "data engineer"])
+    assert first == [backend.vector("python developer"), backend.vector("data engineer")]
+    second = cache.embed_documents(["data engineer", "python developer"])
+    assert second == [first[1], first[0]]
+
+    assert backend.document_batches == [["python developer", "data engineer"]]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["backend_calls"], stats["stored"]) == (2, 2, 1, 2)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_repeated_texts_in_a_batch_are_embedded_once(cache_path):
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, path=cache_path)
+
+    vectors = cache.embed_documents(["same", "other", "same", "same"])
+
+    assert backend.document_batches == [["same", "other"]]
+    assert vectors[0] == vectors[2] == vectors[3] == backend.vector("same")
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (2, 2)
+
+
+def test_misses_are_split_into_backend_batches(cache_path):
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, path=cache_path, batch_size=2)
+    cache.embed_documents(["a"])
+
+    cache.embed_documents(["a", "b", "c", "d", "e"])
+
+    assert backend.document_batches == [["a"], ["b", "c"], ["d", "e"]]
+    assert cache.stats()["backend_calls"] == 3
+
+
+def test_queries_and_documents_are_cached_separately(cache_path):
+    backend = CountingEmbeddings()
+    cache = CachedEmbeddings(backend, path=cache_path)
+
+    cache.embed_documents(["python"])
+    assert cache.embed_query("python") == backend.vector("query: python")
+    assert cache.embed_query("python") == backend.vector("query: python")
+    assert backend.queries == ["python"]
+
+
+def test_namespaces_keep_models_apart(cache_path):
+    first, second = CountingEmbeddings("model-a"), CountingEmbeddings("model-b")
+    CachedEmbeddings(first, path=cache_path).embed_documents(["python"])
+
+    CachedEmbeddings(second, path=cache_path).embed_documents(["python"])
+    CachedEmbeddings(CountingEmbeddings("model-a"), path=cache_path, namespace="custom").embed_documents(["python"])
+
+    assert second.document_batches == [["python"]]
+
+
+def test_vectors_persist_across_instances(cache_path):
+    CachedEmbeddings(CountingEmbeddings(), path=cache_path).close()
+    writer = CachedEmbeddings(CountingEmbeddings(), path=cache_path)
+    vectors = writer.embed_documents(["python developer", "java developer"])
+    writer.close()
+
+    backend = CountingEmbeddings()
+    reader = CachedEmbeddings(backend, path=cache_path)
+    # Stored as float32, which these small values survive exactly
+    assert reader.embed_documents(["java developer", "python developer"]) == [vectors[1], vectors[0]]
+    assert backend.document_batches == []
+    assert reader.stats()["stored"] == 2
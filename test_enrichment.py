@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for JobEnricher: stored jobs completed from posting pages served by
+the local fixture server (conftest.py).
+"""
+from conftest import recorded, fixture_page
+from models.job import Job
+from scrapers.enrichment import JobEnricher
+from scrapers.naukri_scraper import NaukriScraper
+from utils.sqlite_database import SQLiteDatabaseManager
+
+POSTING_PATH = "/job-listings-python-developer-acme-analytics-pune-2-to-5-years-100001"
+MISSING_PATH = "/job-listings-backend-engineer-globex-pune-3-to-6-years-100002"
+
+
+def naukri_job(url: str, title: str) -> Job:
+    return Job(title=title, company="Acme Analytics", location="Pune", experience="2-5 Yrs",
+               skills=["python"], job_description="", url=url, source="naukri")
+
+
+def test_naukri_detail_page():
+    scraper = NaukriScraper()
+    assert scraper.detail_url({"url": f"https://www.naukri.com{POSTING_PATH}?src=jobsearchDesk"}) \
+        == f"https://www.naukri.com{POSTING_PATH}"
+    assert scraper.detail_url({"url": "https://www.naukri.com/python-developer-jobs-in-pune"}) is None
+
+    details = scraper.parse_detail_page(fixture_page("naukri_posting.html"))
+    assert "build data pipelines" in details["job_description"]
+    assert details["job_type"] == "Full Time, Permanent"
+    assert details["skills"][:3] == ["Python", "Django", "REST"]
+    assert "docker" in details["skills"]
+    assert scraper.parse_detail_page("<html><body>No posting here</body></html>") == {}
+
+
+def test_enrich_naukri_jobs(fixture_server, tmp_path):
+    fixture_server.serve(POSTING_PATH, recorded("naukri_posting.html"))
+    db = SQLiteDatabaseManager(tmp_path / "jobs.db")
+    db.upsert_jobs([naukri_job(f"{fixture_server.url}{POSTING_PATH}", "Python Developer"),
+                    naukri_job(f"{fixture_server.url}{MISSING_PATH}", "Backend Engineer")])
+
+    stats = JobEnricher(db=db, rate_limit=100).run(sources=["naukri"])
+    assert (stats["jobs"], stats["enriched"], stats["failed"]) == (2, 1, 1)
+
+    jobs = {job["title"]: job for job in db.get_all_jobs()}
+    enriched = jobs["Python Developer"]
+    assert enriched["enriched_at"] is not None
+    assert enriched["job_type"] == "Full Time, Permanent"
+    # Listing skills stay first, the page only adds new ones
+    assert enriched["skills"][0] == "python"
+    assert "Django" in enriched["skills"] and "Python" not in enriched["skills"]
+    assert jobs["Backend Engineer"]["enrich_attempts"] == 1
+    assert not jobs["Backend Engineer"].get("enriched_at")
+
+    # Only the failed job is still pending
+    assert [job["url"] for job in JobEnricher(db=db).pending_jobs(["naukri"])] \
+        == [f"{fixture_server.url}{MISSING_PATH}"]
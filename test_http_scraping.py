@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP-first scraping engine and its browser fallback, run
+against recorded pages served by the local fixture server (conftest.py).
+"""
+import shutil
+from urllib.parse import urljoin
+
+import pytest
+import requests
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from conftest import recorded
+from scrapers.html_parsing import parse_html, class_xpath, text_of
+from scrapers.linkedin_scraper import LinkedInScraper, GUEST_SEARCH_PATH
+from scrapers.naukri_scraper import NaukriScraper, SEARCH_API_PATH
+from scrapers.seen_jobs import SeenJobs
+
+NAUKRI_RESULTS_PATH = "/python-developer-jobs-in-pune"
+EMPTY_SEARCH = (200, "application/json", '{"noOfJobs": 0, "jobDetails": []}')
+
+
+def locator_xpath(by: str, value: str) -> str:
+    """XPath for the Selenium locators the scrapers use ("tag.class" for CSS)"""
+    if by == By.CLASS_NAME:
+        return class_xpath(value)
+    if by == By.CSS_SELECTOR:
+        tag, _, class_name = value.partition(".")
+        return class_xpath(class_name, tag or "*") if class_name else f".//{tag}"
+    return value
+
+
+class FixtureElement:
+    """Found element with the parts of the WebElement API the scrapers use; always truthy"""
+
+    def __init__(self, element, driver: "FixtureDriver"):
+        self.element = element
+        self.driver = driver
+
+    @property
+    def text(self) -> str:
+        return text_of(self.element)
+
+    def get_attribute(self, name: str):
+        value = self.element.get(name)
+        # Like a browser, hrefs come back resolved against the page
+        return urljoin(self.driver.current_url, value) if name == "href" and value else value
+
+    def find_element(self, by: str, value: str):
+        return self.driver.first(self.element, by, value)
+
+    def find_elements(self, by: str, value: str):
+        return self.driver.all(self.element, by, value)
+
+
+class FixtureDriver:
+    """Stand-in for a Selenium driver: loads pages over HTTP and finds elements with lxml"""
+
+    def __init__(self):
+        self.visited = []
+        self.current_url = None
+        self.page_source = ""
+        self._tree = None
+
+    def get(self, url: str):
+        response = requests.get(url, timeout=5)
+        self.visited.append(url)
+        self.current_url = url
+        self.page_source = response.text
+        self._tree = parse_html(response.text)
+
+    def all(self, root, by: str, value: str):
+        return [FixtureElement(match, self) for match in root.xpath(locator_xpath(by, value))]
+
+    def first(self, root, by: str, value: str):
+        matches = self.all(root, by, value)
+        if not matches:
+            raise NoSuchElementException(value)
+        return matches[0]
+
+    def find_element(self, by: str, value: str):
+        return self.first(self._tree, by, value)
+
+    def find_elements(self, by: str, value: str):
+        return self.all(self._tree, by, value)
+
+    def execute_script(self, script: str, *args):
+        return [0, 0]
+
+    def quit(self):
+        pass
+
+
+def guest_search(query):
+    """LinkedIn's guest endpoint: recorded fragments by offset, then an empty page"""
+    start = int(query.get("start", 0))
+    if start in (0, 3):
+        return recorded(f"linkedin_guest_{start}.html")
+    return 200, "text/html", ""
+
+
+def test_naukri_search_api_over_http(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, recorded("naukri_search_api.json"))
+    scraper = NaukriScraper(base_url=fixture_server.url, mode="http")
+
+    jobs = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+
+    assert [job.title for job in jobs] == ["Python Developer", "Backend Engineer", "Data Engineer"]
+    first = jobs[0]
+    assert first.url == f"{fixture_server.url}/job-listings-python-developer-acme-analytics-pune-2-to-5-years-100001"
+    assert first.skills == ["Python", "Django", "SQL"]
+    assert first.job_description == "Build REST APIs in Python."
+    assert (first.location, first.experience, first.salary) == ("Pune", "2-5 Yrs", "8-12 Lacs PA")
+    assert first.posted_date is not None and jobs[1].posted_date is not None
+    assert scraper.transport == "http" and scraper.http_pages == 1 and scraper.pages_loaded == 0
+
+    [request] = fixture_server.requests_to(SEARCH_API_PATH)
+    assert request["query"]["keyword"] == "python developer" and request["query"]["pageNo"] == "1"
+    assert request["headers"]["appid"] == "109"
+
+
+def test_linkedin_guest_search_paginates_over_http(fixture_server):
+    fixture_server.serve(GUEST_SEARCH_PATH, guest_search)
+    scraper = LinkedInScraper(base_url=fixture_server.url, mode="http")
+
+    jobs = scraper.scrape_jobs("python", "Pune", num_jobs=10)
+
+    assert [job.company for job in jobs] == ["Acme", "Globex", "Initech", "Hooli"]
+    assert jobs[0].url == "https://in.linkedin.com/jobs/view/python-developer-at-acme-4000000001"
+    assert jobs[0].posted_date.year == 2026 and jobs[2].posted_date is None
+    assert [request["query"]["start"] for request in fixture_server.requests_to(GUEST_SEARCH_PATH)] == ["0", "3", "4"]
+    assert scraper.position == 4
+
+
+def test_num_jobs_limits_http_scrape(fixture_server):
+    fixture_server.serve(GUEST_SEARCH_PATH, guest_search)
+    scraper = LinkedInScraper(base_url=fixture_server.url, mode="http")
+
+    assert len(scraper.scrape_jobs("python", "Pune", num_jobs=2)) == 2
+    assert len(fixture_server.requests_to(GUEST_SEARCH_PATH)) == 1
+
+
+def test_blocked_http_falls_back_to_browser(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, (403, "text/html", "<html>Access Denied</html>"))
+    fixture_server.serve(NAUKRI_RESULTS_PATH, recorded("naukri_results.html"))
+    driver = FixtureDriver()
+    scraper = NaukriScraper(driver=driver, base_url=fixture_server.url, mode="auto")
+
+    jobs = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+
+    assert [job.title for job in jobs] == ["Python Developer", "Backend Engineer"]
+    assert jobs[1].url == f"{fixture_server.url}/job-listings-backend-engineer-globex-pune-3-to-6-years-100002"
+    assert jobs[0].skills == ["Python", "Django", "SQL"] and jobs[0].salary == "8-12 Lacs PA"
+    assert scraper.transport == "browser"
+    assert scraper.failures == {"HTTPError": 1}
+    assert driver.visited == [f"{fixture_server.url}{NAUKRI_RESULTS_PATH}"]
+
+
+def test_empty_http_results_fall_back_to_browser(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, EMPTY_SEARCH)
+    fixture_server.serve(NAUKRI_RESULTS_PATH, recorded("naukri_results.html"))
+    scraper = NaukriScraper(driver=FixtureDriver(), base_url=fixture_server.url, mode="auto")
+
+    jobs = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+
+    assert len(jobs) == 2 and scraper.transport == "browser" and scraper.failures == {}
+
+
+def test_only_known_postings_do_not_fall_back(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, recorded("naukri_search_api.json"))
+    driver = FixtureDriver()
+    first = NaukriScraper(driver=driver, base_url=fixture_server.url, mode="auto")
+    seen = SeenJobs()
+    first.seen = seen
+    assert len(first.scrape_jobs("python developer", "pune")) == 3
+
+    again = NaukriScraper(driver=driver, base_url=fixture_server.url, mode="auto", seen=seen)
+    assert again.scrape_jobs("python developer", "pune") == []
+    assert again.known_skipped == 3 and again.transport == "http" and driver.visited == []
+
+
+def test_http_mode_never_falls_back(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, (403, "text/html", "Access Denied"))
+    driver = FixtureDriver()
+    scraper = NaukriScraper(driver=driver, base_url=fixture_server.url, mode="http")
+
+    with pytest.raises(requests.HTTPError):
+        scraper.scrape_jobs("python developer", "pune")
+    assert driver.visited == []
+
+
+@pytest.mark.skipif(not (shutil.which("google-chrome") or shutil.which("chromium")),
+                    reason="needs a local Chrome for the real Selenium path")
+def test_real_browser_fallback(fixture_server):
+    fixture_server.serve(SEARCH_API_PATH, EMPTY_SEARCH)
+    fixture_server.serve(NAUKRI_RESULTS_PATH, recorded("naukri_results.html"))
+    scraper = NaukriScraper(base_url=fixture_server.url, mode="auto")
+    try:
+        jobs = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+    finally:
+        scraper.close()
+
+    assert [job.title for job in jobs] == ["Python Developer", "Backend Engineer"]
+    assert scraper.transport == "browser" and scraper.pages_loaded == 1
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the chat fast path: which messages IntentRouter answers itself
+and which it leaves to the LLM agent.
+"""
+import pytest
+
+from agents.intent_router import IntentRouter
+
+router = IntentRouter(search_tool=None, stats_tool=None)
+
+
+@pytest.mark.parametrize("message", [
+    "I lost my job",
+    "help me find jobs",
+    "thanks for the jobs",
+    "what is a good job",
+    "I want jobs in pune",
+    "which python jobs pay the best",
+    "how many jobs should I apply to",
+    "count python jobs in narnia",
+])
+def test_chat_goes_to_agent(message):
+    assert router.parse(message) is None
+
+
+@pytest.mark.parametrize("message, skill, location, source", [
+    ("count python jobs in pune on naukri", "python", "pune", "naukri"),
+    ("how many react jobs in bangalore from linkedin", "react", "bangalore", "linkedin"),
+    ("count naukri jobs in pune", None, "pune", "naukri"),
+    ("how many jobs in the database", None, None, None),
+])
+def test_count(message, skill, location, source):
+    assert router.parse(message) == {"route": "count", "skill": skill, "location": location, "source": source}
+
+
+@pytest.mark.parametrize("message, query, location", [
+    ("python developer jobs in pune", "python developer", "pune"),
+    ("find me machine learning engineer jobs in bangalore", "machine learning engineer", "bangalore"),
+    ("senior data engineers jobs", "senior data engineers", None),
+    ("frontend developer jobs remote", "frontend developer", "remote"),
+    ("jobs in pune", None, "pune"),
+])
+def test_search(message, query, location):
+    intent = router.parse(message)
+    assert (intent["route"], intent["query"], intent["location"]) == ("search", query, location)
+
+
+def test_search_with_skills():
+    intent = router.parse("remote jobs requiring react and node.js")
+    assert intent["location"] == "remote"
+    assert {"react", "node.js"} <= set(intent["skills"])
+
+
+def test_latency_summary():
+    timed = IntentRouter(search_tool=None, stats_tool=None)
+    timed.record("count", 0.002)
+    timed.record("count", 0.004)
+    timed.record("llm", 1.5)
+    assert timed.latency_summary() == {"count": {"count": 2, "avg_ms": 3.0, "max_ms": 4.0},
+                                       "llm": {"count": 1, "avg_ms": 1500.0, "max_ms": 1500.0}}
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the normalized location/experience fields and the filters built on them.
+"""
+from datetime import datetime
+
+import pytest
+
+from models.job import Job
+from utils.database import DatabaseManager
+from utils.job_fields import EXP_OPEN_MAX, derive_job_fields, extract_city_ids, parse_experience_range
+from utils.job_query import build_experience_filter, build_job_filter, build_location_filter
+from utils.sqlite_database import SQLiteDatabaseManager
+
+
+@pytest.fixture(params=["sqlite", "mongodb"])
+def db(request, tmp_path):
+    if request.param == "sqlite":
+        yield SQLiteDatabaseManager(tmp_path / "jobs.db")
+    else:
+        mongomock = pytest.importorskip("mongomock")
+        yield DatabaseManager(client=mongomock.MongoClient(), db_name="joblo_test")
+
+
+def make_job(number: int, skills) -> Job:
+    return Job(title=f"Developer {number}", company="Acme", location="Pune", experience="2-5 Yrs",
+               skills=list(skills), job_description="Build APIs", posted_date=datetime(2026, 3, 2),
+               url=f"https://jobs.example.com/{number}", source="naukri")
+
+
+@pytest.mark.parametrize("experience, expected", [
+    ("3-5 Yrs", (3, 5)),
+    ("2 to 4 years", (2, 4)),
+    ("10 - 8 Yrs", (8, 10)),
+    ("5+ years", (5, EXP_OPEN_MAX)),
+    ("7 yrs", (7, 7)),
+    ("4", (4, 4)),
+    ("Entry level", (0, 2)),
+    ("Mid-Senior level", (4, EXP_OPEN_MAX)),
+    ("Not disclosed", (None, None)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_experience_range(experience, expected):
+    assert parse_experience_range(experience) == expected
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("Bengaluru, Karnataka", ["bangalore"]),
+    ("New Delhi", ["delhi"]),
+    ("Delhi NCR", ["delhi", "ncr"]),
+    ("Navi Mumbai", ["mumbai"]),
+    ("Hyderabad/Secunderabad", ["hyderabad"]),
+    ("Gurugram, Noida", ["gurgaon", "noida"]),
+    # Aliases only match whole words
+    ("Mumbaikar", []),
+    ("Remote", []),
+    ("", []),
+])
+def test_extract_city_ids(location, expected):
+    assert extract_city_ids(location) == expected
+
+
+def test_derive_job_fields():
+    job = {"location": "Work from home", "experience": "5+ Yrs", "skills": ["Python", " python", "Node.js", ""]}
+    assert derive_job_fields(job) == {
+        "location_tokens": ["work", "from", "home"], "city_ids": [], "is_remote": True,
+        "exp_min": 5, "exp_max": EXP_OPEN_MAX, "skill_ids": ["python", "node.js"],
+    }
+
+
+def test_location_filter_prefers_city_ids():
+    assert build_location_filter("Bengaluru") == {"city_ids": "bangalore"}
+    assert build_location_filter("Delhi NCR") == {"city_ids": {"$in": ["delhi", "ncr"]}}
+    assert build_location_filter("remote") == {"is_remote": True}
+    assert build_location_filter("Karnataka") == {"location_tokens": "karnataka"}
+    assert build_location_filter("Electronic City") == {"location_tokens": {"$all": ["electronic", "city"]}}
+
+
+def test_experience_filter_matches_overlapping_ranges():
+    assert build_experience_filter("2-4 years") == {"exp_min": {"$lte": 4}, "exp_max": {"$gte": 2}}
+    assert build_experience_filter("Not disclosed") == {"experience": {"$regex": "Not\\ disclosed", "$options": "i"}}
+
+
+def test_job_filter_ignores_all():
+    assert build_job_filter(location="All", source="All") == {}
+    assert build_job_filter(query="python", source="Naukri") == {"$text": {"$search": "python"}, "source": "naukri"}
+
+
+def test_skill_filter_ignores_case(db):
+    db.upsert_jobs([make_job(1, ["Python", "AWS"]), make_job(2, ["python"]), make_job(3, ["Java"])])
+    query = build_job_filter(skills=["PYTHON"])
+    assert query == {"skill_ids": {"$in": ["python"]}}
+    assert sorted(job["title"] for job in db.find_jobs(query)) == ["Developer 1", "Developer 2"]
+    assert [job["title"] for job in db.find_jobs(build_job_filter(skills=["aws"]))] == ["Developer 1"]
+
+
+def test_skill_ids_follow_skill_updates(db):
+    db.upsert_jobs([make_job(1, [])])
+    job_id = str(db.find_jobs({})[0]["_id"])
+    assert db.update_job(job_id, {"skills": ["Docker"]})
+    assert [job["title"] for job in db.find_jobs(build_job_filter(skills=["docker"]))] == ["Developer 1"]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the incrementally maintained job statistics counters, on the
+SQLite backend and on MongoDB (mongomock).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.job import Job
+from utils.database import DatabaseManager
+from utils.job_stats import STATS_FIELDS, count_job_stats, posting_week
+from utils.sqlite_database import SQLiteDatabaseManager
+
+POSTED = datetime(2026, 3, 2, 12, 0)
+
+
+@pytest.fixture(params=["sqlite", "mongodb"])
+def db(request, tmp_path):
+    if request.param == "sqlite":
+        yield SQLiteDatabaseManager(tmp_path / "jobs.db")
+    else:
+        mongomock = pytest.importorskip("mongomock")
+        yield DatabaseManager(client=mongomock.MongoClient(), db_name="joblo_test")
+
+
+def make_job(number: int = 1, skills=("Python",), city: str = "Pune", source: str = "naukri",
+             posted_date: datetime = POSTED, **fields) -> Job:
+    job = {"title": f"Developer {number}", "company": "Acme", "location": city, "experience": "2-5 Yrs",
+           "skills": list(skills), "job_description": "Build APIs", "posted_date": posted_date,
+           "url": f"https://jobs.example.com/{number}", "source": source}
+    return Job(**{**job, **fields})
+
+
+def recounted(db, dimension: str):
+    """What rebuilding the counters from the stored jobs would give"""
+    counts = count_job_stats(db.iter_jobs(projection=STATS_FIELDS))
+    return {key: count for (name, key), count in counts.items() if name == dimension and count}
+
+
+def test_new_postings_add_to_counters(db):
+    db.upsert_jobs([make_job(1), make_job(2, skills=("Python", "SQL"), city="Mumbai")])
+    assert db.get_stats("total") == {"all": 2}
+    assert db.get_stats("skill") == {"python": 2, "sql": 1}
+    assert db.get_stats("skill_city") == {"python|pune": 1, "python|mumbai": 1, "sql|mumbai": 1}
+
+
+def test_refresh_moves_counters_with_the_posting(db):
+    db.upsert_jobs([make_job(1, skills=("Python",))])
+    result = db.upsert_jobs([make_job(1, skills=("Java",), city="Mumbai", source="linkedin")])
+
+    assert result["inserted"] == 0 and result["matched"] == 1
+    assert db.get_stats("total") == {"all": 1}
+    for dimension in ("skill", "city", "source", "skill_city_source"):
+        assert db.get_stats(dimension) == recounted(db, dimension)
+    assert db.get_stats("skill") == {"java": 1}
+    assert db.get_stats("city") == {"mumbai": 1}
+
+
+def test_relative_posting_dates_move_the_week(db):
+    db.upsert_jobs([make_job(1)])
+    # "Posted 2 days ago" scraped again a week later resolves to a later date
+    later = POSTED + timedelta(days=7)
+    db.upsert_jobs([make_job(1, posted_date=later)])
+    assert db.get_stats("week") == {posting_week(later): 1}
+
+
+def test_refresh_without_facet_changes_keeps_counters(db):
+    db.upsert_jobs([make_job(1), make_job(2)])
+    before = {dimension: db.get_stats(dimension) for dimension in ("total", "skill", "week", "exp_band")}
+    db.upsert_jobs([make_job(1, job_description="Build and run APIs"), make_job(2)])
+    assert {dimension: db.get_stats(dimension) for dimension in before} == before
+
+
+def test_update_job_moves_counters(db):
+    result = db.upsert_jobs([make_job(1)])
+    job_id = result["upserted_ids"][0]
+    assert db.update_job(job_id, {"skills": ["Go"]})
+    assert db.get_stats("skill") == {"go": 1}
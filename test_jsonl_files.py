@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming JSONL output and its tolerant reader.
+"""
+from datetime import datetime
+
+import pytest
+
+from utils import jsonl_files
+from utils.jsonl_files import JsonlWriter, iter_jsonl, jsonl_path, load_jobs_file
+from utils.sqlite_database import SQLiteDatabaseManager
+
+COMPRESSIONS = ["none", "gzip", pytest.param("zstd", marks=pytest.mark.skipif(
+    not jsonl_files.ZSTD_AVAILABLE, reason="zstandard not installed"))]
+
+
+def records(count: int, start: int = 0):
+    return [{"number": number, "title": f"Job {number}"} for number in range(start, start + count)]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_round_trip_and_append(tmp_path, compression):
+    path = jsonl_path(tmp_path, "jobs", compression)
+    assert path.name == "jobs" + jsonl_files.EXTENSIONS[compression]
+    with JsonlWriter(path) as writer:
+        for record in records(3):
+            writer.write(record)
+    assert writer.records == 3
+    # Appending (a new gzip member / zstd frame) keeps earlier records readable
+    with JsonlWriter(path) as writer:
+        for record in records(2, start=3):
+            writer.write(record)
+    assert list(iter_jsonl(path)) == records(5)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_flushed_records_survive_a_truncated_file(tmp_path, compression):
+    path = jsonl_path(tmp_path, "jobs", compression)
+    writer = JsonlWriter(path)
+    for record in records(50):
+        writer.write(record)
+    writer.flush()
+    flushed = path.stat().st_size
+    for record in records(50, start=50):
+        writer.write(record)
+    writer.close()
+
+    # Simulate a writer killed mid-frame: cut the file part-way through the unflushed tail
+    data = path.read_bytes()
+    path.write_bytes(data[:flushed + (len(data) - flushed) // 2])
+    read = list(iter_jsonl(path))
+    assert read[:50] == records(50)
+    assert read == records(len(read))
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    # Including a last line cut off mid-record
+    path.write_text('{"number": 0}\nnot json\n\n{"number": 1}\n{"number": 2', encoding="utf-8")
+    assert list(iter_jsonl(path)) == [{"number": 0}, {"number": 1}]
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown JSONL compression"):
+        jsonl_path(tmp_path, "jobs", "bzip2")
+
+
+def test_load_jobs_file_counts_invalid_records(tmp_path):
+    path = tmp_path / "jobs.jsonl.gz"
+    with JsonlWriter(path) as writer:
+        for number in range(5):
+            writer.write({"title": f"Developer {number}", "company": "Acme", "location": "Pune",
+                          "experience": "2-5 Yrs", "skills": ["Python"], "job_description": "Build APIs",
+                          "posted_date": datetime(2026, 3, 2), "url": f"https://jobs.example.com/{number}",
+                          "source": "naukri"})
+        writer.write({"title": "No company"})
+
+    db = SQLiteDatabaseManager(tmp_path / "jobs.db")
+    stats = load_jobs_file(path, db, batch_size=2)
+    assert stats == {"read": 6, "loaded": 5, "inserted": 5, "invalid": 1}
+    assert load_jobs_file(path, db)["inserted"] == 0
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the raw listing page archive: storage round trips, deduplication,
+what the scrapers archive, and re-parsing archived pages with replay_jobs.
+"""
+import pytest
+
+from conftest import fixture_page, recorded
+from scrapers.naukri_scraper import NaukriScraper, SEARCH_API_PATH
+from scrapers.page_archive import PageArchive, ZSTD_AVAILABLE
+from scrapers.replay import replay_jobs, benchmark_parsers
+from test_http_scraping import FixtureDriver, NAUKRI_RESULTS_PATH
+
+COMPRESSIONS = ["gzip", pytest.param("zstd", marks=pytest.mark.skipif(not ZSTD_AVAILABLE,
+                                                                     reason="zstandard not installed"))]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_store_and_load_round_trip(tmp_path, compression):
+    archive = PageArchive(tmp_path, compression)
+    content = fixture_page("naukri_results.html")
+
+    digest = archive.store(content, "naukri", "html", "https://example.com/jobs", query="python")
+
+    assert archive.load(digest) == content
+    [entry] = archive.entries()
+    assert entry["sha256"] == digest and entry["url"] == "https://example.com/jobs"
+    assert entry["query"] == "python" and entry["bytes"] == len(content.encode("utf-8"))
+    assert entry["stored_bytes"] < entry["bytes"]
+
+
+def test_identical_pages_are_stored_once(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+
+    first = archive.store("<html>same</html>", "naukri")
+    second = archive.store("<html>same</html>", "linkedin")
+    other = archive.store("<html>other</html>", "linkedin")
+
+    assert first == second != other
+    assert [entry["sha256"] for entry in archive.entries()] == [first, other]
+    assert len(list((tmp_path / "objects").rglob("*.gz"))) == 2
+
+
+def test_load_reads_objects_written_with_another_compression(tmp_path):
+    digest = PageArchive(tmp_path, "gzip").store("<html>page</html>", "naukri")
+
+    assert PageArchive(tmp_path, "zstd").load(digest) == "<html>page</html>"
+    with pytest.raises(KeyError):
+        PageArchive(tmp_path, "gzip").load("0" * 64)
+
+
+def test_entries_and_stats_per_source(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+    archive.store("<html>a</html>", "naukri")
+    archive.store("<html>b</html>", "naukri")
+    archive.store("<html>c</html>", "linkedin")
+
+    assert len(list(archive.entries("naukri"))) == 2
+    stats = archive.stats()
+    assert stats["pages"] == 3
+    assert stats["by_source"]["naukri"]["pages"] == 2 and stats["by_source"]["linkedin"]["pages"] == 1
+    assert stats["bytes"] == sum(counts["bytes"] for counts in stats["by_source"].values())
+
+
+def test_empty_archive(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+
+    assert list(archive.entries()) == []
+    assert archive.stats()["pages"] == 0 and archive.stats()["ratio"] == 0.0
+    assert list(replay_jobs(archive, ["naukri"])) == []
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        PageArchive(tmp_path, "lz4")
+
+
+def test_http_responses_are_archived_and_replayed(fixture_server, tmp_path):
+    fixture_server.serve(SEARCH_API_PATH, recorded("naukri_search_api.json"))
+    archive = PageArchive(tmp_path, "gzip")
+    scraper = NaukriScraper(base_url=fixture_server.url, mode="http", archive=archive)
+
+    scraped = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+
+    [entry] = archive.entries()
+    assert entry["source"] == "naukri" and entry["kind"] == "json"
+    assert entry["url"].startswith(f"{fixture_server.url}{SEARCH_API_PATH}")
+    replayed = list(replay_jobs(archive, ["naukri"]))
+    # Replay parsers resolve relative links against the real site, not the fixture server
+    assert [job.url.rsplit("/", 1)[1] for job in replayed] == [job.url.rsplit("/", 1)[1] for job in scraped]
+    assert [job.skills for job in replayed] == [job.skills for job in scraped]
+
+
+def test_browser_results_page_is_archived_once_under_its_url(fixture_server, tmp_path):
+    fixture_server.serve(SEARCH_API_PATH, (403, "text/html", "<html>Access Denied</html>"))
+    fixture_server.serve(NAUKRI_RESULTS_PATH, recorded("naukri_results.html"))
+    archive = PageArchive(tmp_path, "gzip")
+    scraper = NaukriScraper(driver=FixtureDriver(), base_url=fixture_server.url, mode="auto", archive=archive)
+
+    scraped = scraper.scrape_jobs("python developer", "pune", num_jobs=10)
+
+    # The blocked API response is not archived, the results page is, once
+    [entry] = archive.entries()
+    assert entry["kind"] == "html" and entry["url"] == f"{fixture_server.url}{NAUKRI_RESULTS_PATH}"
+    assert [job.title for job in replay_jobs(archive)] == [job.title for job in scraped]
+
+
+def test_replay_yields_postings_seen_on_several_pages_once(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+    page = fixture_page("naukri_results.html")
+    archive.store(page, "naukri", "html")
+    # A later snapshot of the same results in which one title was edited
+    archive.store(page.replace("Backend Engineer", "Backend Engineer II", 1), "naukri", "html")
+
+    titles = [job.title for job in replay_jobs(archive, ["naukri"])]
+
+    assert titles == ["Python Developer", "Backend Engineer"]
+
+
+def test_replay_skips_unparseable_pages_and_unknown_sources(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+    archive.store("{not json", "naukri", "json")
+    archive.store(fixture_page("naukri_results.html"), "naukri", "html")
+    archive.store("<html></html>", "indeed", "html")
+
+    assert len(list(replay_jobs(archive, ["naukri"]))) == 2
+    with pytest.raises(ValueError):
+        list(replay_jobs(archive, ["indeed"]))
+
+
+def test_benchmark_counts_archived_pages_per_source(tmp_path):
+    archive = PageArchive(tmp_path, "gzip")
+    archive.store(fixture_page("naukri_results.html"), "naukri", "html")
+    archive.store(fixture_page("naukri_search_api.json"), "naukri", "json")
+
+    report = benchmark_parsers(archive, ["naukri"], repeat=1)
+
+    assert report["pages"] == 2 and report["repeat"] == 1
+    assert report["by_source"]["naukri"]["pages"] == 2 and report["by_source"]["naukri"]["jobs"] == 5
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for keyset (seek) pagination cursors on the SQLite and MongoDB backends.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.job import Job
+from utils.database import DatabaseManager
+from utils.pagination import ORDER_BY_DATE, ORDER_BY_RELEVANCE, encode_cursor, decode_cursor
+from utils.sqlite_database import SQLiteDatabaseManager
+
+POSTED = datetime(2026, 3, 2, 12, 0)
+
+
+@pytest.fixture(params=["sqlite", "mongodb"])
+def db(request, tmp_path):
+    if request.param == "sqlite":
+        yield SQLiteDatabaseManager(tmp_path / "jobs.db")
+    else:
+        mongomock = pytest.importorskip("mongomock")
+        yield DatabaseManager(client=mongomock.MongoClient(), db_name="joblo_test")
+
+
+def make_job(number: int, posted_date, title: str = "Python Developer") -> Job:
+    return Job(title=f"{title} {number}", company="Acme", location="Pune", experience="2-5 Yrs",
+               skills=["Python"], job_description="Build APIs", posted_date=posted_date,
+               url=f"https://jobs.example.com/{number}", source="naukri")
+
+
+def all_pages(db, page_size: int, query=None, order: str = ORDER_BY_DATE):
+    pages, cursor = [], None
+    while True:
+        page = db.find_jobs_page(query or {}, page_size=page_size, cursor=cursor, order=order)
+        pages.append([job["url"] for job in page["jobs"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(ORDER_BY_DATE, {"_id": "abc", "posted_date": POSTED})
+    assert decode_cursor(cursor, ORDER_BY_DATE) == {"o": ORDER_BY_DATE, "i": "abc", "d": POSTED}
+
+    undated = decode_cursor(encode_cursor(ORDER_BY_DATE, {"_id": "abc"}), ORDER_BY_DATE)
+    assert undated["d"] is None
+
+    relevance = encode_cursor(ORDER_BY_RELEVANCE, {"_id": "abc"}, score=1.5)
+    assert decode_cursor(relevance, ORDER_BY_RELEVANCE)["s"] == 1.5
+
+
+def test_cursor_is_tied_to_its_ordering():
+    cursor = encode_cursor(ORDER_BY_DATE, {"_id": "abc", "posted_date": POSTED})
+    with pytest.raises(ValueError, match="ordering"):
+        decode_cursor(cursor, ORDER_BY_RELEVANCE)
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        decode_cursor("not a cursor!", ORDER_BY_DATE)
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 7])
+def test_pages_cover_every_job_once_undated_last(db, page_size):
+    # Two jobs share a posted_date, so pages must break the tie on _id
+    dates = [POSTED, POSTED - timedelta(days=1), POSTED - timedelta(days=1), None,
+             POSTED - timedelta(days=3), None]
+    db.upsert_jobs([make_job(number, posted_date) for number, posted_date in enumerate(dates)])
+
+    pages = all_pages(db, page_size)
+    urls = [url for page in pages for url in page]
+    assert sorted(urls) == sorted(f"https://jobs.example.com/{number}" for number in range(len(dates)))
+    assert all(len(page) == page_size for page in pages[:-1])
+    # Dated jobs newest first, then the undated ones
+    numbers = [int(url.rsplit("/", 1)[1]) for url in urls]
+    assert numbers[0] == 0 and set(numbers[1:3]) == {1, 2} and numbers[3] == 4
+    assert set(numbers[4:]) == {3, 5}
+
+
+def test_pages_apply_the_query(db):
+    db.upsert_jobs([make_job(number, POSTED - timedelta(days=number), title="Java" if number % 2 else "Python")
+                    for number in range(5)])
+    pages = all_pages(db, 2, query={"title": {"$regex": "^Python"}})
+    assert [url for page in pages for url in page] == [f"https://jobs.example.com/{number}" for number in (0, 2, 4)]
+
+
+def test_relevance_pages_on_sqlite(tmp_path):
+    db = SQLiteDatabaseManager(tmp_path / "jobs.db")
+    db.upsert_jobs([make_job(number, POSTED, title="Python Python" if number < 2 else "Python Java")
+                    for number in range(5)])
+    pages = all_pages(db, 2, query={"$text": {"$search": "python"}}, order=ORDER_BY_RELEVANCE)
+    urls = [url for page in pages for url in page]
+    assert len(urls) == len(set(urls)) == 5
+    assert set(urls[:2]) == {"https://jobs.example.com/0", "https://jobs.example.com/1"}
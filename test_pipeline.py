@@ -0,0 +1,59 @@
+"""ScrapePipeline: a failing writer must not hang producers or close()"""
+import threading
+
+import pytest
+
+from models.job import Job
+from scrapers.pipeline import ScrapePipeline
+
+
+def make_job(n: int) -> Job:
+    return Job(title=f"Job {n}", company="Acme", location="Pune", experience="2 yrs", skills=["python"],
+               job_description="", url=f"https://example.com/jobs/{n}", source="naukri")
+
+
+class FailingWriter:
+    def write(self, record):
+        raise OSError("No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_stores_every_job(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    with ScrapePipeline(jsonl_path=path, batch_size=3) as pipeline:
+        for n in range(10):
+            pipeline.put(make_job(n))
+    assert pipeline.stats["written"] == 10
+    assert len(path.read_text().splitlines()) == 10
+
+
+def test_write_error_drains_queue_and_raises_from_close():
+    pipeline = ScrapePipeline(batch_size=2, queue_size=2, flush_interval=0.05)
+    pipeline.start()
+    pipeline._file = FailingWriter()
+    checkpoints = []
+    put_errors = []
+
+    def produce():
+        try:
+            for n in range(50):
+                pipeline.put(make_job(n))
+                pipeline.after_flush(lambda n=n: checkpoints.append(n))
+        except RuntimeError as e:
+            put_errors.append(e)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join(timeout=5)
+    assert not producer.is_alive(), "producer blocked on a dead writer"
+    assert put_errors
+
+    with pytest.raises(OSError, match="No space left"):
+        pipeline.close()
+    assert checkpoints == []
+    assert pipeline.stats["written"] == 0
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for columnar job snapshots and the consumers that read them.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from models.job import Job
+from recommendations.job_recommender import JobRecommender
+from scoring.job_scorer import JobScorer, SCORING_COLUMNS
+from utils.snapshot import JobSnapshot, export_snapshot
+from utils.sqlite_database import SQLiteDatabaseManager
+
+JOBS = [
+    ("Python Developer", ("Python", "Django"), "Pune"),
+    ("Senior Python Developer", ("Python", "FastAPI"), "Pune"),
+    ("Java Engineer", ("Java", "Spring"), "Mumbai"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteDatabaseManager(tmp_path / "jobs.db")
+    db.upsert_jobs([
+        Job(title=title, company="Acme", location=city, experience="2-5 Yrs", skills=list(skills),
+            job_description=f"{title} building services", posted_date=datetime.now() - timedelta(days=number),
+            url=f"https://jobs.example.com/{number}", source="naukri")
+        for number, (title, skills, city) in enumerate(JOBS)
+    ])
+    return db
+
+
+@pytest.fixture
+def snapshot_path(db, tmp_path):
+    path = tmp_path / "jobs.arrow"
+    assert export_snapshot(db, path, batch_size=2) == {"path": str(path), "jobs": 3, "skills": 5}
+    return path
+
+
+def test_snapshot_round_trip(snapshot_path):
+    snapshot = JobSnapshot.load(snapshot_path)
+    assert len(snapshot) == 3
+    assert sorted(snapshot.column("title")) == sorted(title for title, _, _ in JOBS)
+    assert snapshot.skill_vocabulary == ["django", "fastapi", "java", "python", "spring"]
+    python_jobs = [ids for ids in snapshot.column("skill_ids") if 3 in ids]
+    assert len(python_jobs) == 2
+
+    jobs = list(snapshot.iter_jobs(["_id", "title"], batch_size=1))
+    assert [set(job) for job in jobs] == [{"_id", "title"}] * 3
+    assert snapshot.take([2, 0]) == [snapshot.take([2])[0], snapshot.take([0])[0]]
+
+    snapshot.close()
+    assert snapshot.table is None
+
+
+def test_scorer_reads_only_scoring_columns(db, snapshot_path):
+    scorer = JobScorer(db=db, snapshot_path=str(snapshot_path))
+    jobs = list(scorer.load_jobs())
+    assert len(jobs) == 3
+    assert all(set(job) == set(SCORING_COLUMNS) for job in jobs)
+
+
+def test_similar_jobs_from_snapshot_columns(db, snapshot_path, monkeypatch):
+    monkeypatch.setattr("utils.snapshot.JOB_SNAPSHOT_PATH", "")
+    reference = next(job for job in db.get_all_jobs() if job["title"] == "Python Developer")
+    for path in (str(snapshot_path), ""):
+        recommender = JobRecommender(db=db, snapshot_path=path)
+        assert (recommender.snapshot is None) == (path == "")
+        recommendations = recommender.get_similar_jobs(str(reference["_id"]), num_recommendations=1)
+        assert [rec["job"]["title"] for rec in recommendations] == ["Senior Python Developer"]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the MongoDB-filter to SQL translation of the SQLite backend.
+
+Each filter is run against SQLite (hot table and archive) and against
+mongomock, and must select the same jobs.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.job import Job
+from utils.sqlite_database import SQLiteDatabaseManager, _FilterTranslator
+
+mongomock = pytest.importorskip("mongomock")
+from utils.database import DatabaseManager
+
+POSTED = datetime(2026, 3, 2, 12, 0)
+
+JOBS = [
+    # number, title, location, experience, skills, source, days old (None: undated), salary
+    (1, "Python Developer", "Pune", "2-5 Yrs", ["Python", "Django"], "naukri", 1, "10 LPA"),
+    (2, "Senior Python Engineer", "Bengaluru", "5+ years", ["python", "AWS"], "linkedin", 3, None),
+    (3, "Java Developer", "Remote", "1-3 Yrs", ["Java"], "naukri", None, "8 LPA"),
+    (4, "Data Engineer", "Mumbai, Pune", "Entry level", [], "linkedin", 10, None),
+]
+
+FILTERS = [
+    {"source": "naukri"},
+    {"source": {"$ne": "naukri"}},
+    {"salary": None},
+    {"salary": {"$ne": None}},
+    {"salary": {"$exists": True, "$ne": None}},
+    {"exp_min": {"$gte": 2}},
+    {"exp_min": {"$lte": 2}, "exp_max": {"$gte": 4}},
+    {"exp_max": {"$lt": 5}},
+    {"posted_date": {"$lt": POSTED - timedelta(days=2)}},
+    {"posted_date": {"$gt": POSTED - timedelta(days=5)}},
+    {"posted_date": None},
+    {"source": {"$in": ["linkedin", "indeed"]}},
+    {"source": {"$nin": ["linkedin"]}},
+    {"source": {"$in": []}},
+    {"title": {"$regex": "python", "$options": "i"}},
+    {"title": {"$regex": "^Java"}},
+    {"is_remote": True},
+    {"city_ids": "pune"},
+    {"city_ids": {"$in": ["bangalore", "mumbai"]}},
+    {"location_tokens": {"$all": ["mumbai", "pune"]}},
+    {"skill_ids": {"$in": ["python"]}},
+    {"skills": "Python"},
+    {"skill_ids": {"$in": []}},
+    {"$or": [{"source": "linkedin"}, {"city_ids": "pune"}]},
+    {"$and": [{"source": "naukri"}, {"$or": [{"is_remote": True}, {"exp_min": {"$gte": 2}}]}]},
+    {},
+]
+
+
+def make_job(number, title, location, experience, skills, source, days_old, salary) -> Job:
+    return Job(title=title, company="Acme", location=location, experience=experience, skills=skills,
+               job_description=f"{title} building services", salary=salary,
+               posted_date=POSTED - timedelta(days=days_old) if days_old is not None else None,
+               url=f"https://jobs.example.com/{number}", source=source)
+
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory):
+    jobs = [make_job(*job) for job in JOBS]
+    sqlite = SQLiteDatabaseManager(tmp_path_factory.mktemp("filters") / "jobs.db")
+    sqlite.upsert_jobs(jobs)
+    archive = SQLiteDatabaseManager(tmp_path_factory.mktemp("archive") / "jobs.db")
+    archive.upsert_jobs(jobs)
+    assert archive.archive_jobs(POSTED + timedelta(days=3650)) == len(jobs)
+    mongo = DatabaseManager(client=mongomock.MongoClient(), db_name="joblo_test")
+    mongo.upsert_jobs(jobs)
+    return sqlite, archive, mongo
+
+
+def urls(jobs):
+    return sorted(job["url"] for job in jobs)
+
+
+@pytest.mark.parametrize("query", FILTERS, ids=str)
+def test_filters_match_mongodb(backends, query):
+    sqlite, archive, mongo = backends
+    expected = urls(mongo.find_jobs(query))
+    assert urls(sqlite.find_jobs(query)) == expected
+    assert urls(archive.find_archived_jobs(query)) == expected
+
+
+def test_text_search(backends):
+    sqlite, archive, _ = backends
+    query = {"$text": {"$search": "python"}, "source": "naukri"}
+    assert urls(sqlite.find_jobs(query)) == ["https://jobs.example.com/1"]
+    assert urls(archive.find_archived_jobs(query)) == ["https://jobs.example.com/1"]
+
+
+def test_translation_binds_every_value():
+    translator = _FilterTranslator()
+    where = translator.translate({"source": "naukri", "city_ids": {"$in": ["pune", "mumbai"]}, "exp_min": None})
+    assert translator.params == ["naukri", "city_ids", "pune", "mumbai"]
+    assert where.count("?") == len(translator.params)
+    assert "exp_min IS NULL" in where and "naukri" not in where
+
+
+@pytest.mark.parametrize("query", [{"source": {"$size": 1}}, {"skills": {"$nin": ["Java"]}}], ids=str)
+def test_unsupported_operators_raise(query):
+    with pytest.raises(ValueError, match="Unsupported"):
+        _FilterTranslator().translate(query)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for JobVectorIndex.sync: only new and changed jobs are embedded and the
+vectors of removed jobs are dropped, using the offline hashing embeddings.
+"""
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("langchain_community")
+pytest.importorskip("sklearn")
+
+from agents.embeddings import HashingEmbeddings
+from agents.vector_index import JobVectorIndex
+from models.job import Job
+from utils.sqlite_database import SQLiteDatabaseManager
+
+
+class CountingHashingEmbeddings(HashingEmbeddings):
+    """Hashing embeddings that record how many texts were embedded"""
+
+    def __init__(self):
+        super().__init__(n_features=256)
+        self.embedded = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+def make_job(number: int, description: str = "Build REST APIs in Python.") -> Job:
+    return Job(title=f"Python Developer {number}", company="Acme", location="Pune", experience="2-5 Yrs",
+               skills=["Python", "Django"], job_description=description,
+               url=f"https://example.com/jobs/{number}", source="naukri")
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SQLiteDatabaseManager(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def embeddings():
+    return CountingHashingEmbeddings()
+
+
+@pytest.fixture
+def index(db, embeddings, tmp_path):
+    return JobVectorIndex(db, embeddings, persist_directory=str(tmp_path / "chroma"),
+                          collection_name="jobs_test", batch_size=2)
+
+
+def job_ids(db):
+    return {job["title"]: str(job["_id"]) for job in db.get_all_jobs()}
+
+
+def test_first_sync_adds_every_job(db, index, embeddings):
+    db.upsert_jobs([make_job(number) for number in range(5)])
+
+    stats = index.sync()
+
+    assert (stats["jobs"], stats["added"], stats["updated"], stats["removed"]) == (5, 5, 0, 0)
+    assert stats["chunks"] == embeddings.embedded == 5
+    assert set(index.indexed_jobs()) == set(job_ids(db).values())
+
+
+def test_unchanged_jobs_are_not_embedded_again(db, index, embeddings):
+    db.upsert_jobs([make_job(number) for number in range(3)])
+    index.sync()
+    embeddings.embedded = 0
+
+    stats = index.sync()
+
+    assert (stats["unchanged"], stats["added"], stats["chunks"]) == (3, 0, 0)
+    assert embeddings.embedded == 0
+
+
+def test_new_and_changed_jobs_are_embedded(db, index, embeddings):
+    db.upsert_jobs([make_job(number) for number in range(3)])
+    index.sync()
+    embeddings.embedded = 0
+    changed = job_ids(db)["Python Developer 1"]
+    db.update_job(changed, {"job_description": "Run Kubernetes clusters."})
+    db.upsert_jobs([make_job(3)])
+
+    stats = index.sync()
+
+    assert (stats["added"], stats["updated"], stats["unchanged"], stats["removed"]) == (1, 1, 2, 0)
+    assert embeddings.embedded == 2
+    [match] = index.store.similarity_search("Kubernetes clusters", k=1)
+    assert match.metadata["job_id"] == changed
+
+
+def test_shorter_text_drops_extra_chunks(db, index):
+    db.upsert_jobs([make_job(1, description="Python services and data pipelines. " * 100)])
+    index.sync()
+    job_id = job_ids(db)["Python Developer 1"]
+    assert len(index.indexed_jobs()[job_id]["ids"]) > 1
+
+    db.update_job(job_id, {"job_description": "Python services."})
+    stats = index.sync()
+
+    assert stats["updated"] == 1
+    assert index.indexed_jobs()[job_id]["ids"] == [f"{job_id}:0"]
+
+
+def test_removed_jobs_are_dropped(db, index):
+    db.upsert_jobs([make_job(number) for number in range(4)])
+    index.sync()
+    ids = job_ids(db)
+    removed = [ids["Python Developer 0"], ids["Python Developer 2"]]
+    db.delete_jobs(removed)
+
+    stats = index.sync()
+
+    assert (stats["removed"], stats["unchanged"]) == (2, 2)
+    assert set(index.indexed_jobs()) == set(ids.values()) - set(removed)
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator, Callable
+from config.settings import JOB_ARCHIVE_AFTER_DAYS, JOB_ARCHIVE_MODE, ARCHIVE_DATA_DIR
+from utils.base_database import BaseDatabaseManager
+from utils.job_documents import stale_jobs_filter
+from utils.jsonl_files import JsonlWriter, iter_jsonl
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JobArchiver:
+    """Moves stale postings out of the hot job set.
+
+    In "collection" mode jobs are moved to the backend's archive collection,
+    where find_archived_jobs can still query them. In "file" mode they are
+    compacted into gzip-compressed JSONL files under ARCHIVE_DATA_DIR and read
+    back on demand with iter_file_archive.
+    """
+
+    def __init__(self, db: BaseDatabaseManager, max_age_days: int = JOB_ARCHIVE_AFTER_DAYS,
+                 mode: str = JOB_ARCHIVE_MODE, archive_dir: Path = ARCHIVE_DATA_DIR):
+        if mode not in ("collection", "file"):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.db = db
+        self.max_age_days = max_age_days
+        self.mode = mode
+        self.archive_dir = Path(archive_dir)
+
+    def cutoff(self) -> datetime:
+        return datetime.now() - timedelta(days=self.max_age_days)
+
+    def run(self, batch_size: int = 500) -> Dict[str, Any]:
+        """Archive every job older than the configured age"""
+        cutoff = self.cutoff()
+        if self.mode == "collection":
+            archived = self.db.archive_jobs(cutoff, batch_size=batch_size)
+            return {"mode": self.mode, "cutoff": cutoff, "archived": archived}
+
+        archived, path = self._compact_to_file(cutoff, batch_size)
+        return {"mode": self.mode, "cutoff": cutoff, "archived": archived, "file": str(path) if path else None}
+
+    def _compact_to_file(self, cutoff: datetime, batch_size: int):
+        """Write stale jobs to a compressed JSONL file, then drop them from the hot set"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"jobs_archive_{datetime.now():%Y%m%d_%H%M%S}.jsonl.gz"
+        archived_at = datetime.now()
+        job_ids = []
+
+        with JsonlWriter(path) as writer:
+            for job in self.db.iter_jobs(stale_jobs_filter(cutoff), batch_size=batch_size):
+                job_ids.append(str(job["_id"]))
+                writer.write({**job, "_id": str(job["_id"]), "archived_at": archived_at})
+
+        if not job_ids:
+            path.unlink()
+            return 0, None
+
+        # Only delete after the file is fully written and closed
+        for i in range(0, len(job_ids), batch_size):
+            self.db.delete_jobs(job_ids[i:i + batch_size])
+        logger.info(f"Compacted {len(job_ids)} jobs into {path}")
+        return len(job_ids), path
+
+    def iter_file_archive(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream jobs back out of the compressed archive files"""
+        for path in sorted(self.archive_dir.glob("jobs_archive_*.jsonl.gz")):
+            for job in iter_jsonl(path):
+                if predicate is None or predicate(job):
+                    yield job
+
+    def find_archived(self, query: Dict[str, Any], limit: Optional[int] = None):
+        """Query archived jobs in collection mode"""
+        return self.db.find_archived_jobs(query, limit=limit)
@@ -0,0 +1,314 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional, AsyncIterator, Set, Tuple
+from pymongo import ReturnDocument
+from config.settings import MONGODB_DB_NAME
+from models.job import Job
+from utils.mongo_client import get_motor_client, get_pool_metrics
+from utils.job_documents import (
+    IDENTITY_FIELDS, job_to_document, job_identity_filter, identity_key, order_by_ids, stale_jobs_filter,
+    with_derived_updates,
+)
+from utils.job_stats import STATS_FIELDS, refreshed_stats, stats_rebuild_pipelines
+from utils.mongo_queries import (
+    DATE_ORDER, MISSING_DERIVED_FIELDS, DERIVED_SOURCE_FIELDS, JOBS_INDEXES, ARCHIVE_INDEXES, STATS_INDEXES,
+    MongoCollections, summarize_explain, ids_filter, stats_operations, stats_query, stats_counter_stages,
+    archive_refresh_operations, upsert_operations, archive_operations, backfill_operation,
+    relevance_page_pipeline, date_page_filter, decode_last_id, upsert_result, split_archived,
+)
+from utils.pagination import ORDER_BY_DATE, ORDER_BY_RELEVANCE, decode_cursor, build_page
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseManager(MongoCollections):
+    """Async counterpart of DatabaseManager built on motor.
+
+    Every method mirrors the synchronous API but returns a coroutine, so many
+    queries can be awaited concurrently (e.g. with asyncio.gather) on a single
+    event loop thread. Queries and updates are built by utils.mongo_queries,
+    shared with DatabaseManager.
+    """
+
+    backend = "mongodb"
+
+    def __init__(self, client=None, db_name: str = MONGODB_DB_NAME):
+        # Without an explicit client the manager shares the per-loop motor pool
+        self._client = client
+        self.db_name = db_name
+
+    @property
+    def client(self):
+        return self._client or get_motor_client()
+
+    async def _apply_stats(self, documents: List[Dict[str, Any]], sign: int = 1):
+        """Add (or with sign=-1 remove) jobs' contributions to the statistics counters"""
+        operations = stats_operations(documents, sign)
+        if not operations:
+            return
+        try:
+            await self.stats_collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.warning(f"Error updating job statistics: {e}")
+
+    async def insert_job(self, job: Job) -> str:
+        """Insert a single job into the database"""
+        try:
+            document = job_to_document(job)
+            result = await self.jobs_collection.insert_one(document)
+            await self._apply_stats([document])
+            return str(result.inserted_id)
+        except Exception as e:
+            logger.error(f"Error inserting job: {e}")
+            raise
+
+    async def insert_jobs(self, jobs: List[Job]) -> List[str]:
+        """Insert multiple jobs into the database"""
+        try:
+            documents = [job_to_document(job) for job in jobs]
+            result = await self.jobs_collection.insert_many(documents)
+            await self._apply_stats(documents)
+            return [str(id) for id in result.inserted_ids]
+        except Exception as e:
+            logger.error(f"Error inserting jobs: {e}")
+            raise
+
+    async def _archived_identities(self, documents: List[Dict[str, Any]]) -> Set[Tuple]:
+        """Identities of the given postings that are already in the archive"""
+        filters = {identity_key(document): job_identity_filter(document) for document in documents}
+        archived = await self.archive_collection.find({"$or": list(filters.values())}, IDENTITY_FIELDS).to_list(length=None)
+        return {identity_key(job) for job in archived}
+
+    async def _stored_stats(self, documents: List[Dict[str, Any]]) -> Dict[Tuple, Dict[str, Any]]:
+        """Stats fields of the given postings that are already in the hot set, by identity"""
+        filters = [job_identity_filter(document) for document in documents]
+        stored = self.jobs_collection.find({"$or": filters}, {**IDENTITY_FIELDS, **STATS_FIELDS})
+        return {identity_key(job): job for job in await stored.to_list(length=None)}
+
+    async def upsert_jobs(self, jobs: List[Job]) -> Dict[str, Any]:
+        """Insert new jobs and refresh known ones in a single bulk write.
+
+        Postings that were archived and are still listed are refreshed in the
+        archive rather than inserted into the hot set again.
+        """
+        result = {"inserted": 0, "matched": 0, "modified": 0, "archived": 0, "upserted_ids": {}}
+        if not jobs:
+            return result
+        try:
+            documents = [job_to_document(job) for job in jobs]
+            archived = await self._archived_identities(documents)
+            hot, refreshed = split_archived(documents, archived)
+            if refreshed:
+                await self.archive_collection.bulk_write(archive_refresh_operations(refreshed, datetime.now()),
+                                                         ordered=False)
+                result["archived"] = len(refreshed)
+            if not hot:
+                return result
+
+            hot_documents = [documents[index] for index in hot]
+            stored = await self._stored_stats(hot_documents)
+            written = await self.jobs_collection.bulk_write(upsert_operations(hot_documents), ordered=False)
+            # New postings add to the counters; refreshed ones move if the re-scrape changed their facets
+            before, after = refreshed_stats(stored, hot_documents)
+            await self._apply_stats(before, -1)
+            await self._apply_stats([hot_documents[position] for position in written.upserted_ids] + after)
+            result.update(upsert_result(written, hot))
+            return result
+        except Exception as e:
+            logger.error(f"Error upserting jobs: {e}")
+            raise
+
+    async def find_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs based on query"""
+        cursor = self.jobs_collection.find(query)
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=None)
+
+    async def find_jobs_page(self, query: Dict[str, Any], page_size: int = 20,
+                             cursor: Optional[str] = None, order: str = ORDER_BY_DATE) -> Dict[str, Any]:
+        """Find one page of jobs using keyset (seek) pagination.
+
+        Pages are ordered by (posted_date, _id) or, for $text queries, by
+        (text score, _id). The returned next_cursor is opaque and resumes right
+        after the last job, so deep pages never pay for skipped documents.
+        """
+        position = decode_cursor(cursor, order) if cursor else None
+        last_id = decode_last_id(position)
+
+        if order == ORDER_BY_RELEVANCE:
+            pipeline = relevance_page_pipeline(query, position, last_id, page_size)
+            jobs = await self.jobs_collection.aggregate(pipeline).to_list(length=None)
+        else:
+            results = self.jobs_collection.find(date_page_filter(query, position, last_id))
+            jobs = await results.sort(DATE_ORDER).limit(page_size + 1).to_list(length=None)
+
+        return build_page(jobs, page_size, order)
+
+    async def find_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Find a single job by ID"""
+        from bson import ObjectId
+        return await self.jobs_collection.find_one({"_id": ObjectId(job_id)})
+
+    async def find_jobs_by_ids(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several jobs in one round-trip, preserving the order of job_ids"""
+        if not job_ids:
+            return []
+        cursor = self.jobs_collection.find(ids_filter(job_ids))
+        return order_by_ids(await cursor.to_list(length=None), job_ids)
+
+    async def update_job(self, job_id: str, update_data: Dict[str, Any]) -> bool:
+        """Update a job"""
+        from bson import ObjectId
+        update_data = with_derived_updates(update_data)
+        if not any(field in STATS_FIELDS for field in update_data):
+            result = await self.jobs_collection.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$set": update_data}
+            )
+            return result.modified_count > 0
+
+        # Fields behind the statistics changed: move the job's counters along with it
+        before = await self.jobs_collection.find_one_and_update(
+            {"_id": ObjectId(job_id)},
+            {"$set": update_data},
+            projection=STATS_FIELDS,
+            return_document=ReturnDocument.BEFORE
+        )
+        if before is None:
+            return False
+        after = {**before, **update_data}
+        if before == after:
+            return False
+        await self._apply_stats([before], -1)
+        await self._apply_stats([after])
+        return True
+
+    async def get_all_jobs(self) -> List[Dict[str, Any]]:
+        """Get all jobs from the database"""
+        return await self.jobs_collection.find().to_list(length=None)
+
+    async def iter_jobs(self, query: Optional[Dict[str, Any]] = None,
+                        projection: Optional[Dict[str, Any]] = None,
+                        batch_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream jobs from a server-side cursor without loading them all into memory"""
+        cursor = self.jobs_collection.find(query or {}, projection).batch_size(batch_size)
+        try:
+            async for job in cursor:
+                yield job
+        finally:
+            await cursor.close()
+
+    async def search_jobs(self, text: str) -> List[Dict[str, Any]]:
+        """Search jobs using text search"""
+        return await self.jobs_collection.find(
+            {"$text": {"$search": text}}
+        ).to_list(length=None)
+
+    async def archive_jobs(self, cutoff: datetime, batch_size: int = 500) -> int:
+        """Move jobs posted before cutoff from the hot collection to jobs_archive.
+
+        Archived jobs are keyed by their posting identity (URL), and each batch
+        is copied before it is deleted, as in DatabaseManager.archive_jobs.
+        """
+        archived = 0
+        archived_at = datetime.now()
+        while True:
+            batch = await self.jobs_collection.find(stale_jobs_filter(cutoff)).limit(batch_size).to_list(length=None)
+            if not batch:
+                break
+            await self.archive_collection.bulk_write(archive_operations(batch, archived_at), ordered=False)
+            await self.jobs_collection.delete_many({"_id": {"$in": [job["_id"] for job in batch]}})
+            await self._apply_stats(batch, sign=-1)
+            archived += len(batch)
+        logger.info(f"Archived {archived} jobs posted before {cutoff:%Y-%m-%d}")
+        return archived
+
+    async def iter_archived_jobs(self, query: Optional[Dict[str, Any]] = None,
+                                 projection: Optional[Dict[str, Any]] = None,
+                                 batch_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream jobs from the archive collection"""
+        cursor = self.archive_collection.find(query or {}, projection).batch_size(batch_size)
+        try:
+            async for job in cursor:
+                yield job
+        finally:
+            await cursor.close()
+
+    async def find_archived_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs in the archive collection"""
+        cursor = self.archive_collection.find(query)
+        if limit:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=None)
+
+    async def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs from the hot collection"""
+        if not job_ids:
+            return 0
+        id_filter = ids_filter(job_ids)
+        documents = await self.jobs_collection.find(id_filter, STATS_FIELDS).to_list(length=None)
+        result = await self.jobs_collection.delete_many(id_filter)
+        await self._apply_stats(documents, sign=-1)
+        return result.deleted_count
+
+    async def get_stats(self, dimension: str, keys: Optional[List[str]] = None) -> Dict[str, int]:
+        """Read market statistics counters for one dimension (optionally only some keys)"""
+        documents = await self.stats_collection.find(stats_query(dimension, keys),
+                                                     {"key": 1, "count": 1}).to_list(length=None)
+        return {doc["key"]: doc["count"] for doc in documents}
+
+    async def rebuild_stats(self) -> int:
+        """Recompute the statistics counters server-side, swapped in with one rename"""
+        rebuild = self.db.job_stats_rebuild
+        await rebuild.drop()
+        for dimension, pipeline in stats_rebuild_pipelines().items():
+            await self.jobs_collection.aggregate(pipeline + stats_counter_stages(dimension, rebuild.name)).to_list(length=None)
+        counters = await rebuild.count_documents({})
+        if counters:
+            await rebuild.rename(self.stats_collection.name, dropTarget=True)
+        else:
+            await self.stats_collection.drop()
+        for keys in STATS_INDEXES:
+            await self.stats_collection.create_index(keys)
+        logger.info(f"Rebuilt {counters} job statistics counters")
+        return counters
+
+    async def create_indexes(self):
+        """Create necessary indexes for better performance"""
+        for collection, indexes in ((self.jobs_collection, JOBS_INDEXES),
+                                    (self.archive_collection, ARCHIVE_INDEXES),
+                                    (self.stats_collection, STATS_INDEXES)):
+            for keys in indexes:
+                await collection.create_index(keys)
+
+    async def backfill_derived_fields(self, batch_size: int = 500) -> int:
+        """Populate normalized location/experience/skill fields on jobs stored before they existed"""
+        updated = 0
+        operations = []
+        async for job in self.iter_jobs(MISSING_DERIVED_FIELDS, projection=DERIVED_SOURCE_FIELDS,
+                                        batch_size=batch_size):
+            operations.append(backfill_operation(job))
+            if len(operations) >= batch_size:
+                updated += (await self.jobs_collection.bulk_write(operations, ordered=False)).modified_count
+                operations = []
+        if operations:
+            updated += (await self.jobs_collection.bulk_write(operations, ordered=False)).modified_count
+        logger.info(f"Backfilled derived fields on {updated} jobs")
+        return updated
+
+    async def explain_query(self, query: Dict[str, Any], sort: Optional[List] = None,
+                            limit: int = 20) -> Dict[str, Any]:
+        """Run explain on a query and summarize the winning plan"""
+        cursor = self.jobs_collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        return summarize_explain(await cursor.limit(limit).explain())
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage metrics for this process"""
+        return {"backend": self.backend, **get_pool_metrics()}
+
+    def close(self):
+        """Release this manager; shared clients are closed at interpreter exit"""
+        pass
@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator
+from models.job import Job
+from utils.pagination import ORDER_BY_DATE
+
+
+class BaseDatabaseManager(ABC):
+    """Storage interface shared by every job storage backend.
+
+    Queries are expressed as MongoDB-style filter documents (as produced by
+    utils.job_query.build_job_filter); non-Mongo backends translate the subset
+    of operators that the application emits.
+    """
+
+    backend: str = "base"
+
+    @abstractmethod
+    def insert_job(self, job: Job) -> str:
+        """Insert a single job into the database"""
+        pass
+
+    @abstractmethod
+    def insert_jobs(self, jobs: List[Job]) -> List[str]:
+        """Insert multiple jobs into the database"""
+        pass
+
+    @abstractmethod
+    def upsert_jobs(self, jobs: List[Job]) -> Dict[str, Any]:
+        """Insert new jobs and refresh known ones in a single bulk write"""
+        pass
+
+    @abstractmethod
+    def find_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs based on query"""
+        pass
+
+    @abstractmethod
+    def find_jobs_page(self, query: Dict[str, Any], page_size: int = 20,
+                       cursor: Optional[str] = None, order: str = ORDER_BY_DATE) -> Dict[str, Any]:
+        """Find one page of jobs using keyset (seek) pagination"""
+        pass
+
+    @abstractmethod
+    def find_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Find a single job by ID"""
+        pass
+
+    @abstractmethod
+    def find_jobs_by_ids(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several jobs in one round-trip, preserving the order of job_ids"""
+        pass
+
+    @abstractmethod
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> bool:
+        """Update a job"""
+        pass
+
+    @abstractmethod
+    def get_all_jobs(self) -> List[Dict[str, Any]]:
+        """Get all jobs from the database"""
+        pass
+
+    @abstractmethod
+    def iter_jobs(self, query: Optional[Dict[str, Any]] = None,
+                  projection: Optional[Dict[str, Any]] = None,
+                  batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream jobs without loading them all into memory"""
+        pass
+
+    @abstractmethod
+    def search_jobs(self, text: str) -> List[Dict[str, Any]]:
+        """Search jobs using text search"""
+        pass
+
+    @abstractmethod
+    def archive_jobs(self, cutoff: datetime, batch_size: int = 500) -> int:
+        """Move jobs posted before cutoff from the hot set to the archive"""
+        pass
+
+    @abstractmethod
+    def iter_archived_jobs(self, query: Optional[Dict[str, Any]] = None,
+                           projection: Optional[Dict[str, Any]] = None,
+                           batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream archived jobs without loading them all into memory"""
+        pass
+
+    @abstractmethod
+    def find_archived_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs in the archive"""
+        pass
+
+    @abstractmethod
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs from the hot set"""
+        pass
+
+    @abstractmethod
+    def get_stats(self, dimension: str, keys: Optional[List[str]] = None) -> Dict[str, int]:
+        """Read market statistics counters for one dimension (optionally only some keys)"""
+        pass
+
+    @abstractmethod
+    def rebuild_stats(self) -> int:
+        """Recompute the market statistics counters from the hot set"""
+        pass
+
+    @abstractmethod
+    def create_indexes(self):
+        """Create necessary indexes for better performance"""
+        pass
+
+    @abstractmethod
+    def backfill_derived_fields(self, batch_size: int = 500) -> int:
+        """Populate normalized location/experience fields on older jobs"""
+        pass
+
+    @abstractmethod
+    def explain_query(self, query: Dict[str, Any], sort: Optional[List] = None,
+                      limit: int = 20) -> Dict[str, Any]:
+        """Run the backend's query planner on a query and summarize the plan"""
+        pass
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection usage metrics for this backend"""
+        return {"backend": self.backend}
+
+    def close(self):
+        """Release this manager"""
+        pass
@@ -1,23 +1,60 @@
-from pymongo import MongoClient
-from typing import List, Dict, Any, Optional
-from config.settings import MONGODB_URI, MONGODB_DB_NAME
+from datetime import datetime
+from pymongo import MongoClient, ReturnDocument
+from typing import List, Dict, Any, Optional, Iterator, Set, Tuple
+from config.settings import MONGODB_DB_NAME, DATABASE_BACKEND
 from models.job import Job
+from utils.base_database import BaseDatabaseManager
+from utils.mongo_client import get_mongo_client, get_pool_metrics
+from utils.job_documents import (
+    IDENTITY_FIELDS, job_to_document, job_identity_filter, identity_key, order_by_ids, stale_jobs_filter,
+    with_derived_updates,
+)
+from utils.job_stats import STATS_FIELDS, refreshed_stats, stats_rebuild_pipelines
+from utils.mongo_queries import (
+    DATE_ORDER, MISSING_DERIVED_FIELDS, DERIVED_SOURCE_FIELDS, JOBS_INDEXES, ARCHIVE_INDEXES, STATS_INDEXES,
+    MongoCollections, summarize_explain, ids_filter, stats_operations, stats_query, stats_counter_stages,
+    archive_refresh_operations, upsert_operations, archive_operations, backfill_operation,
+    relevance_page_pipeline, date_page_filter, decode_last_id, upsert_result, split_archived,
+)
+from utils.pagination import ORDER_BY_DATE, ORDER_BY_RELEVANCE, decode_cursor, build_page
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class DatabaseManager:
-    def __init__(self):
-        self.client = MongoClient(MONGODB_URI)
-        self.db = self.client[MONGODB_DB_NAME]
-        self.jobs_collection = self.db.jobs
-        self.resumes_collection = self.db.resumes
+class DatabaseManager(MongoCollections, BaseDatabaseManager):
+    """MongoDB storage backend"""
+
+    backend = "mongodb"
+
+    def __init__(self, client: Optional[MongoClient] = None, db_name: str = MONGODB_DB_NAME):
+        # Without an explicit client every manager shares the process-wide pool
+        self._client = client
+        self.db_name = db_name
+
+    @property
+    def client(self) -> MongoClient:
+        # Resolved on every access so a manager created before a fork picks up
+        # the child's own client instead of the parent's sockets
+        return self._client or get_mongo_client()
+    
+    def _apply_stats(self, documents: List[Dict[str, Any]], sign: int = 1):
+        """Add (or with sign=-1 remove) jobs' contributions to the statistics counters"""
+        operations = stats_operations(documents, sign)
+        if not operations:
+            return
+        try:
+            self.stats_collection.bulk_write(operations, ordered=False)
+        except Exception as e:
+            # Statistics must never fail an ingest; rebuild_stats repairs any drift
+            logger.warning(f"Error updating job statistics: {e}")
         
     def insert_job(self, job: Job) -> str:
         """Insert a single job into the database"""
         try:
-            result = self.jobs_collection.insert_one(job.dict())
+            document = job_to_document(job)
+            result = self.jobs_collection.insert_one(document)
+            self._apply_stats([document])
             return str(result.inserted_id)
         except Exception as e:
             logger.error(f"Error inserting job: {e}")
@@ -26,12 +63,59 @@ class DatabaseManager:
     def insert_jobs(self, jobs: List[Job]) -> List[str]:
         """Insert multiple jobs into the database"""
         try:
-            result = self.jobs_collection.insert_many([job.dict() for job in jobs])
+            documents = [job_to_document(job) for job in jobs]
+            result = self.jobs_collection.insert_many(documents)
+            self._apply_stats(documents)
             return [str(id) for id in result.inserted_ids]
         except Exception as e:
             logger.error(f"Error inserting jobs: {e}")
             raise
     
+    def _archived_identities(self, documents: List[Dict[str, Any]]) -> Set[Tuple]:
+        """Identities of the given postings that are already in the archive"""
+        filters = {identity_key(document): job_identity_filter(document) for document in documents}
+        archived = self.archive_collection.find({"$or": list(filters.values())}, IDENTITY_FIELDS)
+        return {identity_key(job) for job in archived}
+    
+    def _stored_stats(self, documents: List[Dict[str, Any]]) -> Dict[Tuple, Dict[str, Any]]:
+        """Stats fields of the given postings that are already in the hot set, by identity"""
+        filters = [job_identity_filter(document) for document in documents]
+        stored = self.jobs_collection.find({"$or": filters}, {**IDENTITY_FIELDS, **STATS_FIELDS})
+        return {identity_key(job): job for job in stored}
+
+    def upsert_jobs(self, jobs: List[Job]) -> Dict[str, Any]:
+        """Insert new jobs and refresh known ones in a single bulk write.
+
+        Postings that were archived and are still listed are refreshed in the
+        archive rather than inserted into the hot set again.
+        """
+        result = {"inserted": 0, "matched": 0, "modified": 0, "archived": 0, "upserted_ids": {}}
+        if not jobs:
+            return result
+        try:
+            documents = [job_to_document(job) for job in jobs]
+            archived = self._archived_identities(documents)
+            hot, refreshed = split_archived(documents, archived)
+            if refreshed:
+                self.archive_collection.bulk_write(archive_refresh_operations(refreshed, datetime.now()),
+                                                   ordered=False)
+                result["archived"] = len(refreshed)
+            if not hot:
+                return result
+
+            hot_documents = [documents[index] for index in hot]
+            stored = self._stored_stats(hot_documents)
+            written = self.jobs_collection.bulk_write(upsert_operations(hot_documents), ordered=False)
+            # New postings add to the counters; refreshed ones move if the re-scrape changed their facets
+            before, after = refreshed_stats(stored, hot_documents)
+            self._apply_stats(before, -1)
+            self._apply_stats([hot_documents[position] for position in written.upserted_ids] + after)
+            result.update(upsert_result(written, hot))
+            return result
+        except Exception as e:
+            logger.error(f"Error upserting jobs: {e}")
+            raise
+    
     def find_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Find jobs based on query"""
         cursor = self.jobs_collection.find(query)
@@ -39,36 +123,209 @@ class DatabaseManager:
             cursor = cursor.limit(limit)
         return list(cursor)
     
+    def find_jobs_page(self, query: Dict[str, Any], page_size: int = 20,
+                       cursor: Optional[str] = None, order: str = ORDER_BY_DATE) -> Dict[str, Any]:
+        """Find one page of jobs using keyset (seek) pagination.
+
+        Pages are ordered by (posted_date, _id) or, for $text queries, by
+        (text score, _id). The returned next_cursor is opaque and resumes right
+        after the last job, so deep pages never pay for skipped documents.
+        """
+        position = decode_cursor(cursor, order) if cursor else None
+        last_id = decode_last_id(position)
+
+        if order == ORDER_BY_RELEVANCE:
+            jobs = list(self.jobs_collection.aggregate(relevance_page_pipeline(query, position, last_id, page_size)))
+        else:
+            page_filter = date_page_filter(query, position, last_id)
+            jobs = list(self.jobs_collection.find(page_filter).sort(DATE_ORDER).limit(page_size + 1))
+
+        return build_page(jobs, page_size, order)
+    
     def find_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Find a single job by ID"""
         from bson import ObjectId
         return self.jobs_collection.find_one({"_id": ObjectId(job_id)})
     
+    def find_jobs_by_ids(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several jobs in one round-trip, preserving the order of job_ids"""
+        if not job_ids:
+            return []
+        documents = self.jobs_collection.find(ids_filter(job_ids))
+        return order_by_ids(list(documents), job_ids)
+    
     def update_job(self, job_id: str, update_data: Dict[str, Any]) -> bool:
         """Update a job"""
         from bson import ObjectId
-        result = self.jobs_collection.update_one(
+        update_data = with_derived_updates(update_data)
+        if not any(field in STATS_FIELDS for field in update_data):
+            result = self.jobs_collection.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$set": update_data}
+            )
+            return result.modified_count > 0
+        
+        # Fields behind the statistics changed: move the job's counters along with it
+        before = self.jobs_collection.find_one_and_update(
             {"_id": ObjectId(job_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection=STATS_FIELDS,
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        if before is None:
+            return False
+        after = {**before, **update_data}
+        if before == after:
+            return False
+        self._apply_stats([before], -1)
+        self._apply_stats([after])
+        return True
     
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """Get all jobs from the database"""
         return list(self.jobs_collection.find())
     
+    def iter_jobs(self, query: Optional[Dict[str, Any]] = None,
+                  projection: Optional[Dict[str, Any]] = None,
+                  batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream jobs from a server-side cursor without loading them all into memory"""
+        cursor = self.jobs_collection.find(query or {}, projection).batch_size(batch_size)
+        try:
+            for job in cursor:
+                yield job
+        finally:
+            cursor.close()
+    
     def search_jobs(self, text: str) -> List[Dict[str, Any]]:
         """Search jobs using text search"""
         return list(self.jobs_collection.find(
             {"$text": {"$search": text}}
         ))
     
+    def archive_jobs(self, cutoff: datetime, batch_size: int = 500) -> int:
+        """Move jobs posted before cutoff from the hot collection to jobs_archive.
+
+        Archived jobs are keyed by their posting identity (URL), so a posting
+        archived twice keeps one archive entry. Each batch is copied before it
+        is deleted, so an interrupted run can be repeated without losing or
+        duplicating jobs.
+        """
+        archived = 0
+        archived_at = datetime.now()
+        while True:
+            batch = list(self.jobs_collection.find(stale_jobs_filter(cutoff)).limit(batch_size))
+            if not batch:
+                break
+            self.archive_collection.bulk_write(archive_operations(batch, archived_at), ordered=False)
+            self.jobs_collection.delete_many({"_id": {"$in": [job["_id"] for job in batch]}})
+            self._apply_stats(batch, sign=-1)
+            archived += len(batch)
+        logger.info(f"Archived {archived} jobs posted before {cutoff:%Y-%m-%d}")
+        return archived
+    
+    def iter_archived_jobs(self, query: Optional[Dict[str, Any]] = None,
+                           projection: Optional[Dict[str, Any]] = None,
+                           batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream jobs from the archive collection"""
+        cursor = self.archive_collection.find(query or {}, projection).batch_size(batch_size)
+        try:
+            for job in cursor:
+                yield job
+        finally:
+            cursor.close()
+    
+    def find_archived_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs in the archive collection"""
+        cursor = self.archive_collection.find(query)
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+    
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs from the hot collection"""
+        if not job_ids:
+            return 0
+        id_filter = ids_filter(job_ids)
+        documents = list(self.jobs_collection.find(id_filter, STATS_FIELDS))
+        result = self.jobs_collection.delete_many(id_filter)
+        self._apply_stats(documents, sign=-1)
+        return result.deleted_count
+    
+    def get_stats(self, dimension: str, keys: Optional[List[str]] = None) -> Dict[str, int]:
+        """Read market statistics counters for one dimension (optionally only some keys)"""
+        counters = self.stats_collection.find(stats_query(dimension, keys), {"key": 1, "count": 1})
+        return {doc["key"]: doc["count"] for doc in counters}
+    
+    def rebuild_stats(self) -> int:
+        """Recompute the statistics counters server-side with aggregation pipelines.
+
+        Counters are merged into a scratch collection that then replaces
+        job_stats in one rename, so readers never see a half-built set.
+        """
+        rebuild = self.db.job_stats_rebuild
+        rebuild.drop()
+        for dimension, pipeline in stats_rebuild_pipelines().items():
+            self.jobs_collection.aggregate(pipeline + stats_counter_stages(dimension, rebuild.name))
+        counters = rebuild.count_documents({})
+        if counters:
+            rebuild.rename(self.stats_collection.name, dropTarget=True)
+        else:
+            self.stats_collection.drop()
+        for keys in STATS_INDEXES:
+            self.stats_collection.create_index(keys)
+        logger.info(f"Rebuilt {counters} job statistics counters")
+        return counters
+    
     def create_indexes(self):
         """Create necessary indexes for better performance"""
-        self.jobs_collection.create_index([("title", "text"), ("job_description", "text"), ("skills", "text")])
-        self.jobs_collection.create_index("source")
-        self.jobs_collection.create_index("posted_date")
+        for collection, indexes in ((self.jobs_collection, JOBS_INDEXES),
+                                    (self.archive_collection, ARCHIVE_INDEXES),
+                                    (self.stats_collection, STATS_INDEXES)):
+            for keys in indexes:
+                collection.create_index(keys)
+        
+    def backfill_derived_fields(self, batch_size: int = 500) -> int:
+        """Populate normalized location/experience/skill fields on jobs stored before they existed"""
+        updated = 0
+        operations = []
+        for job in self.iter_jobs(MISSING_DERIVED_FIELDS, projection=DERIVED_SOURCE_FIELDS, batch_size=batch_size):
+            operations.append(backfill_operation(job))
+            if len(operations) >= batch_size:
+                updated += self.jobs_collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            updated += self.jobs_collection.bulk_write(operations, ordered=False).modified_count
+        logger.info(f"Backfilled derived fields on {updated} jobs")
+        return updated
+    
+    def explain_query(self, query: Dict[str, Any], sort: Optional[List] = None,
+                      limit: int = 20) -> Dict[str, Any]:
+        """Run explain on a query and summarize the winning plan"""
+        cursor = self.jobs_collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        return summarize_explain(cursor.limit(limit).explain())
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage metrics for this process"""
+        return {"backend": self.backend, **get_pool_metrics()}
         
     def close(self):
-        """Close database connection"""
-        self.client.close()
\ No newline at end of file
+        """Release this manager.
+
+        The shared client is left open for the other components in the
+        process and is closed at interpreter exit; an injected client is
+        owned by the caller.
+        """
+        pass
+
+
+def create_database_manager(backend: Optional[str] = None) -> BaseDatabaseManager:
+    """Create the storage backend selected by the DATABASE_BACKEND setting"""
+    backend = (backend or DATABASE_BACKEND).lower()
+    if backend in ("mongodb", "mongo"):
+        return DatabaseManager()
+    if backend == "sqlite":
+        from utils.sqlite_database import SQLiteDatabaseManager
+        return SQLiteDatabaseManager()
+    raise ValueError(f"Unknown database backend: {backend}")
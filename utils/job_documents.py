@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import List, Dict, Any, Union, Tuple
+from models.job import Job
+from utils.job_fields import derive_job_fields, normalize_skills
+
+# Fields job_identity_filter reads
+IDENTITY_FIELDS = {"url": 1, "title": 1, "company": 1, "location": 1, "source": 1}
+
+
+def job_to_document(job: Union[Job, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a Job (or an already serialized job) into a storable document.
+
+    The normalized location and experience fields are derived here so that
+    every ingest path stores them and queries never need regex scans.
+    """
+    document = job.dict() if isinstance(job, Job) else dict(job)
+    document.pop("_id", None)
+    document.update(derive_job_fields(document))
+    return document
+
+
+def with_derived_updates(update_data: Dict[str, Any]) -> Dict[str, Any]:
+    """An update to a stored job plus the derived fields that follow from it"""
+    if "skills" in update_data:
+        return {**update_data, "skill_ids": normalize_skills(update_data["skills"])}
+    return update_data
+
+
+def job_identity_filter(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Filter that identifies a posting across scraping runs.
+
+    The posting URL is the natural key; scrapers that could not extract one
+    fall back to title, company, location and source.
+    """
+    if document.get("url"):
+        return {"url": document["url"]}
+    return {
+        "title": document.get("title"),
+        "company": document.get("company"),
+        "location": document.get("location"),
+        "source": document.get("source"),
+    }
+
+
+def identity_key(document: Dict[str, Any]) -> Tuple:
+    """Hashable form of job_identity_filter, to match postings in memory"""
+    return tuple(sorted(job_identity_filter(document).items()))
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def refresh_fields(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields a re-scrape may overwrite on a stored posting.
+
+    Empty values are left out: a listing card that carries no description or
+    skills must not erase the ones added later by enrichment.
+    """
+    return {key: value for key, value in document.items() if not _is_empty(value)}
+
+
+def build_upsert_update(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Update spec that refreshes a posting and records when it was first seen"""
+    return {
+        "$set": refresh_fields(document),
+        "$setOnInsert": {
+            **{key: value for key, value in document.items() if _is_empty(value)},
+            "first_seen_at": datetime.now(),
+        },
+    }
+
+
+def order_by_ids(documents: List[Dict[str, Any]], job_ids: List[str]) -> List[Dict[str, Any]]:
+    """Return documents in the order of the requested IDs, skipping missing ones"""
+    by_id = {str(document["_id"]): document for document in documents}
+    return [by_id[job_id] for job_id in job_ids if job_id in by_id]
+
+
+def stale_jobs_filter(cutoff: datetime) -> Dict[str, Any]:
+    """Filter for jobs older than cutoff.
+
+    Jobs without a posted date age out by the time they were first scraped.
+    """
+    return {"$or": [
+        {"posted_date": {"$lt": cutoff}},
+        {"posted_date": None, "first_seen_at": {"$lt": cutoff}},
+    ]}
@@ -0,0 +1,191 @@
+import re
+from typing import List, Dict, Any, Optional, Tuple
+
+# Upper bound stored for open-ended requirements such as "5+ years", so that
+# range filters on exp_max stay index-friendly instead of matching nulls
+EXP_OPEN_MAX = 50
+
+# Canonical city IDs and the spellings that map to them
+CITY_ALIASES = {
+    "bangalore": ["bangalore", "bengaluru"],
+    "mumbai": ["mumbai", "bombay", "navi mumbai"],
+    "delhi": ["delhi", "new delhi", "delhi ncr"],
+    "ncr": ["ncr"],
+    "gurgaon": ["gurgaon", "gurugram"],
+    "noida": ["noida", "greater noida"],
+    "hyderabad": ["hyderabad", "secunderabad"],
+    "chennai": ["chennai", "madras"],
+    "pune": ["pune"],
+    "kolkata": ["kolkata", "calcutta"],
+    "ahmedabad": ["ahmedabad"],
+    "jaipur": ["jaipur"],
+    "surat": ["surat"],
+    "lucknow": ["lucknow"],
+    "kanpur": ["kanpur"],
+    "nagpur": ["nagpur"],
+    "indore": ["indore"],
+    "thane": ["thane"],
+    "bhopal": ["bhopal"],
+    "patna": ["patna"],
+    "vadodara": ["vadodara", "baroda"],
+    "ghaziabad": ["ghaziabad"],
+    "ludhiana": ["ludhiana"],
+    "nashik": ["nashik"],
+    "faridabad": ["faridabad"],
+    "coimbatore": ["coimbatore"],
+    "kochi": ["kochi", "cochin"],
+    "thiruvananthapuram": ["thiruvananthapuram", "trivandrum"],
+    "mysore": ["mysore", "mysuru"],
+    "mangalore": ["mangalore", "mangaluru"],
+    "visakhapatnam": ["visakhapatnam", "vizag"],
+    "vijayawada": ["vijayawada"],
+    "bhubaneswar": ["bhubaneswar"],
+    "chandigarh": ["chandigarh", "mohali"],
+    "guwahati": ["guwahati"],
+    "madurai": ["madurai"],
+    "raipur": ["raipur"],
+    "ranchi": ["ranchi"],
+}
+
+REMOTE_TERMS = ["remote", "work from home", "wfh", "anywhere"]
+
+# Seniority labels (mostly from LinkedIn) mapped to a years-of-experience range
+EXPERIENCE_LEVELS = [
+    ("internship", (0, 0)),
+    ("fresher", (0, 1)),
+    ("entry", (0, 2)),
+    ("junior", (0, 2)),
+    ("associate", (1, 4)),
+    ("mid-senior", (4, EXP_OPEN_MAX)),
+    ("mid", (3, 7)),
+    ("senior", (5, EXP_OPEN_MAX)),
+    ("lead", (7, EXP_OPEN_MAX)),
+    ("director", (10, EXP_OPEN_MAX)),
+    ("executive", (12, EXP_OPEN_MAX)),
+]
+
+# Skills recognized in free text; shared by the resume parser and job enrichment
+# so resume and job skills are directly comparable
+SKILL_KEYWORDS = [
+    # Programming Languages
+    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust", "kotlin", "swift",
+    "php", "scala", "r", "matlab", "perl", "objective-c", "dart", "lua", "julia", "fortran",
+
+    # Web Technologies
+    "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "spring",
+    "asp.net", "rails", "laravel", "symfony", "jquery", "bootstrap", "tailwind", "sass", "webpack",
+
+    # Databases
+    "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "dynamodb",
+    "oracle", "sql server", "firebase", "neo4j", "influxdb", "couchdb",
+
+    # Cloud & DevOps
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "git", "ci/cd", "terraform",
+    "ansible", "puppet", "chef", "circleci", "travis ci", "gitlab", "bitbucket",
+
+    # Data Science & ML
+    "machine learning", "deep learning", "tensorflow", "pytorch", "scikit-learn", "keras",
+    "pandas", "numpy", "matplotlib", "seaborn", "nlp", "computer vision", "opencv",
+
+    # Other Technologies
+    "rest api", "graphql", "microservices", "agile", "scrum", "jira", "linux", "unix",
+    "security", "blockchain", "iot", "mobile development", "android", "ios", "react native",
+    "flutter", "xamarin", "unity", "unreal engine"
+]
+
+_ALIAS_PATTERNS = [
+    (re.compile(r'\b' + re.escape(alias) + r'\b'), city_id)
+    for city_id, aliases in CITY_ALIASES.items()
+    for alias in aliases
+]
+
+
+def normalize_location(location: str) -> str:
+    """Lowercase a location and collapse punctuation to single spaces"""
+    return " ".join(re.findall(r'[a-z0-9]+', (location or "").lower()))
+
+
+def tokenize_location(location: str) -> List[str]:
+    """Split a location string into unique lowercase tokens"""
+    tokens = []
+    for token in normalize_location(location).split():
+        if len(token) > 1 and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def extract_city_ids(location: str) -> List[str]:
+    """Resolve every known city mentioned in a location string to its canonical ID"""
+    normalized = normalize_location(location)
+    city_ids = []
+    for pattern, city_id in _ALIAS_PATTERNS:
+        if city_id not in city_ids and pattern.search(normalized):
+            city_ids.append(city_id)
+    return city_ids
+
+
+def is_remote_location(location: str) -> bool:
+    """Check whether a location string describes a remote position"""
+    normalized = normalize_location(location)
+    return any(re.search(r'\b' + term + r'\b', normalized) for term in REMOTE_TERMS)
+
+
+def parse_experience_range(experience: str) -> Tuple[Optional[int], Optional[int]]:
+    """Parse an experience requirement into (min_years, max_years).
+
+    Handles ranges ("3-5 Yrs", "2 to 4 years"), open-ended values ("5+ years")
+    and seniority labels ("Entry level"). Returns (None, None) when nothing
+    usable is found.
+    """
+    text = (experience or "").lower()
+
+    match = re.search(r'(\d+)\s*(?:-|to|–)\s*(\d+)', text)
+    if match:
+        low, high = int(match.group(1)), int(match.group(2))
+        return min(low, high), max(low, high)
+
+    match = re.search(r'(\d+)\s*\+', text)
+    if match:
+        return int(match.group(1)), EXP_OPEN_MAX
+
+    match = re.search(r'(\d+)\s*(?:yrs?|years?)', text) or re.fullmatch(r'\s*(\d+)\s*', text)
+    if match:
+        years = int(match.group(1))
+        return years, years
+
+    for label, years_range in EXPERIENCE_LEVELS:
+        if label in text:
+            return years_range
+
+    return None, None
+
+
+_SKILL_PATTERNS = [
+    (re.compile(r'(?<![\w+#.])' + re.escape(skill) + r'(?![\w+#])'), skill)
+    for skill in SKILL_KEYWORDS
+]
+
+
+def extract_skills(text: str) -> List[str]:
+    """Known skills mentioned in a piece of text, in vocabulary order"""
+    text = (text or "").lower()
+    return [skill for pattern, skill in _SKILL_PATTERNS if skill in text and pattern.search(text)]
+
+
+def normalize_skills(skills: Optional[List[str]]) -> List[str]:
+    """Lowercase, de-duplicated skill names, the form skill filters match on"""
+    return list(dict.fromkeys(skill.strip().lower() for skill in skills or [] if skill and skill.strip()))
+
+
+def derive_job_fields(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute the normalized, indexable fields stored alongside a job"""
+    location = document.get("location", "")
+    exp_min, exp_max = parse_experience_range(document.get("experience", ""))
+    return {
+        "location_tokens": tokenize_location(location),
+        "city_ids": extract_city_ids(location),
+        "is_remote": is_remote_location(location),
+        "exp_min": exp_min,
+        "exp_max": exp_max,
+        "skill_ids": normalize_skills(document.get("skills")),
+    }
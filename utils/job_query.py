@@ -0,0 +1,64 @@
+import re
+from typing import List, Dict, Any, Optional
+from utils.job_fields import (
+    extract_city_ids,
+    tokenize_location,
+    is_remote_location,
+    parse_experience_range,
+    normalize_skills,
+)
+
+
+def build_location_filter(location: str) -> Dict[str, Any]:
+    """Filter on the normalized location fields instead of a regex scan"""
+    if is_remote_location(location):
+        return {"is_remote": True}
+
+    city_ids = extract_city_ids(location)
+    if len(city_ids) == 1:
+        return {"city_ids": city_ids[0]}
+    if city_ids:
+        return {"city_ids": {"$in": city_ids}}
+
+    tokens = tokenize_location(location)
+    if not tokens:
+        return {}
+    if len(tokens) == 1:
+        return {"location_tokens": tokens[0]}
+    return {"location_tokens": {"$all": tokens}}
+
+
+def build_experience_filter(experience: str) -> Dict[str, Any]:
+    """Match jobs whose experience range overlaps the requested one"""
+    exp_min, exp_max = parse_experience_range(experience)
+    if exp_min is None:
+        # Unrecognised wording: fall back to a literal match on the raw text
+        return {"experience": {"$regex": re.escape(experience), "$options": "i"}}
+    return {"exp_min": {"$lte": exp_max}, "exp_max": {"$gte": exp_min}}
+
+
+def build_job_filter(query: Optional[str] = None,
+                     location: Optional[str] = None,
+                     skills: Optional[List[str]] = None,
+                     experience: Optional[str] = None,
+                     source: Optional[str] = None) -> Dict[str, Any]:
+    """Build the MongoDB filter shared by the agent tools and the web UI"""
+    search_filter = {}
+
+    if query:
+        search_filter["$text"] = {"$search": query}
+
+    if location and location.lower() != "all":
+        search_filter.update(build_location_filter(location))
+
+    if skills:
+        # Matched on the lowercase skill_ids, whatever case the listing used
+        search_filter["skill_ids"] = {"$in": normalize_skills(skills)}
+
+    if experience:
+        search_filter.update(build_experience_filter(experience))
+
+    if source and source.lower() != "all":
+        search_filter["source"] = source.lower()
+
+    return search_filter
@@ -0,0 +1,213 @@
+from collections import Counter
+from datetime import datetime
+from itertools import combinations
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from utils.base_database import BaseDatabaseManager
+from utils.job_documents import identity_key, refresh_fields
+from utils.job_fields import extract_city_ids, is_remote_location, normalize_location
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOTAL_KEY = "all"
+REMOTE_CITY = "remote"
+UNKNOWN = "unknown"
+
+# Facets that are counted on their own and in every combination, so any
+# "skill x city x source" question is a single counter lookup
+FACETS = ("skill", "city", "source")
+FACET_DIMENSIONS = ["_".join(facets) for size in range(1, len(FACETS) + 1)
+                    for facets in combinations(FACETS, size)]
+STATS_DIMENSIONS = ["total"] + FACET_DIMENSIONS + ["exp_band", "week"]
+
+# Upper bounds (inclusive) of the experience bands, by minimum years required
+EXPERIENCE_BANDS = [(2, "0-2"), (5, "3-5"), (10, "6-10")]
+SENIOR_BAND = "10+"
+
+# Fields a document needs for its counters to be computed
+STATS_FIELDS = {"source": 1, "skills": 1, "city_ids": 1, "is_remote": 1, "exp_min": 1, "posted_date": 1}
+
+
+def experience_band(exp_min: Optional[int]) -> str:
+    """Bucket a minimum experience requirement into a coarse band"""
+    if exp_min is None:
+        return UNKNOWN
+    for upper, band in EXPERIENCE_BANDS:
+        if exp_min <= upper:
+            return band
+    return SENIOR_BAND
+
+
+def posting_week(posted_date: Optional[datetime]) -> str:
+    """ISO week a job was posted in, e.g. "2024-W07\""""
+    if not isinstance(posted_date, datetime):
+        return UNKNOWN
+    year, week, _ = posted_date.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _facet_values(document: Dict[str, Any]) -> Dict[str, List[str]]:
+    cities = list(document.get("city_ids") or [])
+    if document.get("is_remote"):
+        cities.append(REMOTE_CITY)
+    return {
+        "skill": sorted({skill.lower() for skill in document.get("skills") or [] if skill}),
+        "city": cities,
+        "source": [document["source"].lower()] if document.get("source") else [],
+    }
+
+
+def job_stat_keys(document: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Every (dimension, key) counter a job contributes to"""
+    keys = [("total", TOTAL_KEY)]
+    values = _facet_values(document)
+    for size in range(1, len(FACETS) + 1):
+        for facets in combinations(FACETS, size):
+            combos = [[]]
+            for facet in facets:
+                combos = [combo + [value] for combo in combos for value in values[facet]]
+            keys += [("_".join(facets), "|".join(combo)) for combo in combos]
+    keys.append(("exp_band", experience_band(document.get("exp_min"))))
+    keys.append(("week", posting_week(document.get("posted_date"))))
+    return keys
+
+
+def moved_stats(before: Dict[str, Any], update: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """A stored job's stats fields after update, or None if its counters stay the same"""
+    after = {**before, **{field: update[field] for field in STATS_FIELDS if field in update}}
+    return after if job_stat_keys(after) != job_stat_keys(before) else None
+
+
+def refreshed_stats(stored: Dict[Tuple, Dict[str, Any]],
+                    documents: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Stats before and after an upsert refreshes stored postings, for those whose counters move.
+
+    stored maps identity_key to the stored job's STATS_FIELDS; a re-scrape
+    can rewrite skills, location, source and (relative) posting dates.
+    """
+    before, after = [], []
+    for document in documents:
+        existing = stored.get(identity_key(document))
+        moved = moved_stats(existing, refresh_fields(document)) if existing else None
+        if moved:
+            before.append(existing)
+            after.append(moved)
+    return before, after
+
+
+def count_job_stats(documents: Iterable[Dict[str, Any]]) -> Counter:
+    """Aggregate the counters for a batch of jobs"""
+    counts = Counter()
+    for document in documents:
+        counts.update(job_stat_keys(document))
+    return counts
+
+
+def stats_rebuild_pipelines() -> Dict[str, List[Dict[str, Any]]]:
+    """MongoDB aggregation pipelines computing each dimension from the jobs collection.
+
+    They mirror job_stat_keys so a rebuild produces the same counters as
+    incremental maintenance.
+    """
+    facet_arrays = {
+        "skill": {"$setUnion": [{"$map": {"input": {"$ifNull": ["$skills", []]}, "in": {"$toLower": "$$this"}}}, []]},
+        "city": {"$concatArrays": [{"$ifNull": ["$city_ids", []]},
+                                   {"$cond": [{"$eq": ["$is_remote", True]}, [REMOTE_CITY], []]}]},
+        "source": {"$cond": [{"$ifNull": ["$source", False]}, [{"$toLower": "$source"}], []]},
+    }
+    band_branches = [{"case": {"$lte": ["$exp_min", upper]}, "then": band} for upper, band in EXPERIENCE_BANDS]
+
+    pipelines = {
+        "total": [{"$group": {"_id": TOTAL_KEY, "count": {"$sum": 1}}}],
+        "exp_band": [{"$group": {
+            "_id": {"$cond": [{"$eq": [{"$ifNull": ["$exp_min", None]}, None]}, UNKNOWN,
+                              {"$switch": {"branches": band_branches, "default": SENIOR_BAND}}]},
+            "count": {"$sum": 1},
+        }}],
+        "week": [{"$group": {
+            "_id": {"$ifNull": [{"$dateToString": {"format": "%G-W%V", "date": "$posted_date", "onNull": UNKNOWN}}, UNKNOWN]},
+            "count": {"$sum": 1},
+        }}],
+    }
+    for dimension in FACET_DIMENSIONS:
+        facets = dimension.split("_")
+        stages = [{"$project": {facet: facet_arrays[facet] for facet in facets}}]
+        stages += [{"$unwind": f"${facet}"} for facet in facets]
+        key = {"$concat": [part for facet in facets for part in ("|", f"${facet}")][1:]}
+        stages.append({"$group": {"_id": key, "count": {"$sum": 1}}})
+        pipelines[dimension] = stages
+    return pipelines
+
+
+class JobStats:
+    """Read side of the market statistics.
+
+    Counters are maintained incrementally by the storage backends whenever
+    jobs enter or leave the hot set, so every read here is a lookup of a few
+    precomputed keys rather than a scan of the jobs.
+    """
+
+    def __init__(self, db: BaseDatabaseManager):
+        self.db = db
+
+    @staticmethod
+    def _city_key(city: str) -> str:
+        if is_remote_location(city):
+            return REMOTE_CITY
+        city_ids = extract_city_ids(city)
+        return city_ids[0] if city_ids else normalize_location(city)
+
+    def _facet_filter(self, skill: Optional[str] = None, city: Optional[str] = None,
+                      source: Optional[str] = None) -> Tuple[List[str], List[str]]:
+        values = {
+            "skill": skill.lower() if skill else None,
+            "city": self._city_key(city) if city and city.lower() != "all" else None,
+            "source": source.lower() if source and source.lower() != "all" else None,
+        }
+        facets = [facet for facet in FACETS if values[facet]]
+        return facets, [values[facet] for facet in facets]
+
+    def total(self) -> int:
+        """Number of jobs in the hot set"""
+        return self.db.get_stats("total", [TOTAL_KEY]).get(TOTAL_KEY, 0)
+
+    def count(self, skill: Optional[str] = None, city: Optional[str] = None,
+              source: Optional[str] = None) -> int:
+        """Number of jobs matching any combination of skill, city and source"""
+        facets, values = self._facet_filter(skill, city, source)
+        if not facets:
+            return self.total()
+        key = "|".join(values)
+        return self.db.get_stats("_".join(facets), [key]).get(key, 0)
+
+    def count_by_source(self, skill: Optional[str] = None, city: Optional[str] = None) -> Dict[str, int]:
+        """Job counts per source for an optional skill/city combination"""
+        source_counts = self.db.get_stats("source")
+        facets, values = self._facet_filter(skill, city)
+        if not facets:
+            return source_counts
+        keys = {"|".join(values + [source]): source for source in source_counts}
+        counts = self.db.get_stats("_".join(facets + ["source"]), list(keys))
+        return {keys[key]: count for key, count in counts.items()}
+
+    def breakdown(self, dimension: str, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Counters of one dimension, largest first"""
+        if dimension not in STATS_DIMENSIONS:
+            raise ValueError(f"Unknown statistics dimension: {dimension}")
+        counts = sorted(self.db.get_stats(dimension).items(), key=lambda item: (-item[1], item[0]))
+        return counts[:limit] if limit else counts
+
+    def summary(self, limit: int = 10) -> Dict[str, Any]:
+        """Headline numbers for the web UI and the agent"""
+        return {
+            "total": self.total(),
+            "by_source": dict(self.breakdown("source")),
+            "top_cities": dict(self.breakdown("city", limit)),
+            "top_skills": dict(self.breakdown("skill", limit)),
+            "by_experience": dict(self.breakdown("exp_band")),
+            "by_week": dict(sorted(self.db.get_stats("week").items())),
+        }
+
+    def rebuild(self) -> int:
+        """Recompute every counter from the stored jobs"""
+        return self.db.rebuild_stats()
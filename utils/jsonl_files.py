@@ -0,0 +1,148 @@
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+from pydantic import ValidationError
+from models.job import Job
+from utils.base_database import BaseDatabaseManager
+from config.settings import JSONL_COMPRESSION
+import logging
+
+# Optional imports with graceful fallback
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+# A file whose writer was killed mid-run ends in an incomplete frame
+_TRUNCATED_ERRORS = (EOFError, OSError) + ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ())
+
+
+def _resolve(compression: str) -> str:
+    if compression not in EXTENSIONS:
+        raise ValueError(f"Unknown JSONL compression: {compression}")
+    if compression == "zstd" and not ZSTD_AVAILABLE:
+        logger.warning("zstandard not available, compressing with gzip. Install it with: pip install zstandard")
+        return "gzip"
+    return compression
+
+
+def jsonl_path(directory: Path, stem: str, compression: str = JSONL_COMPRESSION) -> Path:
+    """Path for a new JSONL file, with the extension of its compression"""
+    return Path(directory) / f"{stem}{EXTENSIONS[_resolve(compression)]}"
+
+
+def compression_of(path: Path) -> str:
+    name = Path(path).name
+    if name.endswith(".gz"):
+        return "gzip"
+    if name.endswith(".zst"):
+        return "zstd"
+    return "none"
+
+
+class JsonlWriter:
+    """Appends one JSON record per line to a plain, gzip or zstd file.
+
+    Records are encoded and compressed as they are written, so nothing is
+    held in memory beyond the compressor's buffer. flush() makes everything
+    written so far readable, even if the process dies before close().
+    """
+
+    def __init__(self, path: Path, compression: Optional[str] = None):
+        self.path = Path(path)
+        self.compression = _resolve(compression or compression_of(self.path))
+        self.records = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.compression == "gzip":
+            self._file = gzip.open(self.path, "at", encoding="utf-8")
+        elif self.compression == "zstd":
+            # Appending starts a new frame; readers decode across frames
+            writer = zstandard.ZstdCompressor(level=3).stream_writer(open(self.path, "ab"))
+            self._file = io.TextIOWrapper(writer, encoding="utf-8")
+        else:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self.records += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+def _open_text(path: Path):
+    compression = compression_of(path)
+    if compression == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError(f"zstandard is required to read {path}. Install it with: pip install zstandard")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream the records of a JSONL file, decompressing on the fly.
+
+    Malformed lines are skipped, and a file cut off mid-write yields every
+    complete record before the cut.
+    """
+    path = Path(path)
+    with _open_text(path) as f:
+        line_number = 0
+        try:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping malformed line {line_number} of {path}")
+        except _TRUNCATED_ERRORS as e:
+            logger.warning(f"{path} is truncated after line {line_number}: {e}")
+
+
+def load_jobs_file(path: Path, db: BaseDatabaseManager, batch_size: int = 500) -> Dict[str, int]:
+    """Bulk-load a scraped JSONL file into the database, batch_size jobs at a time"""
+    stats = {"read": 0, "loaded": 0, "inserted": 0, "invalid": 0}
+    batch: List[Job] = []
+
+    def flush():
+        result = db.upsert_jobs(batch)
+        stats["loaded"] += len(batch)
+        stats["inserted"] += len(result["upserted_ids"])
+        batch.clear()
+
+    for record in iter_jsonl(path):
+        stats["read"] += 1
+        try:
+            batch.append(Job(**record))
+        except (ValidationError, TypeError) as e:
+            stats["invalid"] += 1
+            logger.warning(f"Skipping invalid job in {path}: {e}")
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    logger.info(f"Loaded {stats['loaded']} jobs from {path} ({stats['inserted']} new)")
+    return stats
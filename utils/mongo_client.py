@@ -0,0 +1,223 @@
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+from pymongo import MongoClient, monitoring
+from config.settings import (
+    MONGODB_URI,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_MAX_IDLE_TIME_MS,
+    MONGODB_CONNECT_TIMEOUT_MS,
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+    MONGODB_SOCKET_TIMEOUT_MS,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+    MONGODB_READ_PREFERENCE,
+)
+import logging
+
+# Optional async driver with graceful fallback
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    MOTOR_AVAILABLE = True
+except ImportError:
+    MOTOR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Collects connection pool usage counters per server address"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: defaultdict(int))
+
+    def _incr(self, address, counter: str, amount: int = 1):
+        key = f"{address[0]}:{address[1]}" if isinstance(address, tuple) else str(address)
+        with self._lock:
+            self._counters[key][counter] += amount
+
+    def pool_created(self, event):
+        self._incr(event.address, "pools_created")
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._incr(event.address, "pools_cleared")
+
+    def pool_closed(self, event):
+        self._incr(event.address, "pools_closed")
+
+    def connection_created(self, event):
+        self._incr(event.address, "connections_created")
+        self._incr(event.address, "open_connections")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._incr(event.address, "connections_closed")
+        self._incr(event.address, "open_connections", -1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._incr(event.address, "checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._incr(event.address, "checkouts")
+        self._incr(event.address, "in_use")
+
+    def connection_checked_in(self, event):
+        self._incr(event.address, "in_use", -1)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Return a copy of the counters"""
+        with self._lock:
+            return {address: dict(counters) for address, counters in self._counters.items()}
+
+    def reset(self):
+        """Drop all counters (used after fork)"""
+        with self._lock:
+            self._counters.clear()
+
+
+_pool_listener = PoolMetricsListener()
+_clients: Dict[str, MongoClient] = {}
+_clients_pid = os.getpid()
+_clients_lock = threading.Lock()
+# Event loop -> {uri: client}; weak so forgetting a loop never keeps it alive
+_motor_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncIOMotorClient]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def get_client_options() -> Dict[str, Any]:
+    """Build MongoClient keyword arguments from settings"""
+    options = {
+        "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+        "minPoolSize": MONGODB_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+        "connectTimeoutMS": MONGODB_CONNECT_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        "readPreference": MONGODB_READ_PREFERENCE,
+    }
+    if MONGODB_SOCKET_TIMEOUT_MS:
+        options["socketTimeoutMS"] = MONGODB_SOCKET_TIMEOUT_MS
+    if MONGODB_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = MONGODB_WAIT_QUEUE_TIMEOUT_MS
+    return options
+
+
+def _reset_after_fork():
+    """Forget clients inherited from the parent process.
+
+    MongoClient is not fork-safe, so a child must open its own pool instead of
+    reusing sockets owned by the parent. The inherited clients are dropped
+    without being closed so the parent's connections are left untouched.
+    """
+    global _clients, _clients_pid, _clients_lock, _motor_clients
+    _clients = {}
+    _motor_clients = weakref.WeakKeyDictionary()
+    _clients_pid = os.getpid()
+    _clients_lock = threading.Lock()
+    _pool_listener.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_mongo_client(uri: Optional[str] = None) -> MongoClient:
+    """Return the process-wide MongoClient for a URI, creating it on first use"""
+    uri = uri or MONGODB_URI
+    if os.getpid() != _clients_pid:
+        _reset_after_fork()
+
+    client = _clients.get(uri)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is None:
+            client = MongoClient(uri, event_listeners=[_pool_listener], **get_client_options())
+            _clients[uri] = client
+            logger.info(f"Created shared MongoDB client (maxPoolSize={MONGODB_MAX_POOL_SIZE})")
+    return client
+
+
+def _motor_client_list() -> List["AsyncIOMotorClient"]:
+    return [client for loop_clients in list(_motor_clients.values()) for client in loop_clients.values()]
+
+
+def _close_loop_clients(loop_clients: Dict[str, "AsyncIOMotorClient"], pid: int):
+    # Clients inherited across a fork are left to the parent, as in _reset_after_fork
+    if os.getpid() == pid:
+        for client in loop_clients.values():
+            client.close()
+    loop_clients.clear()
+
+
+def _close_stale_motor_clients():
+    """Close the clients of event loops that are closed and can never use them again"""
+    for loop in [loop for loop in list(_motor_clients.keys()) if loop.is_closed()]:
+        _close_loop_clients(_motor_clients.pop(loop), _clients_pid)
+
+
+def get_motor_client(uri: Optional[str] = None) -> "AsyncIOMotorClient":
+    """Return the shared motor client for a URI and the running event loop.
+
+    Motor clients are bound to the loop they are first used on, so one client
+    (and one pool) is kept per loop rather than per process. Clients of loops
+    that have since been closed (e.g. by an earlier asyncio.run) are closed here.
+    """
+    if not MOTOR_AVAILABLE:
+        raise ImportError("motor not available. Please install: pip install motor")
+
+    uri = uri or MONGODB_URI
+    if os.getpid() != _clients_pid:
+        _reset_after_fork()
+
+    _close_stale_motor_clients()
+    loop = asyncio.get_running_loop()
+    loop_clients = _motor_clients.get(loop)
+    if loop_clients is None:
+        loop_clients = _motor_clients[loop] = {}
+        # A loop that is garbage collected before the next call takes its clients along
+        weakref.finalize(loop, _close_loop_clients, loop_clients, _clients_pid)
+    client = loop_clients.get(uri)
+    if client is None:
+        client = AsyncIOMotorClient(uri, event_listeners=[_pool_listener], **get_client_options())
+        loop_clients[uri] = client
+        logger.info(f"Created shared async MongoDB client (maxPoolSize={MONGODB_MAX_POOL_SIZE})")
+    return client
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Return pool usage counters for every server the process talks to"""
+    return {
+        "pid": os.getpid(),
+        "clients": len(_clients),
+        "async_clients": len(_motor_client_list()),
+        "max_pool_size": MONGODB_MAX_POOL_SIZE,
+        "servers": _pool_listener.snapshot(),
+    }
+
+
+def close_mongo_clients():
+    """Close every shared client owned by this process"""
+    with _clients_lock:
+        if os.getpid() == _clients_pid:
+            for client in list(_clients.values()) + _motor_client_list():
+                client.close()
+        _clients.clear()
+        _motor_clients.clear()
+
+
+atexit.register(close_mongo_clients)
@@ -0,0 +1,205 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple
+from pymongo import UpdateOne
+from utils.job_documents import job_identity_filter, identity_key, build_upsert_update, refresh_fields
+from utils.job_fields import derive_job_fields
+from utils.job_stats import count_job_stats
+from utils.pagination import SCORE_FIELD, date_keyset_filter, score_keyset_filter
+
+# Query, update and index documents shared by the sync (pymongo) and async
+# (motor) managers, which only differ in how they send them to the server
+
+DATE_ORDER = [("posted_date", -1), ("_id", -1)]
+
+# Jobs stored before the normalized location/experience/skill fields existed
+MISSING_DERIVED_FIELDS = {"$or": [{"location_tokens": {"$exists": False}}, {"skill_ids": {"$exists": False}}]}
+DERIVED_SOURCE_FIELDS = {"location": 1, "experience": 1, "skills": 1}
+
+JOBS_INDEXES = [
+    [("title", "text"), ("job_description", "text"), ("skills", "text")],
+    "source",
+    "posted_date",
+    "url",
+    DATE_ORDER,
+    [("source", 1), ("posted_date", -1), ("_id", -1)],
+    [("city_ids", 1), ("source", 1), ("posted_date", -1), ("_id", -1)],
+    [("location_tokens", 1), ("posted_date", -1), ("_id", -1)],
+    [("is_remote", 1), ("posted_date", -1), ("_id", -1)],
+    [("exp_min", 1), ("exp_max", 1)],
+    [("skill_ids", 1), ("posted_date", -1), ("_id", -1)],
+    "first_seen_at",
+]
+ARCHIVE_INDEXES = [
+    DATE_ORDER,
+    [("city_ids", 1), ("source", 1), ("posted_date", -1)],
+    "url",
+]
+STATS_INDEXES = [
+    [("dimension", 1), ("count", -1)],
+]
+
+
+class MongoCollections:
+    """Collection handles of the jobs database; subclasses provide `client`"""
+
+    db_name: str
+
+    @property
+    def db(self):
+        return self.client[self.db_name]
+
+    @property
+    def jobs_collection(self):
+        return self.db.jobs
+
+    @property
+    def archive_collection(self):
+        return self.db.jobs_archive
+
+    @property
+    def resumes_collection(self):
+        return self.db.resumes
+
+    @property
+    def stats_collection(self):
+        return self.db.job_stats
+
+
+def _plan_stages(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a query plan tree into a list of stages"""
+    stages = [plan]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages += _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+
+def summarize_explain(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce MongoDB explain output to the stages, indexes and work done"""
+    winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+    stages = _plan_stages(winning_plan)
+    stats = explain.get("executionStats", {})
+    return {
+        "stages": [stage.get("stage") for stage in stages],
+        "indexes": [stage["indexName"] for stage in stages if "indexName" in stage],
+        "collection_scan": any(stage.get("stage") == "COLLSCAN" for stage in stages),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "returned": stats.get("nReturned"),
+        "time_ms": stats.get("executionTimeMillis"),
+    }
+
+
+def ids_filter(job_ids: List[str]) -> Dict[str, Any]:
+    """Filter matching the given job ID strings"""
+    from bson import ObjectId
+    return {"_id": {"$in": [ObjectId(job_id) for job_id in job_ids]}}
+
+
+def stats_operations(documents: List[Dict[str, Any]], sign: int = 1) -> List[UpdateOne]:
+    """Counter increments that add (or with sign=-1 remove) jobs' statistics"""
+    return [
+        UpdateOne({"_id": f"{dimension}:{key}"},
+                  {"$inc": {"count": sign * count}, "$setOnInsert": {"dimension": dimension, "key": key}},
+                  upsert=True)
+        for (dimension, key), count in count_job_stats(documents).items()
+    ]
+
+
+def stats_query(dimension: str, keys: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Filter for the non-zero counters of one dimension (optionally only some keys)"""
+    query = {"dimension": dimension, "count": {"$gt": 0}}
+    if keys is not None:
+        query["_id"] = {"$in": [f"{dimension}:{key}" for key in keys]}
+    return query
+
+
+def stats_counter_stages(dimension: str, into: str) -> List[Dict[str, Any]]:
+    """Stages that turn a stats rebuild pipeline's groups into counters merged into a collection"""
+    return [
+        {"$project": {
+            "_id": {"$concat": [f"{dimension}:", "$_id"]},
+            "dimension": {"$literal": dimension},
+            "key": "$_id",
+            "count": 1,
+        }},
+        {"$merge": {"into": into}},
+    ]
+
+
+def archive_refresh_operations(documents: List[Dict[str, Any]], seen_at: datetime) -> List[UpdateOne]:
+    """Refresh archived postings that are still listed"""
+    return [
+        UpdateOne(job_identity_filter(document), {"$set": {**refresh_fields(document), "last_seen_at": seen_at}})
+        for document in documents
+    ]
+
+
+def upsert_operations(documents: List[Dict[str, Any]]) -> List[UpdateOne]:
+    """Insert-or-refresh writes keyed by posting identity"""
+    return [UpdateOne(job_identity_filter(document), build_upsert_update(document), upsert=True)
+            for document in documents]
+
+
+def archive_operations(batch: List[Dict[str, Any]], archived_at: datetime) -> List[UpdateOne]:
+    """Copy hot jobs into the archive, keyed by posting identity"""
+    return [
+        UpdateOne(job_identity_filter(job),
+                  {"$set": {**{key: value for key, value in job.items() if key != "_id"},
+                            "archived_at": archived_at},
+                   "$setOnInsert": {"_id": job["_id"]}},
+                  upsert=True)
+        for job in batch
+    ]
+
+
+def backfill_operation(job: Dict[str, Any]) -> UpdateOne:
+    """Write the derived fields of a job stored before they existed"""
+    return UpdateOne({"_id": job["_id"]}, {"$set": derive_job_fields(job)})
+
+
+def relevance_page_pipeline(query: Dict[str, Any], position: Optional[Dict[str, Any]],
+                            last_id, page_size: int) -> List[Dict[str, Any]]:
+    """Aggregation for one page of a $text query, ordered by (text score, _id)"""
+    pipeline = [
+        {"$match": query},
+        {"$addFields": {SCORE_FIELD: {"$meta": "textScore"}}},
+    ]
+    if position:
+        pipeline.append({"$match": score_keyset_filter(position, last_id, SCORE_FIELD)})
+    pipeline += [
+        {"$sort": {SCORE_FIELD: -1, "_id": -1}},
+        {"$limit": page_size + 1},
+    ]
+    return pipeline
+
+
+def date_page_filter(query: Dict[str, Any], position: Optional[Dict[str, Any]], last_id) -> Dict[str, Any]:
+    """Filter for one page ordered by DATE_ORDER, resuming after the cursor position"""
+    return {"$and": [query, date_keyset_filter(position, last_id)]} if position else query
+
+
+def decode_last_id(position: Optional[Dict[str, Any]]):
+    """ObjectId of the last job on the previous page, if any"""
+    from bson import ObjectId
+    return ObjectId(position["i"]) if position else None
+
+
+def upsert_result(written, hot: List[int]) -> Dict[str, Any]:
+    """upsert_jobs counters from a bulk write over the hot postings"""
+    return {
+        "inserted": written.upserted_count,
+        "matched": written.matched_count,
+        "modified": written.modified_count,
+        "upserted_ids": {hot[position]: str(id) for position, id in written.upserted_ids.items()},
+    }
+
+
+
+def split_archived(documents: List[Dict[str, Any]], archived: Set[Tuple]) -> Tuple[List[int], List[Dict[str, Any]]]:
+    """Positions of the postings that belong in the hot set, and the archived postings to refresh"""
+    hot = [index for index, document in enumerate(documents) if identity_key(document) not in archived]
+    refreshed = [document for document in documents if identity_key(document) in archived]
+    return hot, refreshed
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+# Result orderings supported by keyset pagination
+ORDER_BY_DATE = "date"
+ORDER_BY_RELEVANCE = "relevance"
+
+# Field used to carry the $text relevance score through paged aggregations
+SCORE_FIELD = "_text_score"
+
+
+def encode_cursor(order: str, last_job: Dict[str, Any], score: Optional[float] = None) -> str:
+    """Build an opaque cursor pointing just past the last job of a page"""
+    position = {"o": order, "i": str(last_job["_id"])}
+    if order == ORDER_BY_RELEVANCE:
+        position["s"] = score
+    else:
+        posted_date = last_job.get("posted_date")
+        position["d"] = posted_date.isoformat() if isinstance(posted_date, datetime) else posted_date
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, order: str) -> Dict[str, Any]:
+    """Decode a cursor produced by encode_cursor for the given ordering"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid page cursor")
+
+    if position.get("o") != order:
+        raise ValueError(f"Page cursor was created for '{position.get('o')}' ordering, not '{order}'")
+    if position.get("d"):
+        position["d"] = datetime.fromisoformat(position["d"])
+    return position
+
+
+def date_keyset_filter(position: Dict[str, Any], last_id: Any) -> Dict[str, Any]:
+    """Filter selecting jobs after a position in (posted_date desc, _id desc) order.
+
+    MongoDB sorts missing/null dates after every real date when descending,
+    so a page that ended on a dated job continues into the undated ones.
+    """
+    if position.get("d") is None:
+        return {"posted_date": None, "_id": {"$lt": last_id}}
+    return {"$or": [
+        {"posted_date": {"$lt": position["d"]}},
+        {"posted_date": position["d"], "_id": {"$lt": last_id}},
+        {"posted_date": None},
+    ]}
+
+
+def score_keyset_filter(position: Dict[str, Any], last_id: Any, score_field: str) -> Dict[str, Any]:
+    """Filter selecting jobs after a position in (text score desc, _id desc) order"""
+    return {"$or": [
+        {score_field: {"$lt": position["s"]}},
+        {score_field: position["s"], "_id": {"$lt": last_id}},
+    ]}
+
+
+def build_page(jobs: List[Dict[str, Any]], page_size: int, order: str) -> Dict[str, Any]:
+    """Trim a page fetched with one extra row and derive its next cursor"""
+    has_more = len(jobs) > page_size
+    jobs = jobs[:page_size]
+    next_cursor = None
+    if has_more and jobs:
+        next_cursor = encode_cursor(order, jobs[-1], jobs[-1].get(SCORE_FIELD))
+    for job in jobs:
+        job.pop(SCORE_FIELD, None)
+    return {"jobs": jobs, "next_cursor": next_cursor}
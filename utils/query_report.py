@@ -0,0 +1,36 @@
+from typing import List, Dict, Any
+from utils.job_query import build_job_filter
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Sort used by the paged job listings
+DATE_SORT = [("posted_date", -1), ("_id", -1)]
+
+# Representative queries issued by the web UI and the agent's search tool
+REPORT_QUERIES = [
+    ("latest jobs", {}, DATE_SORT),
+    ("source", build_job_filter(source="naukri"), DATE_SORT),
+    ("city", build_job_filter(location="Bangalore"), DATE_SORT),
+    ("city + source", build_job_filter(location="Pune", source="linkedin"), DATE_SORT),
+    ("remote", build_job_filter(location="Remote"), DATE_SORT),
+    ("location tokens", build_job_filter(location="Electronic City"), DATE_SORT),
+    ("experience", build_job_filter(experience="3 years"), None),
+    ("text + city", build_job_filter(query="python developer", location="Bangalore"), None),
+]
+
+
+def run_query_report(db, slow_ms: int = 100) -> List[Dict[str, Any]]:
+    """Explain every representative query and flag scans or slow plans"""
+    report = []
+    for name, query, sort in REPORT_QUERIES:
+        try:
+            summary = db.explain_query(query, sort=sort)
+        except Exception as e:
+            logger.error(f"Error explaining query '{name}': {e}")
+            summary = {"error": str(e)}
+        summary["name"] = name
+        summary["query"] = query
+        summary["slow"] = bool(summary.get("collection_scan")) or (summary.get("time_ms") or 0) >= slow_ms
+        report.append(summary)
+    return report
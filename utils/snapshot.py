@@ -0,0 +1,227 @@
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Iterator
+from config.settings import JOB_SNAPSHOT_PATH
+from utils.base_database import BaseDatabaseManager
+import logging
+
+# Optional imports with graceful fallback
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SKILL_VOCABULARY_KEY = b"joblo.skill_vocabulary"
+
+# Job fields exported as-is, in column order
+JOB_COLUMNS = [
+    "title", "company", "location", "experience", "skills", "job_description",
+    "posted_date", "url", "source", "salary", "job_type",
+    "location_tokens", "city_ids", "is_remote", "exp_min", "exp_max",
+]
+
+
+def _snapshot_schema(skill_vocabulary: Optional[List[str]] = None) -> "pa.Schema":
+    """Schema of a snapshot; without a vocabulary, of the staged rows before skill IDs are assigned"""
+    string_list = pa.list_(pa.string())
+    fields = [
+        ("_id", pa.string()),
+        ("title", pa.string()),
+        ("company", pa.string()),
+        ("location", pa.string()),
+        ("experience", pa.string()),
+        ("skills", string_list),
+        ("job_description", pa.string()),
+        ("posted_date", pa.timestamp("ms")),
+        ("url", pa.string()),
+        ("source", pa.string()),
+        ("salary", pa.string()),
+        ("job_type", pa.string()),
+        ("location_tokens", string_list),
+        ("city_ids", string_list),
+        ("is_remote", pa.bool_()),
+        ("exp_min", pa.int32()),
+        ("exp_max", pa.int32()),
+        # Derived features: dictionary-encoded skills and the text used for similarity
+        ("skill_ids", pa.list_(pa.int32())),
+        ("job_text", pa.string()),
+    ]
+    if skill_vocabulary is None:
+        return pa.schema([field for field in fields if field[0] != "skill_ids"])
+    return pa.schema(fields, metadata={SKILL_VOCABULARY_KEY: json.dumps(skill_vocabulary).encode("utf-8")})
+
+
+def build_job_text(job: Dict[str, Any]) -> str:
+    """Text representation of a job used for TF-IDF similarity"""
+    parts = [
+        job.get('title', ''),
+        job.get('company', ''),
+        job.get('location', ''),
+        job.get('job_description', ''),
+        ' '.join(job.get('skills') or []),
+        job.get('experience', '')
+    ]
+    return ' '.join(filter(None, parts))
+
+
+def export_snapshot(db: BaseDatabaseManager, path: Path, batch_size: int = 5000) -> Dict[str, Any]:
+    """Export the hot job set to a columnar snapshot.
+
+    ".parquet" paths produce compressed Parquet; anything else produces an
+    Arrow IPC file, which can be memory-mapped and read without copying.
+    """
+    if not ARROW_AVAILABLE:
+        raise ImportError("pyarrow not available. Please install: pip install pyarrow")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".staging")
+
+    # The database is read once into a staging file, so the skill vocabulary
+    # and the exported rows always come from the same jobs, whatever is
+    # written to the database meanwhile
+    vocabulary = set()
+    rows = 0
+    try:
+        with pa.OSFile(str(staging), "wb") as sink, ipc.new_file(sink, _snapshot_schema()) as writer:
+            batch = []
+            for job in db.iter_jobs(batch_size=batch_size):
+                batch.append(job)
+                if len(batch) >= batch_size:
+                    writer.write_batch(_to_record_batch(batch, vocabulary))
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                writer.write_batch(_to_record_batch(batch, vocabulary))
+                rows += len(batch)
+
+        # A stable, sorted skill vocabulary so skill IDs are reproducible
+        vocabulary = sorted(vocabulary)
+        _write_snapshot(staging, path, vocabulary)
+    finally:
+        staging.unlink(missing_ok=True)
+
+    logger.info(f"Exported {rows} jobs to snapshot {path}")
+    return {"path": str(path), "jobs": rows, "skills": len(vocabulary)}
+
+
+def _to_record_batch(jobs: List[Dict[str, Any]], vocabulary: Set[str]) -> "pa.RecordBatch":
+    """Staged rows of a batch of jobs, adding their skills to vocabulary"""
+    columns = {"_id": [str(job["_id"]) for job in jobs]}
+    for column in JOB_COLUMNS:
+        columns[column] = [job.get(column) for job in jobs]
+    columns["job_text"] = [build_job_text(job) for job in jobs]
+    vocabulary.update(skill.lower() for job in jobs for skill in job.get("skills") or [])
+    return pa.RecordBatch.from_pydict(columns, schema=_snapshot_schema())
+
+
+def _write_snapshot(staging: Path, path: Path, vocabulary: List[str]):
+    """Copy the staged rows to the snapshot file, adding their skill IDs"""
+    schema = _snapshot_schema(vocabulary)
+    skill_index = {skill: i for i, skill in enumerate(vocabulary)}
+    position = schema.get_field_index("skill_ids")
+
+    sink = None
+    if path.suffix == ".parquet":
+        writer = pq.ParquetWriter(str(path), schema, compression="zstd")
+    else:
+        sink = pa.OSFile(str(path), "wb")
+        writer = ipc.new_file(sink, schema)
+    try:
+        with pa.memory_map(str(staging), "r") as source:
+            staged = ipc.open_file(source)
+            for i in range(staged.num_record_batches):
+                batch = staged.get_batch(i)
+                skill_ids = [[skill_index[skill.lower()] for skill in skills or []]
+                             for skills in batch.column("skills").to_pylist()]
+                columns = batch.columns
+                columns.insert(position, pa.array(skill_ids, type=schema.field("skill_ids").type))
+                writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+    finally:
+        writer.close()
+        if sink is not None:
+            sink.close()
+
+
+class JobSnapshot:
+    """A loaded columnar snapshot of the job corpus.
+
+    Consumers read the columns they need (column, iter_jobs, take) instead of
+    materializing every row, so the corpus stays in the mapped file.
+    """
+
+    def __init__(self, table: "pa.Table", path: Path, source: Optional["pa.MemoryMappedFile"] = None):
+        self.table = table
+        self.path = path
+        self._source = source
+        metadata = table.schema.metadata or {}
+        self.skill_vocabulary = json.loads(metadata.get(SKILL_VOCABULARY_KEY, b"[]"))
+
+    @classmethod
+    def load(cls, path: Path) -> "JobSnapshot":
+        """Open a snapshot memory-mapped, so column buffers are not copied into memory"""
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow not available. Please install: pip install pyarrow")
+
+        path = Path(path)
+        source = None
+        if path.suffix == ".parquet":
+            table = pq.read_table(str(path), memory_map=True)
+        else:
+            source = pa.memory_map(str(path), "r")
+            table = ipc.open_file(source).read_all()
+        logger.info(f"Loaded snapshot {path} with {table.num_rows} jobs")
+        return cls(table, path, source)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def column(self, name: str) -> List[Any]:
+        """Read a single column without materializing the other ones"""
+        return self.table.column(name).to_pylist()
+
+    def iter_jobs(self, columns: List[str], batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream jobs with only the given columns, converting one batch at a time"""
+        for batch in self.table.select(columns).to_batches(max_chunksize=batch_size):
+            yield from batch.to_pylist()
+
+    def take(self, rows: List[int]) -> List[Dict[str, Any]]:
+        """Materialize only the given rows as job dicts"""
+        return self.table.take(rows).to_pylist()
+
+    def close(self):
+        """Release the table and the memory-mapped file behind it"""
+        self.table = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+_loaded_snapshots: Dict[str, Any] = {}
+
+
+def load_snapshot(path: Optional[str] = None) -> Optional[JobSnapshot]:
+    """Load the configured snapshot once per process, reloading when the file changes"""
+    path = path or JOB_SNAPSHOT_PATH
+    if not path or not ARROW_AVAILABLE:
+        return None
+
+    path = Path(path)
+    if not path.exists():
+        logger.warning(f"Snapshot not found: {path}; falling back to the database")
+        return None
+
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime
+    cached = _loaded_snapshots.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    snapshot = JobSnapshot.load(path)
+    _loaded_snapshots[key] = (mtime, snapshot)
+    return snapshot
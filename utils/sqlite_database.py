@@ -0,0 +1,663 @@
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from config.settings import SQLITE_DB_PATH
+from models.job import Job
+from utils.base_database import BaseDatabaseManager
+from utils.job_documents import (
+    job_to_document, job_identity_filter, order_by_ids, stale_jobs_filter, refresh_fields, with_derived_updates,
+)
+from utils.job_fields import derive_job_fields
+from utils.job_stats import STATS_FIELDS, count_job_stats, moved_stats
+from utils.pagination import (
+    ORDER_BY_DATE, ORDER_BY_RELEVANCE, SCORE_FIELD,
+    decode_cursor, date_keyset_filter, build_page,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Document fields mirrored into real columns so they can be indexed
+COLUMN_FIELDS = {
+    "_id": "id",
+    "url": "url",
+    "source": "source",
+    "title": "title",
+    "company": "company",
+    "location": "location",
+    "posted_date": "posted_date",
+    "exp_min": "exp_min",
+    "exp_max": "exp_max",
+    "is_remote": "is_remote",
+}
+
+# Array fields exploded into the job_terms side table for indexed membership tests
+TERM_FIELDS = ("city_ids", "location_tokens", "skills", "skill_ids")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    url TEXT,
+    source TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    posted_date TEXT,
+    exp_min INTEGER,
+    exp_max INTEGER,
+    is_remote INTEGER,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_terms (
+    job_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs_archive (
+    id TEXT PRIMARY KEY,
+    url TEXT,
+    source TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    posted_date TEXT,
+    exp_min INTEGER,
+    exp_max INTEGER,
+    is_remote INTEGER,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_stats (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, key)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, job_description, skills, tokenize = 'porter unicode61'
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs (url);
+CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs (posted_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_source_posted ON jobs (source, posted_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_remote_posted ON jobs (is_remote, posted_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_experience ON jobs (exp_min, exp_max);
+CREATE INDEX IF NOT EXISTS idx_job_terms_lookup ON job_terms (field, value, job_id);
+CREATE INDEX IF NOT EXISTS idx_job_terms_job ON job_terms (job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_archive_posted ON jobs_archive (posted_date DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_archive_source ON jobs_archive (source, posted_date DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_archive_url ON jobs_archive (url);
+"""
+
+_local = threading.local()
+
+
+def _new_id() -> str:
+    """24-hex ID that sorts by creation time, like a MongoDB ObjectId"""
+    return f"{int(time.time()):08x}{secrets.token_hex(8)}"
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return {"$date": _to_naive_utc(value).isoformat()}
+    return str(value)
+
+
+def _json_object_hook(value: Dict[str, Any]):
+    if len(value) == 1 and "$date" in value:
+        return datetime.fromisoformat(value["$date"])
+    return value
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Store datetimes the way MongoDB does: UTC without tzinfo"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _sql_value(value):
+    """Convert a Python filter value into its SQLite column representation"""
+    if isinstance(value, datetime):
+        return _to_naive_utc(value).isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _regexp(pattern: str, value) -> bool:
+    if value is None:
+        return False
+    flags = re.IGNORECASE if pattern.startswith("(?i)") else 0
+    return re.search(pattern[4:] if flags else pattern, str(value), flags) is not None
+
+
+def _fts_query(text: str) -> str:
+    """Translate a MongoDB $search string (any term matches) into an FTS5 query"""
+    terms = re.findall(r'\w+', text.lower())
+    return " OR ".join(f'"{term}"' for term in terms) or '""'
+
+
+class _FilterTranslator:
+    """Translate the MongoDB filter subset used by the app into a SQL WHERE clause.
+
+    The archive table has neither job_terms nor an FTS index, so archive
+    filters fall back to json_each() and regular expressions.
+    """
+
+    def __init__(self, archive: bool = False):
+        self.params: List[Any] = []
+        self.archive = archive
+
+    def translate(self, query: Dict[str, Any]) -> str:
+        clauses = []
+        for key, value in query.items():
+            if key == "$and":
+                clauses.append(self._join([self.translate(part) for part in value], "AND"))
+            elif key == "$or":
+                clauses.append(self._join([self.translate(part) for part in value], "OR"))
+            elif key == "$text" and self.archive:
+                terms = re.findall(r'\w+', value["$search"].lower())
+                self.params.append("(?i)" + "|".join(re.escape(term) for term in terms))
+                clauses.append("regexp(?, title || ' ' || json_extract(doc, '$.job_description'))")
+            elif key == "$text":
+                self.params.append(_fts_query(value["$search"]))
+                clauses.append("rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            else:
+                clauses.append(self._field(key, value))
+        return self._join(clauses, "AND")
+
+    @staticmethod
+    def _join(clauses: List[str], operator: str) -> str:
+        clauses = [clause for clause in clauses if clause]
+        if not clauses:
+            return "1 = 1"
+        return "(" + f" {operator} ".join(clauses) + ")"
+
+    def _field(self, field: str, condition) -> str:
+        if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+            options = condition.get("$options", "")
+            clauses = [self._operator(field, op, operand, options)
+                       for op, operand in condition.items() if op != "$options"]
+            return self._join(clauses, "AND")
+        return self._operator(field, "$eq", condition, "")
+
+    def _operator(self, field: str, op: str, operand, options: str) -> str:
+        if field in TERM_FIELDS:
+            return self._term_operator(field, op, operand)
+
+        column = COLUMN_FIELDS.get(field)
+        if column is None and isinstance(operand, datetime):
+            # Datetimes inside the JSON document are stored as {"$date": iso}
+            column = f"json_extract(doc, '$.{field}.\"$date\"')"
+        elif column is None:
+            column = f"json_extract(doc, '$.{field}')"
+
+        if op == "$eq":
+            if operand is None:
+                return f"{column} IS NULL"
+            self.params.append(_sql_value(operand))
+            return f"{column} = ?"
+        if op == "$ne":
+            if operand is None:
+                return f"{column} IS NOT NULL"
+            self.params.append(_sql_value(operand))
+            return f"({column} IS NULL OR {column} != ?)"
+        if op in ("$lt", "$lte", "$gt", "$gte"):
+            sql_op = {"$lt": "<", "$lte": "<=", "$gt": ">", "$gte": ">="}[op]
+            self.params.append(_sql_value(operand))
+            return f"{column} {sql_op} ?"
+        if op in ("$in", "$nin"):
+            if not operand:
+                return "1 = 0" if op == "$in" else "1 = 1"
+            self.params.extend(_sql_value(item) for item in operand)
+            placeholders = ", ".join("?" for _ in operand)
+            negate = "NOT " if op == "$nin" else ""
+            return f"{column} {negate}IN ({placeholders})"
+        if op == "$exists":
+            return f"{column} IS {'NOT ' if operand else ''}NULL"
+        if op == "$regex":
+            self.params.append(("(?i)" if "i" in options else "") + operand)
+            return f"regexp(?, {column})"
+        raise ValueError(f"Unsupported query operator for SQLite backend: {op}")
+
+    def _term_operator(self, field: str, op: str, operand) -> str:
+        def membership(values: List[Any]) -> str:
+            placeholders = ", ".join("?" for _ in values)
+            if self.archive:
+                self.params.extend(values)
+                return f"EXISTS (SELECT 1 FROM json_each(doc, '$.{field}') WHERE value IN ({placeholders}))"
+            self.params.append(field)
+            self.params.extend(values)
+            return f"id IN (SELECT job_id FROM job_terms WHERE field = ? AND value IN ({placeholders}))"
+
+        if op == "$eq":
+            return membership([operand])
+        if op == "$in":
+            return membership(list(operand)) if operand else "1 = 0"
+        if op == "$all":
+            return self._join([membership([value]) for value in operand], "AND")
+        if op == "$exists":
+            return f"json_extract(doc, '$.{field}') IS {'NOT ' if operand else ''}NULL"
+        raise ValueError(f"Unsupported array operator for SQLite backend: {op}")
+
+
+def _get_connection(path: Path) -> sqlite3.Connection:
+    """Return this thread's connection to a database file, creating the schema once"""
+    connections = getattr(_local, "connections", None)
+    if connections is None or getattr(_local, "pid", None) != os.getpid():
+        connections = _local.connections = {}
+        _local.pid = os.getpid()
+
+    key = str(path)
+    connection = connections.get(key)
+    if connection is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(key, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.create_function("regexp", 2, _regexp, deterministic=True)
+        connection.executescript(SCHEMA + INDEXES)
+        connections[key] = connection
+    return connection
+
+
+class SQLiteDatabaseManager(BaseDatabaseManager):
+    """Embedded SQLite storage backend with FTS5 text search.
+
+    Each job is stored as a JSON document with the commonly filtered fields
+    mirrored into indexed columns, array fields exploded into job_terms, and
+    title/description/skills indexed in an FTS5 table for search_jobs.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or SQLITE_DB_PATH)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return _get_connection(self.path)
+
+    def _load(self, row: sqlite3.Row) -> Dict[str, Any]:
+        document = json.loads(row["doc"], object_hook=_json_object_hook)
+        document["_id"] = row["id"]
+        if SCORE_FIELD in row.keys():
+            document[SCORE_FIELD] = row[SCORE_FIELD]
+        return document
+
+    def _save(self, job_id: str, document: Dict[str, Any], replace: bool):
+        """Write a document and its column, term and full-text projections"""
+        document = {key: value for key, value in document.items() if key != "_id"}
+        columns = {column: _sql_value(document.get(field)) for field, column in COLUMN_FIELDS.items() if field != "_id"}
+        doc_json = json.dumps(document, default=_json_default)
+        connection = self.connection
+
+        if replace:
+            rowid = connection.execute("SELECT rowid FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            connection.execute(f"UPDATE jobs SET {assignments}, doc = ? WHERE id = ?",
+                               (*columns.values(), doc_json, job_id))
+            connection.execute("DELETE FROM job_terms WHERE job_id = ?", (job_id,))
+            connection.execute("DELETE FROM jobs_fts WHERE rowid = ?", (rowid,))
+        else:
+            names = ", ".join(columns)
+            placeholders = ", ".join("?" for _ in columns)
+            cursor = connection.execute(f"INSERT INTO jobs (id, {names}, doc) VALUES (?, {placeholders}, ?)",
+                                        (job_id, *columns.values(), doc_json))
+            rowid = cursor.lastrowid
+
+        terms = [(job_id, field, str(value)) for field in TERM_FIELDS for value in document.get(field) or []]
+        connection.executemany("INSERT INTO job_terms (job_id, field, value) VALUES (?, ?, ?)", terms)
+        connection.execute("INSERT INTO jobs_fts (rowid, title, job_description, skills) VALUES (?, ?, ?, ?)",
+                           (rowid, document.get("title", ""), document.get("job_description", ""),
+                            " ".join(document.get("skills") or [])))
+
+    def _apply_stats(self, documents: List[Dict[str, Any]], sign: int = 1):
+        """Add (or with sign=-1 remove) jobs' contributions to the statistics counters.
+
+        Runs inside the caller's transaction, so counters always match the jobs.
+        """
+        counts = count_job_stats(documents)
+        self.connection.executemany(
+            "INSERT INTO job_stats (dimension, key, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (dimension, key) DO UPDATE SET count = count + excluded.count",
+            [(dimension, key, sign * count) for (dimension, key), count in counts.items()]
+        )
+
+    def _find_existing_id(self, document: Dict[str, Any], table: str = "jobs") -> Optional[str]:
+        translator = _FilterTranslator(archive=table == "jobs_archive")
+        where = translator.translate(job_identity_filter(document))
+        row = self.connection.execute(f"SELECT id FROM {table} WHERE {where} LIMIT 1", translator.params).fetchone()
+        return row["id"] if row else None
+
+    def _save_archived(self, archive_id: str, document: Dict[str, Any]):
+        """Write an archive row (caller manages the transaction)"""
+        document = {key: value for key, value in document.items() if key != "_id"}
+        columns = {column: _sql_value(document.get(field)) for field, column in COLUMN_FIELDS.items() if field != "_id"}
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO jobs_archive (id, {names}, doc) VALUES (?, {placeholders}, ?)",
+            (archive_id, *columns.values(), json.dumps(document, default=_json_default))
+        )
+
+    def insert_job(self, job: Job) -> str:
+        """Insert a single job into the database"""
+        return self.insert_jobs([job])[0]
+
+    def insert_jobs(self, jobs: List[Job]) -> List[str]:
+        """Insert multiple jobs into the database"""
+        try:
+            job_ids = []
+            with self.connection:
+                documents = [job_to_document(job) for job in jobs]
+                for document in documents:
+                    job_id = _new_id()
+                    self._save(job_id, document, replace=False)
+                    job_ids.append(job_id)
+                self._apply_stats(documents)
+            return job_ids
+        except Exception as e:
+            logger.error(f"Error inserting jobs: {e}")
+            raise
+
+    def upsert_jobs(self, jobs: List[Job]) -> Dict[str, Any]:
+        """Insert new jobs and refresh known ones in a single transaction.
+
+        Postings that were archived and are still listed are refreshed in the
+        archive rather than inserted into the hot tables again.
+        """
+        result = {"inserted": 0, "matched": 0, "modified": 0, "archived": 0, "upserted_ids": {}}
+        try:
+            with self.connection:
+                inserted = []
+                for index, job in enumerate(jobs):
+                    # Round-trip through JSON so comparisons see stored (naive UTC) values
+                    document = json.loads(json.dumps(job_to_document(job), default=_json_default),
+                                          object_hook=_json_object_hook)
+                    archive_id = self._find_existing_id(document, table="jobs_archive")
+                    if archive_id:
+                        archived = self._load(self.connection.execute(
+                            "SELECT id, doc FROM jobs_archive WHERE id = ?", (archive_id,)).fetchone())
+                        self._save_archived(archive_id, {**archived, **refresh_fields(document),
+                                                         "last_seen_at": datetime.now()})
+                        result["archived"] += 1
+                        continue
+                    job_id = self._find_existing_id(document)
+                    if job_id:
+                        existing = self.find_job_by_id(job_id)
+                        merged = {**existing, **refresh_fields(document)}
+                        result["matched"] += 1
+                        if merged != existing:
+                            self._save(job_id, merged, replace=True)
+                            result["modified"] += 1
+                            # A re-scrape can change skills, location, source or the posting date
+                            moved = moved_stats(existing, merged)
+                            if moved:
+                                self._apply_stats([existing], -1)
+                                self._apply_stats([moved])
+                    else:
+                        job_id = _new_id()
+                        document["first_seen_at"] = datetime.now()
+                        self._save(job_id, document, replace=False)
+                        inserted.append(document)
+                        result["inserted"] += 1
+                        result["upserted_ids"][index] = job_id
+                self._apply_stats(inserted)
+            return result
+        except Exception as e:
+            logger.error(f"Error upserting jobs: {e}")
+            raise
+
+    def _select(self, query: Dict[str, Any], order_by: str = "", limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        translator = _FilterTranslator()
+        sql = f"SELECT id, doc FROM jobs WHERE {translator.translate(query or {})}"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return sql, translator.params
+
+    def find_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs based on query"""
+        sql, params = self._select(query, limit=limit)
+        return [self._load(row) for row in self.connection.execute(sql, params)]
+
+    def find_jobs_page(self, query: Dict[str, Any], page_size: int = 20,
+                       cursor: Optional[str] = None, order: str = ORDER_BY_DATE) -> Dict[str, Any]:
+        """Find one page of jobs using keyset (seek) pagination"""
+        position = decode_cursor(cursor, order) if cursor else None
+
+        if order == ORDER_BY_RELEVANCE:
+            query = dict(query)
+            text = query.pop("$text")["$search"]
+            translator = _FilterTranslator()
+            translator.params.append(_fts_query(text))
+            where = translator.translate(query)
+            sql = (f"SELECT * FROM (SELECT id, doc, matches.score AS {SCORE_FIELD} FROM jobs "
+                   f"JOIN (SELECT rowid AS match_rowid, -bm25(jobs_fts) AS score FROM jobs_fts "
+                   f"WHERE jobs_fts MATCH ?) AS matches ON jobs.rowid = matches.match_rowid "
+                   f"WHERE {where})")
+            params = translator.params
+            if position:
+                sql += f" WHERE {SCORE_FIELD} < ? OR ({SCORE_FIELD} = ? AND id < ?)"
+                params += [position["s"], position["s"], position["i"]]
+            sql += f" ORDER BY {SCORE_FIELD} DESC, id DESC LIMIT {int(page_size) + 1}"
+        else:
+            if position:
+                query = {"$and": [query, date_keyset_filter(position, position["i"])]}
+            sql, params = self._select(query, order_by="posted_date DESC NULLS LAST, id DESC",
+                                       limit=page_size + 1)
+
+        jobs = [self._load(row) for row in self.connection.execute(sql, params)]
+        return build_page(jobs, page_size, order)
+
+    def find_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Find a single job by ID"""
+        row = self.connection.execute("SELECT id, doc FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._load(row) if row else None
+
+    def find_jobs_by_ids(self, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch several jobs in one query, preserving the order of job_ids"""
+        if not job_ids:
+            return []
+        return order_by_ids(self.find_jobs({"_id": {"$in": list(job_ids)}}), job_ids)
+
+    def update_job(self, job_id: str, update_data: Dict[str, Any]) -> bool:
+        """Update a job"""
+        with self.connection:
+            existing = self.find_job_by_id(job_id)
+            if not existing:
+                return False
+            updated = {**existing, **with_derived_updates(update_data)}
+            if updated == existing:
+                return False
+            self._save(job_id, updated, replace=True)
+            if any(existing.get(field) != updated.get(field) for field in STATS_FIELDS):
+                self._apply_stats([existing], -1)
+                self._apply_stats([updated])
+            return True
+
+    def get_all_jobs(self) -> List[Dict[str, Any]]:
+        """Get all jobs from the database"""
+        return list(self.iter_jobs())
+
+    def iter_jobs(self, query: Optional[Dict[str, Any]] = None,
+                  projection: Optional[Dict[str, Any]] = None,
+                  batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream jobs in batches without loading them all into memory"""
+        sql, params = self._select(query or {}, order_by="rowid")
+        return self._iter_rows(sql, params, projection, batch_size)
+
+    def _iter_rows(self, sql: str, params: List[Any], projection: Optional[Dict[str, Any]],
+                   batch_size: int) -> Iterator[Dict[str, Any]]:
+        cursor = self.connection.execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    document = self._load(row)
+                    if projection:
+                        document = {key: value for key, value in document.items()
+                                    if key == "_id" or projection.get(key)}
+                    yield document
+        finally:
+            cursor.close()
+
+    def search_jobs(self, text: str) -> List[Dict[str, Any]]:
+        """Search jobs using FTS5 full-text search, best matches first"""
+        rows = self.connection.execute(
+            "SELECT jobs.id AS id, jobs.doc AS doc FROM jobs_fts JOIN jobs ON jobs.rowid = jobs_fts.rowid "
+            "WHERE jobs_fts MATCH ? ORDER BY bm25(jobs_fts)",
+            (_fts_query(text),)
+        )
+        return [self._load(row) for row in rows]
+
+    def _delete(self, job_ids: List[str]) -> int:
+        """Remove jobs and their term and full-text rows (caller manages the transaction)"""
+        connection = self.connection
+        deleted = 0
+        for job_id in job_ids:
+            row = connection.execute("SELECT rowid FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                continue
+            connection.execute("DELETE FROM jobs_fts WHERE rowid = ?", (row["rowid"],))
+            connection.execute("DELETE FROM job_terms WHERE job_id = ?", (job_id,))
+            connection.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            deleted += 1
+        return deleted
+
+    def archive_jobs(self, cutoff: datetime, batch_size: int = 500) -> int:
+        """Move jobs posted before cutoff from the hot tables to jobs_archive.
+
+        Archived jobs are keyed by their posting identity (URL), so a posting
+        archived twice keeps one archive row.
+        """
+        archived = 0
+        archived_at = datetime.now()
+        while True:
+            sql, params = self._select(stale_jobs_filter(cutoff), limit=batch_size)
+            batch = [self._load(row) for row in self.connection.execute(sql, params)]
+            if not batch:
+                break
+            with self.connection:
+                for job in batch:
+                    archive_id = self._find_existing_id(job, table="jobs_archive") or job["_id"]
+                    self._save_archived(archive_id, {**job, "archived_at": archived_at})
+                self._delete([job["_id"] for job in batch])
+                self._apply_stats(batch, sign=-1)
+            archived += len(batch)
+        logger.info(f"Archived {archived} jobs posted before {cutoff:%Y-%m-%d}")
+        return archived
+
+    def iter_archived_jobs(self, query: Optional[Dict[str, Any]] = None,
+                           projection: Optional[Dict[str, Any]] = None,
+                           batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Stream jobs from the archive table"""
+        translator = _FilterTranslator(archive=True)
+        sql = f"SELECT id, doc FROM jobs_archive WHERE {translator.translate(query or {})} ORDER BY rowid"
+        return self._iter_rows(sql, translator.params, projection, batch_size)
+
+    def find_archived_jobs(self, query: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find jobs in the archive table"""
+        translator = _FilterTranslator(archive=True)
+        sql = f"SELECT id, doc FROM jobs_archive WHERE {translator.translate(query or {})}"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [self._load(row) for row in self.connection.execute(sql, translator.params)]
+
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete jobs from the hot tables"""
+        documents = self.find_jobs_by_ids(job_ids)
+        with self.connection:
+            deleted = self._delete(job_ids)
+            self._apply_stats(documents, sign=-1)
+        return deleted
+
+    def get_stats(self, dimension: str, keys: Optional[List[str]] = None) -> Dict[str, int]:
+        """Read market statistics counters for one dimension (optionally only some keys)"""
+        sql = "SELECT key, count FROM job_stats WHERE dimension = ? AND count > 0"
+        params = [dimension]
+        if keys is not None:
+            if not keys:
+                return {}
+            sql += f" AND key IN ({', '.join('?' for _ in keys)})"
+            params += list(keys)
+        return {row["key"]: row["count"] for row in self.connection.execute(sql, params)}
+
+    def rebuild_stats(self) -> int:
+        """Recompute the statistics counters in a single pass over the jobs"""
+        counts = count_job_stats(self.iter_jobs(projection=STATS_FIELDS))
+        with self.connection:
+            self.connection.execute("DELETE FROM job_stats")
+            self.connection.executemany(
+                "INSERT INTO job_stats (dimension, key, count) VALUES (?, ?, ?)",
+                [(dimension, key, count) for (dimension, key), count in counts.items()]
+            )
+        logger.info(f"Rebuilt {len(counts)} job statistics counters")
+        return len(counts)
+
+    def create_indexes(self):
+        """Create necessary indexes and refresh planner statistics"""
+        self.connection.executescript(INDEXES)
+        self.connection.execute("ANALYZE")
+
+    def backfill_derived_fields(self, batch_size: int = 500) -> int:
+        """Populate normalized location/experience/skill fields on jobs stored before they existed"""
+        missing = list(self.iter_jobs({"$or": [{"location_tokens": {"$exists": False}},
+                                               {"skill_ids": {"$exists": False}}]}, batch_size=batch_size))
+        with self.connection:
+            for job in missing:
+                self._save(job["_id"], {**job, **derive_job_fields(job)}, replace=True)
+        logger.info(f"Backfilled derived fields on {len(missing)} jobs")
+        return len(missing)
+
+    def explain_query(self, query: Dict[str, Any], sort: Optional[List] = None,
+                      limit: int = 20) -> Dict[str, Any]:
+        """Run EXPLAIN QUERY PLAN on a query and summarize it like MongoDB explain"""
+        order_by = ", ".join(
+            f"{COLUMN_FIELDS.get(field, field)} {'DESC' if direction < 0 else 'ASC'}"
+            for field, direction in (sort or [])
+        )
+        sql, params = self._select(query, order_by=order_by, limit=limit)
+        details = [row["detail"] for row in self.connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+        started = time.perf_counter()
+        returned = len(self.connection.execute(sql, params).fetchall())
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        indexes = []
+        for detail in details:
+            match = re.search(r'USING (?:COVERING )?INDEX (\w+)', detail)
+            if match and match.group(1) not in indexes:
+                indexes.append(match.group(1))
+        return {
+            "stages": details,
+            "indexes": indexes,
+            "collection_scan": any(re.match(r'SCAN (TABLE )?jobs\b(?! USING)', detail) for detail in details),
+            "docs_examined": None,
+            "keys_examined": None,
+            "returned": returned,
+            "time_ms": elapsed_ms,
+        }
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection usage for this process"""
+        return {
+            "backend": self.backend,
+            "path": str(self.path),
+            "thread_connections": len(getattr(_local, "connections", {}) or {}),
+        }
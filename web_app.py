@@ -1,11 +1,15 @@
 import streamlit as st
 from typing import Optional
 import pandas as pd
-from utils.database import DatabaseManager
+from utils.database import create_database_manager
 from recommendations.job_recommender import JobRecommender
 from scoring.job_scorer import JobScorer
 from scoring.resume_parser import ResumeParser
 from agents.job_agent import JobAgent
+from utils.pagination import ORDER_BY_DATE, ORDER_BY_RELEVANCE
+from utils.job_query import build_job_filter
+from utils.job_stats import JobStats
+from config.settings import JOB_SEARCH_PAGE_SIZE
 import logging
 import os
 
@@ -15,10 +19,11 @@ logger = logging.getLogger(__name__)
 # Initialize components
 @st.cache_resource
 def init_components():
-    db = DatabaseManager()
-    recommender = JobRecommender()
-    scorer = JobScorer()
-    agent = JobAgent()
+    # All components share one database manager and therefore one connection pool
+    db = create_database_manager()
+    scorer = JobScorer(db=db)
+    recommender = JobRecommender(db=db, scorer=scorer)
+    agent = JobAgent(db=db)
     return db, recommender, scorer, agent
 
 def main():
@@ -35,12 +40,15 @@ def main():
         st.title("JobLo Assistant 🤖")
         page = st.selectbox(
             "Navigation",
-            ["Job Search", "Job Scoring", "Job Details", "Chat Assistant"]
+            ["Job Search", "Job Scoring", "Job Details", "Market Stats", "Chat Assistant"]
         )
         
         st.markdown("---")
         st.markdown("### About")
         st.markdown("JobLo is an intelligent job assistant that helps you find and match jobs based on your profile.")
+        
+        with st.expander("Database pool"):
+            st.json(db.pool_stats())
     
     # Main content
     if page == "Job Search":
@@ -49,6 +57,8 @@ def main():
         show_job_scoring(db, scorer)
     elif page == "Job Details":
         show_job_details(db, recommender)
+    elif page == "Market Stats":
+        show_market_stats(db)
     elif page == "Chat Assistant":
         show_chat_assistant(agent)
 
@@ -62,43 +72,69 @@ def show_job_search(db):
         location = st.text_input("Location", "Bangalore")
     with col3:
         source_filter = st.selectbox("Source", ["All", "Naukri", "LinkedIn"])
+    search_archive = st.checkbox("Search archived (expired) jobs instead")
     
     if st.button("Search Jobs"):
-        with st.spinner("Searching jobs..."):
-            query = {}
-            if search_query:
-                query["$text"] = {"$search": search_query}
-            if location and location.lower() != "all":
-                query["location"] = {"$regex": location, "$options": "i"}
-            if source_filter != "All":
-                query["source"] = source_filter.lower()
-            
-            jobs = db.find_jobs(query, limit=20)
-            
-            if jobs:
-                st.success(f"Found {len(jobs)} jobs")
+        st.session_state['job_search'] = {
+            "query": search_query,
+            "location": location,
+            "source": source_filter,
+            "archived": search_archive
+        }
+        # One cursor per visited page; None is the first page
+        st.session_state['job_search_cursors'] = [None]
+    
+    search = st.session_state.get('job_search')
+    if not search:
+        return
+    cursors = st.session_state['job_search_cursors']
+    
+    with st.spinner("Searching jobs..."):
+        query = build_job_filter(query=search["query"], location=search["location"],
+                                 source=search["source"])
+        
+        if search.get("archived"):
+            # Archived jobs are queried on demand and are not paged
+            page = {"jobs": db.find_archived_jobs(query, limit=JOB_SEARCH_PAGE_SIZE), "next_cursor": None}
+        else:
+            order = ORDER_BY_RELEVANCE if search["query"] else ORDER_BY_DATE
+            page = db.find_jobs_page(query, page_size=JOB_SEARCH_PAGE_SIZE, cursor=cursors[-1], order=order)
+    
+    jobs = page["jobs"]
+    if jobs:
+        st.success(f"Showing {len(jobs)} jobs (page {len(cursors)})")
+        
+        for job in jobs:
+            with st.expander(f"{job['title']} at {job['company']}"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**Location:** {job['location']}")
+                    st.write(f"**Experience:** {job['experience']}")
+                    st.write(f"**Source:** {job['source']}")
+                with col2:
+                    if job.get('skills'):
+                        st.write(f"**Skills:** {', '.join(job['skills'][:5])}")
+                    if job.get('salary'):
+                        st.write(f"**Salary:** {job['salary']}")
                 
-                for job in jobs:
-                    with st.expander(f"{job['title']} at {job['company']}"):
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write(f"**Location:** {job['location']}")
-                            st.write(f"**Experience:** {job['experience']}")
-                            st.write(f"**Source:** {job['source']}")
-                        with col2:
-                            if job.get('skills'):
-                                st.write(f"**Skills:** {', '.join(job['skills'][:5])}")
-                            if job.get('salary'):
-                                st.write(f"**Salary:** {job['salary']}")
-                        
-                        st.write(f"**Description:** {job['job_description'][:200]}...")
-                        st.write(f"[View Full Job]({job['url']})")
-                        
-                        if st.button(f"View Details", key=f"detail_{job['_id']}"):
-                            st.session_state['selected_job_id'] = str(job['_id'])
-                            st.rerun()
-            else:
-                st.warning("No jobs found matching your criteria")
+                st.write(f"**Description:** {job['job_description'][:200]}...")
+                st.write(f"[View Full Job]({job['url']})")
+                
+                if not search.get("archived") and st.button(f"View Details", key=f"detail_{job['_id']}"):
+                    st.session_state['selected_job_id'] = str(job['_id'])
+                    st.rerun()
+        
+        col_prev, col_next = st.columns(2)
+        with col_prev:
+            if len(cursors) > 1 and st.button("← Previous page"):
+                cursors.pop()
+                st.rerun()
+        with col_next:
+            if page["next_cursor"] and st.button("Next page →"):
+                cursors.append(page["next_cursor"])
+                st.rerun()
+    else:
+        st.warning("No jobs found matching your criteria")
 
 def show_job_scoring(db, scorer):
     st.title("Job Scoring Engine 📊")
@@ -270,6 +306,48 @@ def show_job_details(db, recommender):
         import os
         os.unlink(tmp_path)
 
+def show_market_stats(db):
+    st.title("Market Statistics 📊")
+    
+    stats = JobStats(db)
+    summary = stats.summary(limit=15)
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Jobs", summary["total"])
+    for col, (source, count) in zip([col2, col3], sorted(summary["by_source"].items())):
+        col.metric(source.title(), count)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Top Cities")
+        st.bar_chart(pd.Series(summary["top_cities"], name="Jobs"))
+    with col2:
+        st.subheader("Top Skills")
+        st.bar_chart(pd.Series(summary["top_skills"], name="Jobs"))
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Experience Required")
+        st.bar_chart(pd.Series(summary["by_experience"], name="Jobs"))
+    with col2:
+        st.subheader("Postings per Week")
+        st.line_chart(pd.Series(summary["by_week"], name="Jobs"))
+    
+    st.subheader("Count Jobs")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        skill = st.text_input("Skill", "Python")
+    with col2:
+        city = st.text_input("City", "Pune")
+    with col3:
+        source = st.selectbox("Source", ["All", "Naukri", "LinkedIn"], key="stats_source")
+    
+    st.write(f"**Matching jobs:** {stats.count(skill=skill, city=city, source=source)}")
+    if source == "All":
+        by_source = stats.count_by_source(skill=skill, city=city)
+        if by_source:
+            st.table(pd.DataFrame(sorted(by_source.items()), columns=["Source", "Jobs"]))
+
 def show_chat_assistant(agent):
     st.title("JobLo Chat Assistant 💬")
     